@@ -1,7 +1,6 @@
 """Main entry point."""
 
-from pub_analyzer.main import PubAnalyzerApp
+from pub_analyzer.main import run
 
 if __name__ == "__main__":
-    app = PubAnalyzerApp()
-    app.run()
+    run()
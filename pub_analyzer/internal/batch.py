@@ -0,0 +1,622 @@
+"""Headless generation of many reports."""
+
+import argparse
+import asyncio
+import contextlib
+import csv
+import datetime
+import functools
+import multiprocessing
+import pathlib
+import sys
+import tempfile
+import time
+from collections.abc import AsyncIterator, Awaitable, Callable, Iterator, Sequence
+from concurrent.futures import ProcessPoolExecutor
+from enum import Enum
+from typing import TextIO, TypeVar
+
+from pydantic import BaseModel, ConfigDict, Field, ValidationError
+from rich.console import Console
+from rich.table import Table
+from textual import log
+
+from pub_analyzer.internal.cache import DEFAULT_MAX_SIZE, ResponseCache, get_default_cache
+from pub_analyzer.internal.checkpoint import get_default_checkpoint_dir
+from pub_analyzer.internal.limiter import FileRateLimiter, RateLimiter
+from pub_analyzer.internal.progress import log_progress
+from pub_analyzer.internal.render import render_report
+from pub_analyzer.internal.report import (
+    FromDate,
+    PublicationDates,
+    ReportEvent,
+    ReportFinished,
+    ReportSession,
+    ReportT,
+    ToDate,
+    finish_report,
+    get_rate_limiter,
+    merge_reports,
+)
+from pub_analyzer.models.report import AuthorReport, InstitutionReport
+
+MAX_CONCURRENT_REPORTS = 4
+"""Reports made at the same time by default. All of them share the rate limiter."""
+
+EXIT_OK = 0
+"""Exit code when every report was made."""
+EXIT_FAILED = 1
+"""Exit code when at least one report failed."""
+EXIT_INVALID_INPUT = 2
+"""Exit code when the batch file can not be read."""
+
+T = TypeVar("T")
+
+
+class EntityType(Enum):
+    """Entity of a batch report."""
+
+    AUTHOR = "author"
+    INSTITUTION = "institution"
+
+
+class OutputFormat(Enum):
+    """Output file formats of a batch report."""
+
+    JSON = "json"
+    PDF = "pdf"
+
+
+class BatchJob(BaseModel):
+    """Report to be made, read from a row of the batch file."""
+
+    model_config = ConfigDict(extra="forbid")
+
+    entity: EntityType
+    id: str
+    """OpenAlex ID or URL of the author or institution."""
+    pub_from_date: datetime.datetime | None = None
+    pub_to_date: datetime.datetime | None = None
+    cited_from_date: datetime.datetime | None = None
+    cited_to_date: datetime.datetime | None = None
+    name: str | None = None
+    """Name of the output files, without extension. Defaults to the entity and its ID."""
+    shards: int = Field(default=1, ge=1)
+    """Publication date ranges an institution report is split into, made at the same time and merged."""
+
+    @property
+    def key(self) -> str:
+        """OpenAlex key of the entity."""
+        return self.id.rstrip("/").rpartition("/")[2]
+
+    @property
+    def output_name(self) -> str:
+        """Name of the output files, without extension."""
+        return self.name or f"{self.entity.value}-{self.key}"
+
+
+class BatchResult(BaseModel):
+    """Outcome of a batch report."""
+
+    job: BatchJob
+    display_name: str | None = None
+    works_count: int | None = None
+    elapsed: datetime.timedelta
+    outputs: list[pathlib.Path] = []
+    warnings: list[str] = []
+    error: str | None = None
+    """Why the report failed, if it did."""
+
+
+def read_batch_file(path: pathlib.Path) -> list[BatchJob]:
+    """Read the reports to be made from a CSV file.
+
+    The file has a header row with the `BatchJob` fields. Only `entity` and `id` are required, empty cells
+    are ignored and dates use the `YYYY-MM-DD` format. Unknown columns are rejected, so that a misspelled
+    filter does not make an unfiltered report.
+
+    Args:
+        path: CSV file.
+
+    Returns:
+        Reports to be made, in file order.
+
+    Raises:
+        ValueError: The header has unknown columns or a row is not valid.
+
+    Example:
+        ```text
+        entity,id,pub_from_date,pub_to_date,cited_from_date,cited_to_date,name,shards
+        author,A5015201707,2020-01-01,2023-12-31,,,,
+        institution,https://openalex.org/I8961855,,,,,uam,4
+        ```
+    """
+    jobs: list[BatchJob] = []
+    with open(path, newline="", encoding="utf-8") as file:
+        reader = csv.DictReader(file)
+        if unknown_fields := [field for field in reader.fieldnames or [] if field not in BatchJob.model_fields]:
+            raise ValueError(f"Unknown columns in {path}: {', '.join(unknown_fields)}. Valid columns: {', '.join(BatchJob.model_fields)}.")
+
+        for row in reader:
+            try:
+                jobs.append(BatchJob.model_validate({field: value.strip() for field, value in row.items() if field and value}))
+            except ValidationError as exc:
+                raise ValueError(f"Invalid row at line {reader.line_num} of {path}: {exc}") from exc
+
+    return jobs
+
+
+def _write_outputs(
+    report: AuthorReport | InstitutionReport, path: pathlib.Path, formats: Sequence[OutputFormat]
+) -> tuple[list[pathlib.Path], list[str]]:
+    """Write a report to files, one per format.
+
+    Args:
+        report: Report to be written.
+        path: Output path, without extension.
+        formats: Output file formats.
+
+    Returns:
+        Written files and warnings about the formats that were skipped.
+    """
+    outputs: list[pathlib.Path] = []
+    warnings: list[str] = []
+    for output_format in formats:
+        file_path = path.with_name(f"{path.name}.{output_format.value}")
+        match output_format:
+            case OutputFormat.JSON:
+                with open(file_path, mode="w", encoding="utf-8") as file:
+                    file.write(report.model_dump_json(indent=2, by_alias=True))
+            case OutputFormat.PDF:
+                if isinstance(report, InstitutionReport):
+                    warnings.append("PDF is not available for institution reports.")
+                    continue
+                render_report(report=report, file_path=file_path)
+        outputs.append(file_path)
+
+    return outputs, warnings
+
+
+def _get_publication_dates(job: BatchJob) -> PublicationDates:
+    """Publication date filters of a batch report."""
+    return (FromDate(job.pub_from_date) if job.pub_from_date else None, ToDate(job.pub_to_date) if job.pub_to_date else None)
+
+
+async def _finish_job_report(
+    job: BatchJob,
+    report_stream: AsyncIterator[ReportEvent | ReportFinished[ReportT]],
+    progress_file: TextIO | None,
+    shard: str | None = None,
+) -> ReportT:
+    """Consume the report stream of a batch report, logging its progress if a progress file is given."""
+    if progress_file is not None:
+        labels = {"entity": job.entity.value, "id": job.key} | ({"shard": shard} if shard else {})
+        report_stream = log_progress(report_stream, progress_file, labels=labels)
+    return await finish_report(report_stream)
+
+
+async def _make_institution_shard(
+    job: BatchJob,
+    session: ReportSession,
+    progress_file: TextIO | None,
+    publication_dates: PublicationDates,
+    shard: str,
+) -> InstitutionReport:
+    """Make the report of an institution restricted to a range of publication dates."""
+    institution = await session.get_institution(job.key)
+    pub_from_date, pub_to_date = publication_dates
+    report_stream = session.stream_institution_report(
+        institution,
+        pub_from_date=pub_from_date,
+        pub_to_date=pub_to_date,
+        cited_from_date=FromDate(job.cited_from_date) if job.cited_from_date else None,
+        cited_to_date=ToDate(job.cited_to_date) if job.cited_to_date else None,
+    )
+    return await _finish_job_report(job, report_stream, progress_file, shard)
+
+
+async def _plan_job_shards(job: BatchJob, session: ReportSession) -> list[PublicationDates]:
+    """Publication date ranges of the shards of a batch report."""
+    if job.entity is not EntityType.INSTITUTION or job.shards <= 1:
+        return [_get_publication_dates(job)]
+
+    institution = await session.get_institution(job.key)
+    return await session.plan_institution_shards(institution, job.shards, None, *_get_publication_dates(job))
+
+
+async def _make_job_report(job: BatchJob, session: ReportSession, progress_file: TextIO | None) -> AuthorReport | InstitutionReport:
+    """Make a batch report, with its shards made concurrently and merged."""
+    pub_from_date, pub_to_date = _get_publication_dates(job)
+    cited_from_date = FromDate(job.cited_from_date) if job.cited_from_date else None
+    cited_to_date = ToDate(job.cited_to_date) if job.cited_to_date else None
+
+    match job.entity:
+        case EntityType.AUTHOR:
+            author = await session.get_author(job.key)
+            author_stream = session.stream_author_report(
+                author, pub_from_date=pub_from_date, pub_to_date=pub_to_date, cited_from_date=cited_from_date, cited_to_date=cited_to_date
+            )
+            return await _finish_job_report(job, author_stream, progress_file)
+        case EntityType.INSTITUTION:
+            shards = await _plan_job_shards(job, session)
+            reports = await asyncio.gather(
+                *(
+                    _make_institution_shard(job, session, progress_file, publication_dates, f"{idx}/{len(shards)}")
+                    for idx, publication_dates in enumerate(shards, start=1)
+                )
+            )
+            return reports[0] if len(reports) == 1 else merge_reports(reports)
+
+
+async def _write_result(
+    job: BatchJob, report: AuthorReport | InstitutionReport, start: float, output_dir: pathlib.Path, formats: Sequence[OutputFormat]
+) -> BatchResult:
+    """Write the output files of a batch report."""
+    outputs, warnings = await asyncio.to_thread(_write_outputs, report, output_dir / job.output_name, formats)
+    return BatchResult(
+        job=job,
+        display_name=report.author.display_name if isinstance(report, AuthorReport) else report.institution.display_name,
+        works_count=len(report.works),
+        elapsed=datetime.timedelta(seconds=round(time.monotonic() - start)),
+        outputs=outputs,
+        warnings=warnings,
+    )
+
+
+def _failed_result(job: BatchJob, start: float, exc: Exception) -> BatchResult:
+    """Result of a failed batch report."""
+    log.error(f"Report of {job.entity.value} {job.key} failed: {exc!r}")
+    return BatchResult(job=job, elapsed=datetime.timedelta(seconds=round(time.monotonic() - start)), error=str(exc) or repr(exc))
+
+
+async def _run_job(
+    job: BatchJob, session: ReportSession, output_dir: pathlib.Path, formats: Sequence[OutputFormat], progress_file: TextIO | None
+) -> BatchResult:
+    """Make a batch report and write its output files. Failures are reported in the result."""
+    start = time.monotonic()
+    try:
+        report = await _make_job_report(job, session, progress_file)
+        return await _write_result(job, report, start, output_dir, formats)
+    except Exception as exc:
+        return _failed_result(job, start, exc)
+
+
+class _WorkerSettings(BaseModel):
+    """Settings of the worker processes of a batch, which can not share the objects of the main process."""
+
+    cache_path: pathlib.Path | None
+    cache_max_size: int
+    cache_refresh: bool
+    limiter_path: pathlib.Path
+    rate: float
+    per_second: float
+    checkpoint_dir: pathlib.Path | None
+    progress_path: str | None
+    """Progress file, `-` for stderr."""
+
+
+@contextlib.asynccontextmanager
+async def _open_worker_session(settings: _WorkerSettings) -> AsyncIterator[tuple[ReportSession, TextIO | None]]:
+    """Open the session and the progress file of a worker process."""
+    cache = ResponseCache(settings.cache_path, settings.cache_max_size, settings.cache_refresh) if settings.cache_path else None
+    limiter = FileRateLimiter(settings.limiter_path, settings.rate, settings.per_second)
+    try:
+        async with ReportSession(cache, limiter, settings.checkpoint_dir) as session:
+            with _open_progress_file(pathlib.Path(settings.progress_path) if settings.progress_path else None) as progress_file:
+                yield session, progress_file
+    finally:
+        if cache is not None:
+            cache.close()
+
+
+def _run_in_worker(make_report: Callable[[ReportSession, TextIO | None], Awaitable[T]], settings: _WorkerSettings) -> T:
+    """Make a report in a worker process.
+
+    Raises:
+        RuntimeError: The report failed. Errors are converted because not all of them can be sent between processes.
+    """
+
+    async def _make_report() -> T:
+        async with _open_worker_session(settings) as (session, progress_file):
+            return await make_report(session, progress_file)
+
+    try:
+        return asyncio.run(_make_report())
+    except Exception as exc:
+        raise RuntimeError(str(exc) or repr(exc)) from None
+
+
+def _make_job_report_in_worker(job: BatchJob, settings: _WorkerSettings) -> AuthorReport | InstitutionReport:
+    """Make a batch report, without shards, in a worker process."""
+    return _run_in_worker(functools.partial(_make_job_report, job), settings)
+
+
+def _make_institution_shard_in_worker(
+    job: BatchJob, publication_dates: PublicationDates, shard: str, settings: _WorkerSettings
+) -> InstitutionReport:
+    """Make a shard of an institution batch report in a worker process."""
+
+    async def _make_shard(session: ReportSession, progress_file: TextIO | None) -> InstitutionReport:
+        return await _make_institution_shard(job, session, progress_file, publication_dates, shard)
+
+    return _run_in_worker(_make_shard, settings)
+
+
+def _get_progress_path(progress_file: TextIO | None) -> str | None:
+    """Path of the progress file, to be opened again by the worker processes."""
+    if progress_file is None:
+        return None
+    if progress_file is sys.stderr:
+        return "-"
+    if isinstance(progress_file.name, str) and pathlib.Path(progress_file.name).is_file():
+        progress_file.flush()
+        return progress_file.name
+
+    log.warning("The progress is not logged by worker processes, the progress file has no path.")
+    return None
+
+
+async def _run_batch_in_processes(
+    jobs: Sequence[BatchJob],
+    output_dir: pathlib.Path,
+    formats: Sequence[OutputFormat],
+    concurrency: int,
+    processes: int,
+    cache: ResponseCache | None,
+    limiter: RateLimiter,
+    checkpoint_dir: pathlib.Path | None,
+    progress_file: TextIO | None,
+) -> list[BatchResult]:
+    """Make the reports, and the shards of the institution reports, in a pool of worker processes.
+
+    At most `concurrency` reports are in progress, and their reports or shards wait for a free worker.
+    """
+    with contextlib.ExitStack() as stack:
+        if isinstance(limiter, FileRateLimiter):
+            limiter_path = limiter.path
+        else:
+            limiter_path = pathlib.Path(stack.enter_context(tempfile.TemporaryDirectory())) / "openalex.limiter"
+            limiter = FileRateLimiter(limiter_path, limiter.rate, limiter.per)
+
+        settings = _WorkerSettings(
+            cache_path=cache.path if cache else None,
+            cache_max_size=cache.max_size if cache else DEFAULT_MAX_SIZE,
+            cache_refresh=cache.refresh if cache else False,
+            limiter_path=limiter_path,
+            rate=limiter.rate,
+            per_second=limiter.per,
+            checkpoint_dir=checkpoint_dir,
+            progress_path=_get_progress_path(progress_file),
+        )
+        pool = stack.enter_context(ProcessPoolExecutor(max_workers=processes, mp_context=multiprocessing.get_context("spawn")))
+        loop = asyncio.get_running_loop()
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async with ReportSession(cache, limiter, checkpoint_dir) as session:
+
+            async def _run_job_in_pool(job: BatchJob) -> BatchResult:
+                async with semaphore:
+                    return await _make_job_in_pool(job)
+
+            async def _make_job_in_pool(job: BatchJob) -> BatchResult:
+                start = time.monotonic()
+                try:
+                    shards = await _plan_job_shards(job, session)
+                    report: AuthorReport | InstitutionReport
+                    if len(shards) == 1:
+                        report = await loop.run_in_executor(pool, _make_job_report_in_worker, job, settings)
+                    else:
+                        reports = await asyncio.gather(
+                            *(
+                                loop.run_in_executor(
+                                    pool, _make_institution_shard_in_worker, job, publication_dates, f"{idx}/{len(shards)}", settings
+                                )
+                                for idx, publication_dates in enumerate(shards, start=1)
+                            )
+                        )
+                        report = merge_reports(reports)
+                    return await _write_result(job, report, start, output_dir, formats)
+                except Exception as exc:
+                    return _failed_result(job, start, exc)
+
+            return list(await asyncio.gather(*(_run_job_in_pool(job) for job in jobs)))
+
+
+async def run_batch(
+    jobs: Sequence[BatchJob],
+    output_dir: pathlib.Path,
+    formats: Sequence[OutputFormat] = (OutputFormat.JSON,),
+    concurrency: int = MAX_CONCURRENT_REPORTS,
+    cache: ResponseCache | None = None,
+    limiter: RateLimiter | None = None,
+    checkpoint_dir: pathlib.Path | None = None,
+    progress_file: TextIO | None = None,
+    processes: int = 1,
+) -> list[BatchResult]:
+    """Make many reports concurrently and write them to files.
+
+    The reports share one `ReportSession`, so the HTTP connections and the sources already retrieved are reused.
+    The shards of an institution report, ranges of its publication dates, are made concurrently and merged.
+    A failed report does not stop the others. Made again with the same checkpoint directory, failed reports
+    resume from their checkpoints.
+
+    With more than one process, the reports and the shards are parsed in a pool of worker processes, which is
+    faster when decoding and validating the works takes more time than waiting for the API. The workers share
+    the rate budget through a `FileRateLimiter` and the cache through its database.
+
+    Args:
+        jobs: Reports to be made.
+        output_dir: Directory where the output files are written. Created if it does not exist.
+        formats: Output file formats.
+        concurrency: Reports made at the same time. With worker processes, their reports or shards wait for a
+            free worker.
+        cache: Response cache shared by all the reports. Disabled by default.
+        limiter: Rate limiter shared by all the reports. Defaults to the process-wide OpenAlex limiter.
+        checkpoint_dir: Directory where the progress of each report is saved. Disabled by default.
+        progress_file: Text file where the progress of the reports is written as JSON lines.
+        processes: Worker processes. With one, the reports are made in the current process.
+
+    Returns:
+        Result of each report, in the same order as the jobs.
+
+    Raises:
+        ValueError: The concurrency or the number of processes is lower than one.
+
+    Example:
+        ```python
+        import pathlib
+
+        from pub_analyzer.internal.batch import read_batch_file, run_batch
+
+        jobs = read_batch_file(pathlib.Path("researchers.csv"))
+        results = await run_batch(jobs, output_dir=pathlib.Path("reports"))
+        ```
+    """
+    if concurrency < 1 or processes < 1:
+        raise ValueError("The concurrency and the number of processes must be at least one.")
+
+    output_dir.mkdir(parents=True, exist_ok=True)
+    limiter = limiter or get_rate_limiter()
+    if processes > 1:
+        return await _run_batch_in_processes(
+            jobs, output_dir, formats, concurrency, processes, cache, limiter, checkpoint_dir, progress_file
+        )
+
+    semaphore = asyncio.Semaphore(concurrency)
+    async with ReportSession(cache, limiter, checkpoint_dir) as session:
+
+        async def _bounded_job(job: BatchJob) -> BatchResult:
+            async with semaphore:
+                return await _run_job(job, session, output_dir, formats, progress_file)
+
+        return list(await asyncio.gather(*(_bounded_job(job) for job in jobs)))
+
+
+def make_summary_table(results: Sequence[BatchResult]) -> Table:
+    """Make a table with the outcome of each batch report.
+
+    Args:
+        results: Results of the batch reports.
+
+    Returns:
+        Rich table.
+    """
+    table = Table(title="Batch reports", title_justify="left")
+    table.add_column("Entity")
+    table.add_column("ID")
+    table.add_column("Name")
+    table.add_column("Works", justify="right")
+    table.add_column("Elapsed", justify="right")
+    table.add_column("Status")
+
+    for result in results:
+        if result.error is not None:
+            status = f"[red]Failed:[/red] {result.error}"
+        else:
+            status = " ".join(["[green]OK[/green]", *result.warnings])
+
+        table.add_row(
+            result.job.entity.value,
+            result.job.key,
+            result.display_name or "",
+            str(result.works_count) if result.works_count is not None else "",
+            str(result.elapsed),
+            status,
+        )
+
+    return table
+
+
+def _positive_int(value: str) -> int:
+    """Parse a command line argument that must be a positive integer.
+
+    Raises:
+        argparse.ArgumentTypeError: The value is not a positive integer.
+    """
+    try:
+        number = int(value)
+    except ValueError:
+        number = 0
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be a positive integer, not {value!r}")
+    return number
+
+
+def add_batch_arguments(parser: argparse.ArgumentParser) -> None:
+    """Add the arguments of the batch command to a parser.
+
+    Args:
+        parser: Parser of the batch command.
+    """
+    parser.add_argument("file", type=pathlib.Path, help="CSV file with the reports to be made.")
+    parser.add_argument("-o", "--output-dir", type=pathlib.Path, default=pathlib.Path("."), help="Directory of the output files.")
+    parser.add_argument(
+        "-f",
+        "--format",
+        dest="formats",
+        type=OutputFormat,
+        nargs="+",
+        metavar="FORMAT",
+        default=[OutputFormat.JSON],
+        help="Output file formats: json, pdf.",
+    )
+    parser.add_argument("-j", "--concurrency", type=_positive_int, default=MAX_CONCURRENT_REPORTS, help="Reports made at the same time.")
+    parser.add_argument("-p", "--processes", type=_positive_int, default=1, help="Worker processes that make the reports and their shards.")
+    parser.add_argument("--no-cache", action="store_true", help="Do not use the response cache.")
+    parser.add_argument("--no-checkpoint", action="store_true", help="Do not save the progress of the reports.")
+    parser.add_argument("--progress", type=pathlib.Path, help="File where the progress is written as JSON lines. Use - for stderr.")
+
+
+@contextlib.contextmanager
+def _open_progress_file(path: pathlib.Path | None) -> Iterator[TextIO | None]:
+    """Open the progress file of the batch command, if any."""
+    if path is None:
+        yield None
+    elif str(path) == "-":
+        yield sys.stderr
+    else:
+        with open(path, mode="a", encoding="utf-8") as file:
+            yield file
+
+
+def run_batch_command(args: argparse.Namespace) -> int:
+    """Run the batch command and print a summary table.
+
+    Args:
+        args: Parsed arguments of the batch command.
+
+    Returns:
+        Exit code: `EXIT_OK`, `EXIT_FAILED` or `EXIT_INVALID_INPUT`.
+    """
+    console = Console()
+    error_console = Console(stderr=True)
+
+    try:
+        jobs = read_batch_file(args.file)
+    except (OSError, ValueError) as exc:
+        error_console.print(f"[red]Error:[/red] {exc}")
+        return EXIT_INVALID_INPUT
+
+    cache = None if args.no_cache else get_default_cache()
+    checkpoint_dir = None if args.no_checkpoint else get_default_checkpoint_dir()
+    with _open_progress_file(args.progress) as progress_file:
+        results = asyncio.run(
+            run_batch(
+                jobs,
+                output_dir=args.output_dir,
+                formats=args.formats,
+                concurrency=args.concurrency,
+                processes=args.processes,
+                cache=cache,
+                checkpoint_dir=checkpoint_dir,
+                progress_file=progress_file,
+            )
+        )
+
+    console.print(make_summary_table(results))
+    failed_count = sum(result.error is not None for result in results)
+    if failed_count:
+        error_console.print(f"[red]{failed_count} of {len(results)} reports failed.[/red]")
+        return EXIT_FAILED
+
+    return EXIT_OK
@@ -0,0 +1,311 @@
+"""On-disk cache of OpenAlex API responses."""
+
+import datetime
+import functools
+import os
+import pathlib
+import sqlite3
+import sys
+import threading
+import time
+import zlib
+
+import httpx
+from textual import log
+
+from pub_analyzer.internal.singleflight import SingleFlight
+
+CACHE_TTL: dict[str, datetime.timedelta] = {
+    "autocomplete": datetime.timedelta(hours=1),
+    "authors": datetime.timedelta(days=1),
+    "institutions": datetime.timedelta(days=1),
+    "works": datetime.timedelta(days=1),
+    "sources": datetime.timedelta(days=7),
+}
+"""Time to live of the cached responses by endpoint class (first segment of the URL path)."""
+
+DEFAULT_TTL = datetime.timedelta(days=1)
+"""Time to live of the cached responses of endpoints not listed in `CACHE_TTL`."""
+
+DEFAULT_MAX_SIZE = 512 * 1024 * 1024
+"""Maximum size in bytes of the compressed responses stored in the cache."""
+
+SQLITE_TIMEOUT = 30.0
+"""Seconds to wait for the database while another process is writing to it."""
+
+_ENCODING_HEADERS = {"content-encoding", "content-length", "transfer-encoding"}
+_response_flights: SingleFlight[tuple[int, list[tuple[str, str]], bytes]] = SingleFlight()
+"""GET requests being sent by any `CacheTransport` of the process."""
+
+
+def normalize_url(url: str | httpx.URL) -> str:
+    """Normalize a URL so that equivalent requests share the same key.
+
+    Query parameters are sorted and the host is lowercased.
+
+    Args:
+        url: URL to normalize.
+
+    Returns:
+        Normalized URL.
+
+    Example:
+        ```python
+        from pub_analyzer.internal.cache import normalize_url
+
+        print(normalize_url("https://API.openalex.org/works?per-page=100&filter=cites:W1"))
+        # 'https://api.openalex.org/works?filter=cites%3AW1&per-page=100'
+        ```
+    """
+    url = httpx.URL(url)
+    params = sorted(url.params.multi_items())
+    return str(url.copy_with(host=url.host.lower(), params=params))
+
+
+def get_ttl(url: str | httpx.URL) -> datetime.timedelta:
+    """Get the time to live of a response given the URL of the request.
+
+    Args:
+        url: URL of the request.
+
+    Returns:
+        Time to live of the response.
+    """
+    endpoint = httpx.URL(url).path.strip("/").partition("/")[0]
+    return CACHE_TTL.get(endpoint, DEFAULT_TTL)
+
+
+def get_default_cache_dir() -> pathlib.Path:
+    """Get the user cache directory used by Pub Analyzer.
+
+    The location can be changed with the `PUB_ANALYZER_CACHE_DIR` environment variable.
+
+    Returns:
+        Path to the cache directory.
+    """
+    if cache_dir := os.environ.get("PUB_ANALYZER_CACHE_DIR"):
+        return pathlib.Path(cache_dir)
+
+    if sys.platform == "win32":
+        base_dir = pathlib.Path(os.environ.get("LOCALAPPDATA", pathlib.Path.home() / "AppData" / "Local"))
+    elif sys.platform == "darwin":
+        base_dir = pathlib.Path.home() / "Library" / "Caches"
+    else:
+        base_dir = pathlib.Path(os.environ.get("XDG_CACHE_HOME", pathlib.Path.home() / ".cache"))
+
+    return base_dir / "pub-analyzer"
+
+
+class ResponseCache:
+    """SQLite cache of successful OpenAlex API responses.
+
+    Responses expire according to `CACHE_TTL` and the least recently used ones are evicted once the
+    stored size exceeds `max_size`. The same database can be used by several processes at once.
+
+    Example:
+        ```python
+        import pathlib
+
+        from pub_analyzer.internal.cache import ResponseCache
+
+        cache = ResponseCache(path=pathlib.Path("cache.sqlite3"))
+        cache.set("https://api.openalex.org/sources/S1", b'{"id": "https://openalex.org/S1"}')
+        print(cache.get("https://api.openalex.org/sources/S1"))
+        # b'{"id": "https://openalex.org/S1"}'
+        ```
+    """
+
+    def __init__(self, path: pathlib.Path | None = None, max_size: int = DEFAULT_MAX_SIZE, refresh: bool = False) -> None:
+        """Create a cache.
+
+        Args:
+            path: SQLite database file. Defaults to `responses.sqlite3` in the user cache directory.
+            max_size: Maximum size in bytes of the stored responses.
+            refresh: Ignore stored responses and replace them with fresh ones.
+        """
+        self.path = path or get_default_cache_dir() / "responses.sqlite3"
+        self.max_size = max_size
+        self.refresh = refresh
+
+        self._connection: sqlite3.Connection | None = None
+        self._lock = threading.Lock()
+        self._size = 0
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open the database on first use."""
+        if self._connection is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._connection = sqlite3.connect(self.path, timeout=SQLITE_TIMEOUT, check_same_thread=False, isolation_level=None)
+            self._connection.execute("PRAGMA journal_mode=WAL")
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS responses "
+                "(url TEXT PRIMARY KEY, content BLOB NOT NULL, size INTEGER NOT NULL, expires_at REAL NOT NULL, accessed_at REAL NOT NULL)"
+            )
+            self._connection.execute("CREATE INDEX IF NOT EXISTS responses_accessed_at ON responses (accessed_at)")
+            (self._size,) = self._connection.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()
+        return self._connection
+
+    def get(self, url: str | httpx.URL) -> bytes | None:
+        """Get a stored response.
+
+        Args:
+            url: URL of the request.
+
+        Returns:
+            Response content or None if it is not stored, it expired or the cache is refreshing.
+        """
+        if self.refresh:
+            return None
+
+        key = normalize_url(url)
+        now = time.time()
+        with self._lock:
+            connection = self._connect()
+            row = connection.execute("SELECT content, expires_at FROM responses WHERE url = ?", (key,)).fetchone()
+            if row is None:
+                return None
+
+            content, expires_at = row
+            if expires_at < now:
+                self._delete(connection, key)
+                return None
+
+            connection.execute("UPDATE responses SET accessed_at = ? WHERE url = ?", (now, key))
+
+        return zlib.decompress(content)
+
+    def set(self, url: str | httpx.URL, content: bytes) -> None:
+        """Store a response and evict the least recently used ones if the cache is full.
+
+        Args:
+            url: URL of the request.
+            content: Response content.
+        """
+        key = normalize_url(url)
+        compressed = zlib.compress(content)
+        now = time.time()
+        expires_at = now + get_ttl(url).total_seconds()
+
+        with self._lock:
+            connection = self._connect()
+            self._delete(connection, key)
+            connection.execute(
+                "INSERT INTO responses (url, content, size, expires_at, accessed_at) VALUES (?, ?, ?, ?, ?)",
+                (key, compressed, len(compressed), expires_at, now),
+            )
+            self._size += len(compressed)
+
+            if self._size > self.max_size:
+                self._evict(connection)
+
+    def _delete(self, connection: sqlite3.Connection, key: str) -> None:
+        """Delete a stored response, if any."""
+        row = connection.execute("SELECT size FROM responses WHERE url = ?", (key,)).fetchone()
+        if row is not None:
+            connection.execute("DELETE FROM responses WHERE url = ?", (key,))
+            self._size -= row[0]
+
+    def _evict(self, connection: sqlite3.Connection) -> None:
+        """Delete expired responses and the least recently used ones until the cache fits in `max_size`."""
+        connection.execute("DELETE FROM responses WHERE expires_at < ?", (time.time(),))
+        (self._size,) = connection.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()
+
+        evicted: list[tuple[str]] = []
+        for url, size in connection.execute("SELECT url, size FROM responses ORDER BY accessed_at").fetchall():
+            if self._size <= self.max_size:
+                break
+            evicted.append((url,))
+            self._size -= size
+
+        connection.executemany("DELETE FROM responses WHERE url = ?", evicted)
+        log.info(f"Evicted {len(evicted)} cached responses.")
+
+    def clear(self) -> None:
+        """Delete all the stored responses."""
+        with self._lock:
+            self._connect().execute("DELETE FROM responses")
+            self._size = 0
+
+    def close(self) -> None:
+        """Close the database."""
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
+
+
+@functools.cache
+def get_default_cache() -> ResponseCache | None:
+    """Get the process-wide response cache.
+
+    The cache can be bypassed with the `PUB_ANALYZER_NO_CACHE` environment variable and refreshed
+    with the `PUB_ANALYZER_REFRESH_CACHE` environment variable.
+
+    Returns:
+        Shared response cache or None if caching is disabled.
+    """
+    if os.environ.get("PUB_ANALYZER_NO_CACHE"):
+        return None
+
+    return ResponseCache(refresh=bool(os.environ.get("PUB_ANALYZER_REFRESH_CACHE")))
+
+
+class CacheTransport(httpx.AsyncBaseTransport):
+    """HTTPX transport that serves GET requests from a `ResponseCache`.
+
+    Requests sent with the `Cache-Control: no-cache` header skip the stored response. Concurrent GET requests
+    of the same URL share a single request.
+
+    Example:
+        ```python
+        import httpx
+
+        from pub_analyzer.internal.cache import CacheTransport, get_default_cache
+
+        async with httpx.AsyncClient(transport=CacheTransport(get_default_cache())) as client:
+            response = await client.get("https://api.openalex.org/authors/A5015201707")
+        ```
+    """
+
+    def __init__(self, cache: ResponseCache | None, transport: httpx.AsyncBaseTransport | None = None, http2: bool = False) -> None:
+        """Wrap a transport with a response cache.
+
+        Args:
+            cache: Response cache. If None, requests are always sent.
+            transport: Transport used on cache misses. Defaults to a new `httpx.AsyncHTTPTransport`.
+            http2: Enable HTTP/2 on the default transport.
+        """
+        self.cache = cache
+        self._transport = transport or httpx.AsyncHTTPTransport(http2=http2)
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        """Send a request, or serve it from the cache."""
+        if request.method != "GET":
+            return await self._transport.handle_async_request(request)
+
+        if self.cache is not None and request.headers.get("Cache-Control") != "no-cache":
+            content = self.cache.get(request.url)
+            if content is not None:
+                return httpx.Response(httpx.codes.OK, headers={"Content-Type": "application/json"}, content=content, request=request)
+
+        status_code, headers, content = await _response_flights.do(normalize_url(request.url), lambda: self._fetch(request))
+        return httpx.Response(status_code, headers=headers, content=content, request=request)
+
+    async def _fetch(self, request: httpx.Request) -> tuple[int, list[tuple[str, str]], bytes]:
+        """Send a request and store the response if it is successful.
+
+        Returns:
+            Status code, headers and decoded content of the response.
+        """
+        response = await self._transport.handle_async_request(request)
+        content = await response.aread()
+        if self.cache is not None and response.status_code == httpx.codes.OK:
+            self.cache.set(request.url, content)
+
+        # The content is already decoded, so the encoding headers no longer apply.
+        headers = [(name, value) for name, value in response.headers.multi_items() if name.lower() not in _ENCODING_HEADERS]
+        return response.status_code, headers, content
+
+    async def aclose(self) -> None:
+        """Close the wrapped transport."""
+        await self._transport.aclose()
@@ -0,0 +1,175 @@
+"""Checkpoints of the report generation progress."""
+
+import datetime
+import hashlib
+import pathlib
+import time
+
+from pydantic import BaseModel, ValidationError
+from textual import log
+
+from pub_analyzer.internal.cache import get_default_cache_dir
+from pub_analyzer.models.source import Source
+from pub_analyzer.models.work import DehydratedWork, Work
+
+CHECKPOINT_MAX_AGE = datetime.timedelta(days=1)
+"""Checkpoints older than this are discarded, so that a resumed report does not mix stale and fresh data."""
+
+
+class CheckpointRecord(BaseModel):
+    """Progress saved in a single line of the checkpoint file."""
+
+    works: list[Work] | None = None
+    cited_by: dict[str, list[DehydratedWork]] | None = None
+    sources: list[Source] | None = None
+
+
+def is_checkpoint_expired(path: pathlib.Path) -> bool:
+    """Check if a checkpoint file is older than `CHECKPOINT_MAX_AGE`.
+
+    Args:
+        path: Checkpoint file.
+
+    Returns:
+        Whether the checkpoint must be discarded.
+    """
+    return time.time() - path.stat().st_mtime > CHECKPOINT_MAX_AGE.total_seconds()
+
+
+def remove_expired_checkpoints(checkpoint_dir: pathlib.Path) -> None:
+    """Delete the expired checkpoints of a directory, like the ones left by abandoned reports.
+
+    Args:
+        checkpoint_dir: Directory where checkpoints are stored.
+    """
+    for path in checkpoint_dir.glob("*.jsonl"):
+        try:
+            if is_checkpoint_expired(path):
+                path.unlink(missing_ok=True)
+                log.info(f"Discarded expired checkpoint: {path}")
+        except OSError:
+            log.warning(f"Could not discard checkpoint: {path}")
+
+
+def get_default_checkpoint_dir() -> pathlib.Path:
+    """Get the directory where Pub Analyzer stores checkpoints, inside the user cache directory.
+
+    Expired checkpoints are deleted from it, so that the ones of abandoned reports do not pile up.
+
+    Returns:
+        Path to the checkpoints directory.
+    """
+    checkpoint_dir = get_default_cache_dir() / "checkpoints"
+    remove_expired_checkpoints(checkpoint_dir)
+    return checkpoint_dir
+
+
+def get_checkpoint_path(checkpoint_dir: pathlib.Path, key: str) -> pathlib.Path:
+    """Get the checkpoint file of a report.
+
+    Args:
+        checkpoint_dir: Directory where checkpoints are stored.
+        key: Text that identifies the report, like the URL of its works and the citations filters.
+
+    Returns:
+        Path to the checkpoint file.
+    """
+    digest = hashlib.sha256(key.encode("utf-8")).hexdigest()[:32]
+    return checkpoint_dir / f"{digest}.jsonl"
+
+
+class ReportCheckpoint:
+    """Append-only JSON lines file with the progress of a report generation.
+
+    Every call to a `save_*` method appends one line, so progress is kept even if the process is killed.
+    A truncated last line is ignored on load. Summaries are not stored, as they are computed from the works.
+
+    Example:
+        ```python
+        import pathlib
+
+        from pub_analyzer.internal.checkpoint import ReportCheckpoint
+
+        checkpoint = ReportCheckpoint(path=pathlib.Path("report.jsonl"))
+        if checkpoint.works is None:
+            checkpoint.save_works(works)
+        ```
+    """
+
+    def __init__(self, path: pathlib.Path) -> None:
+        """Open a checkpoint, loading the progress already saved in it.
+
+        Args:
+            path: Checkpoint file. Created on the first save.
+        """
+        self.path = path
+
+        self.works: list[Work] | None = None
+        self.cited_by: dict[str, list[DehydratedWork]] = {}
+        self.sources: list[Source] = []
+
+        self._load()
+
+    def _load(self) -> None:
+        """Read the saved progress, discarding checkpoints that are too old."""
+        if not self.path.exists():
+            return
+
+        if is_checkpoint_expired(self.path):
+            log.info(f"Discarded expired checkpoint: {self.path}")
+            self.remove()
+            return
+
+        with open(self.path, encoding="utf-8") as file:
+            for line in file:
+                try:
+                    record = CheckpointRecord.model_validate_json(line)
+                except ValidationError:
+                    log.warning(f"Discarded invalid checkpoint record: {self.path}")
+                    break
+
+                if record.works is not None:
+                    self.works = record.works
+                if record.cited_by is not None:
+                    self.cited_by.update(record.cited_by)
+                if record.sources is not None:
+                    self.sources.extend(record.sources)
+
+        log.info(f"Resuming from checkpoint: {len(self.cited_by)} works completed.")
+
+    def _append(self, record: CheckpointRecord) -> None:
+        """Append a record to the checkpoint file."""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.path, mode="a", encoding="utf-8") as file:
+            file.write(record.model_dump_json(by_alias=True, exclude_unset=True) + "\n")
+
+    def save_works(self, works: list[Work]) -> None:
+        """Save the works of the report entity.
+
+        Args:
+            works: Works of the report entity.
+        """
+        self.works = works
+        self._append(CheckpointRecord(works=works))
+
+    def save_cited_by(self, cited_by: dict[str, list[DehydratedWork]]) -> None:
+        """Save the citing works of completed works.
+
+        Args:
+            cited_by: Works that cite each completed work, by work OpenAlex key.
+        """
+        self.cited_by.update(cited_by)
+        self._append(CheckpointRecord(cited_by=cited_by))
+
+    def save_sources(self, sources: list[Source]) -> None:
+        """Save fetched sources.
+
+        Args:
+            sources: Sources full info.
+        """
+        self.sources.extend(sources)
+        self._append(CheckpointRecord(sources=sources))
+
+    def remove(self) -> None:
+        """Delete the checkpoint file once the report is done."""
+        self.path.unlink(missing_ok=True)
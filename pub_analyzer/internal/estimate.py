@@ -0,0 +1,141 @@
+"""Estimation of the cost of making a report before running it."""
+
+import datetime
+import math
+from collections.abc import Sequence
+
+from pydantic import BaseModel
+
+from pub_analyzer.internal.report import CITES_BATCH_SIZE, PER_PAGE_SIZE, SOURCES_BATCH_SIZE, get_rate_limiter
+from pub_analyzer.models.author import Author, AuthorYearCount
+from pub_analyzer.models.institution import Institution, InstitutionYearCount
+
+WORK_SIZE = 6_000
+"""Average bytes of a work of the report entity, as returned by the API."""
+CITING_WORK_SIZE = 1_500
+"""Average bytes of a citing work, which only includes the selected fields."""
+SOURCE_SIZE = 3_000
+"""Average bytes of a source."""
+
+
+class ReportEstimate(BaseModel):
+    """Predicted cost of making a report."""
+
+    works_count: int
+    """Works of the report entity."""
+    citations_count: int
+    """Citations of the works of the report entity."""
+    requests_count: int
+    """Requests to the OpenAlex API, at most."""
+    bytes_count: int
+    """Bytes downloaded from the OpenAlex API."""
+    duration: datetime.timedelta
+    """Wall time at the rate limit."""
+
+    def describe(self) -> str:
+        """Describe the estimate in a single line, with Rich markup."""
+        return (
+            f"[bold]Estimate:[/bold] {self.works_count} works, {self.citations_count} citations, "
+            f"{self.requests_count} requests, {self.bytes_count / 1_000_000:.1f} MB, {self.duration}"
+        )
+
+
+def _count_in_range(
+    counts: Sequence[tuple[int, int]],
+    total: int,
+    from_date: datetime.datetime | None = None,
+    to_date: datetime.datetime | None = None,
+) -> int:
+    """Count the items of the years in a date range.
+
+    The API only gives the counts of the last years. The remaining of the total is attributed to the years
+    before the oldest count, and kept if the range starts before it.
+
+    Args:
+        counts: Count of each year, as `(year, count)` pairs.
+        total: Count of all the years.
+        from_date: Start of the range.
+        to_date: End of the range.
+
+    Returns:
+        Count of the years in the range.
+    """
+    if from_date is None and to_date is None:
+        return total
+
+    from_year = from_date.year if from_date else None
+    to_year = to_date.year if to_date else None
+
+    in_range = sum(count for year, count in counts if (from_year is None or year >= from_year) and (to_year is None or year <= to_year))
+
+    oldest_year = min((year for year, _ in counts), default=None)
+    older = max(0, total - sum(count for _, count in counts))
+    if oldest_year is None or from_year is None or from_year < oldest_year:
+        in_range += older
+
+    return min(in_range, total)
+
+
+def estimate_report(
+    entity: Author | Institution,
+    pub_from_date: datetime.datetime | None = None,
+    pub_to_date: datetime.datetime | None = None,
+    cited_from_date: datetime.datetime | None = None,
+    cited_to_date: datetime.datetime | None = None,
+    rate: float | None = None,
+) -> ReportEstimate:
+    """Estimate the requests, bytes and time needed to make the report of an author or institution.
+
+    Works and citations are counted from the `counts_by_year` of the entity, restricted to the date ranges.
+    The citations of the works kept by the publication date range are assumed to be proportional to them.
+    Every work is assumed to be cited and published in a different source, so the estimate is an upper bound.
+
+    Args:
+        entity: Author or institution of the report.
+        pub_from_date: Filter works published from this date.
+        pub_to_date: Filter works published up to this date.
+        cited_from_date: Filter citing works published from this date.
+        cited_to_date: Filter citing works published up to this date.
+        rate: Requests per second. Defaults to the rate of the shared rate limiter.
+
+    Returns:
+        Report estimate.
+
+    Example:
+        ```python
+        from pub_analyzer.internal.estimate import estimate_report
+        from pub_analyzer.models.author import Author
+
+        author = Author(**kwargs)
+        estimate = estimate_report(author)
+        print(estimate.requests_count, estimate.duration)
+        ```
+    """
+    year_counts: Sequence[AuthorYearCount | InstitutionYearCount] = entity.counts_by_year
+    works_count = _count_in_range(
+        [(count.year, count.works_count) for count in year_counts], entity.works_count, pub_from_date, pub_to_date
+    )
+    cited_count = _count_in_range(
+        [(count.year, count.cited_by_count) for count in year_counts], entity.cited_by_count, cited_from_date, cited_to_date
+    )
+    works_ratio = works_count / entity.works_count if entity.works_count else 0.0
+    citations_count = round(cited_count * works_ratio)
+
+    cited_works_count = min(works_count, citations_count)
+    sources_count = works_count
+    requests_count = (
+        max(1, math.ceil(works_count / PER_PAGE_SIZE))
+        + math.ceil(cited_works_count / CITES_BATCH_SIZE)
+        + math.ceil(citations_count / PER_PAGE_SIZE)
+        + math.ceil(sources_count / SOURCES_BATCH_SIZE)
+    )
+    bytes_count = works_count * WORK_SIZE + citations_count * CITING_WORK_SIZE + sources_count * SOURCE_SIZE
+
+    rate = rate or get_rate_limiter().rate
+    return ReportEstimate(
+        works_count=works_count,
+        citations_count=citations_count,
+        requests_count=requests_count,
+        bytes_count=bytes_count,
+        duration=datetime.timedelta(seconds=round(requests_count / rate)),
+    )
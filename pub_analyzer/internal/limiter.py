@@ -1,34 +1,359 @@
 """Rate limiter module."""
 
 import asyncio
+import contextlib
+import json
+import pathlib
+import sys
+import threading
 import time
+from collections.abc import AsyncIterator, Callable, Iterator
+from enum import Enum
+from typing import IO
+
+import httpx
+from textual import log
+
+
+class RequestPriority(Enum):
+    """Priority lanes of the requests sharing a rate limiter."""
+
+    INTERACTIVE = "interactive"
+    """Requests a user is waiting for, like searches and summaries."""
+    BULK = "bulk"
+    """Background report traffic."""
 
 
 class RateLimiter:
-    """Rate limiter."""
+    """Rate limiter.
+
+    The token bucket is guarded by a thread lock and never awaits while holding it, so a single limiter can be
+    shared by every task, thread and event loop of the process.
 
-    def __init__(self, rate: int, per_second: float = 1.0) -> None:
+    Requests have a priority lane. Bulk requests do not take tokens while an interactive request is waiting, so
+    interactive requests always get the next token.
+    """
+
+    def __init__(self, rate: float, per_second: float = 1.0) -> None:
         self.rate = rate
         self.per = per_second
+        self.in_flight = 0
         self._tokens = float(rate)
-        self._updated_at = time.monotonic()
-        self._lock = asyncio.Lock()
-
-    async def acquire(self) -> None:
-        """Wait until new token is available."""
-        while True:
-            async with self._lock:
-                now = time.monotonic()
-                elapsed = now - self._updated_at
-                if elapsed > 0:
-                    self._tokens = min(self.rate, self._tokens + elapsed * (self.rate / self.per))
-                    self._updated_at = now
-
-                if self._tokens >= 1.0:
-                    self._tokens -= 1.0
-                    return
-
-                missing = 1.0 - self._tokens
-                wait_time = missing * (self.per / self.rate)
-
-            await asyncio.sleep(wait_time)
+        self._updated_at = self._now()
+        self._blocked_until = 0.0
+        self._interactive_waiting = 0
+        self._lock = threading.Lock()
+
+    @property
+    def capacity(self) -> float:
+        """Tokens the bucket can hold. At least one, so that rates below one request per period are not blocked."""
+        return max(1.0, self.rate)
+
+    def _now(self) -> float:
+        """Clock used by the token bucket."""
+        return time.monotonic()
+
+    @contextlib.contextmanager
+    def _synchronized(self) -> Iterator[None]:
+        """Guard the token bucket state."""
+        with self._lock:
+            yield
+
+    @contextlib.asynccontextmanager
+    async def request(self, priority: RequestPriority = RequestPriority.BULK) -> AsyncIterator[None]:
+        """Wait for a token and count the request as in flight until the block exits.
+
+        Args:
+            priority: Priority lane of the request.
+        """
+        await self.acquire(priority)
+        self.in_flight += 1
+        try:
+            yield
+        finally:
+            self.in_flight -= 1
+
+    def on_response(self, latency: float, throttled: bool) -> None:
+        """Feedback of a finished request. The fixed rate limiter ignores it.
+
+        Args:
+            latency: Seconds the request took.
+            throttled: The API answered with a throttling response.
+        """
+
+    def cool_down(self, seconds: float) -> None:
+        """Stop handing out tokens for a while, so that every task sharing the limiter backs off together.
+
+        Args:
+            seconds: Time to wait before the next request. An ongoing longer cool-down is kept.
+        """
+        with self._synchronized():
+            self._blocked_until = max(self._blocked_until, self._now() + seconds)
+            self._updated_at = self._blocked_until
+            self._tokens = 0.0
+
+    def _take_token(self, priority: RequestPriority = RequestPriority.BULK) -> float:
+        """Take a token if one is available.
+
+        Args:
+            priority: Priority lane of the request.
+
+        Returns:
+            Zero if a token was taken, otherwise the seconds to wait for the next one.
+        """
+        with self._synchronized():
+            now = self._now()
+            if now < self._blocked_until:
+                return self._blocked_until - now
+
+            if priority is RequestPriority.BULK and self._interactive_waiting:
+                return self.per / self.rate
+
+            elapsed = now - self._updated_at
+            if elapsed > 0:
+                self._tokens = min(self.capacity, self._tokens + elapsed * (self.rate / self.per))
+                self._updated_at = now
+
+            if self._tokens >= 1.0:
+                self._tokens -= 1.0
+                return 0.0
+
+            missing = 1.0 - self._tokens
+            return missing * (self.per / self.rate)
+
+    async def acquire(self, priority: RequestPriority = RequestPriority.BULK) -> None:
+        """Wait until new token is available.
+
+        Args:
+            priority: Priority lane of the request.
+        """
+        if priority is RequestPriority.BULK:
+            while (wait_time := self._take_token(priority)) > 0:
+                await asyncio.sleep(wait_time)
+            return
+
+        with self._lock:
+            self._interactive_waiting += 1
+        try:
+            while (wait_time := self._take_token(priority)) > 0:
+                await asyncio.sleep(wait_time)
+        finally:
+            with self._lock:
+                self._interactive_waiting -= 1
+
+
+class AdaptiveRateLimiter(RateLimiter):
+    """Rate limiter that adapts its rate to the API responses (additive increase, multiplicative decrease).
+
+    The rate grows by about `increase` requests per second every second while responses are healthy, and it is
+    multiplied by `decrease_factor` on throttling responses or when the latency jumps above `latency_factor`
+    times its moving average. Decreases are applied at most once per `decrease_interval`, so a burst of
+    concurrent failures counts as a single congestion signal.
+
+    Example:
+        ```python
+        from pub_analyzer.internal.limiter import AdaptiveRateLimiter
+
+        limiter = AdaptiveRateLimiter(rate=8, max_rate=50)
+        async with limiter.request():
+            ...
+        ```
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        min_rate: float = 1.0,
+        max_rate: float = 10.0,
+        increase: float = 1.0,
+        decrease_factor: float = 0.5,
+        latency_factor: float = 3.0,
+        decrease_interval: float = 1.0,
+    ) -> None:
+        """Create an adaptive rate limiter.
+
+        Args:
+            rate: Initial requests per second.
+            min_rate: Lowest requests per second.
+            max_rate: Highest requests per second, the limit allowed by the API.
+            increase: Requests per second added every second of healthy responses.
+            decrease_factor: Factor applied to the rate on a congestion signal.
+            latency_factor: Latency, relative to its moving average, considered a congestion signal.
+            decrease_interval: Minimum seconds between two decreases.
+        """
+        super().__init__(rate=min(max(rate, min_rate), max_rate), per_second=1.0)
+        self.min_rate = min_rate
+        self.max_rate = max_rate
+        self.increase = increase
+        self.decrease_factor = decrease_factor
+        self.latency_factor = latency_factor
+        self.decrease_interval = decrease_interval
+
+        self.latency_average: float | None = None
+        self._decreased_at = 0.0
+
+    def on_response(self, latency: float, throttled: bool) -> None:
+        """Update the rate given the feedback of a finished request.
+
+        Args:
+            latency: Seconds the request took.
+            throttled: The API answered with a throttling response.
+        """
+        latency_spike = self.latency_average is not None and latency > self.latency_factor * self.latency_average
+        self.latency_average = latency if self.latency_average is None else 0.9 * self.latency_average + 0.1 * latency
+
+        if throttled or latency_spike:
+            now = time.monotonic()
+            if now - self._decreased_at >= self.decrease_interval:
+                self._decreased_at = now
+                with self._synchronized():
+                    self.rate = max(self.min_rate, self.rate * self.decrease_factor)
+                    self._tokens = min(self._tokens, self.capacity)
+                log.info(f"Rate decreased to {self.rate:.2f} req/s ({self.in_flight} in flight).")
+            return
+
+        # One `increase` step is spread over the responses of one second at the current rate.
+        previous_rate = self.rate
+        with self._synchronized():
+            self.rate = min(self.max_rate, self.rate + self.increase / self.rate)
+        if int(self.rate) > int(previous_rate):
+            log.info(f"Rate increased to {self.rate:.2f} req/s ({self.in_flight} in flight).")
+
+
+@contextlib.contextmanager
+def _lock_file(file: IO[bytes]) -> Iterator[None]:
+    """Hold an exclusive lock on a file, blocking until other processes release it."""
+    file.seek(0)
+    if sys.platform == "win32":
+        import msvcrt
+
+        msvcrt.locking(file.fileno(), msvcrt.LK_LOCK, 1)
+        try:
+            yield
+        finally:
+            file.seek(0)
+            msvcrt.locking(file.fileno(), msvcrt.LK_UNLCK, 1)
+    else:
+        import fcntl
+
+        fcntl.flock(file.fileno(), fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(file.fileno(), fcntl.LOCK_UN)
+
+
+class FileRateLimiter(RateLimiter):
+    """Rate limiter whose token bucket is stored in a locked file, shared by all the processes of a host.
+
+    Every process that opens the same file draws from one combined budget. Cool-downs are shared as well.
+
+    Example:
+        ```python
+        import pathlib
+
+        from pub_analyzer.internal.limiter import FileRateLimiter
+
+        limiter = FileRateLimiter(path=pathlib.Path("/tmp/openalex.limiter"), rate=8)
+        await limiter.acquire()
+        ```
+    """
+
+    def __init__(self, path: pathlib.Path, rate: float, per_second: float = 1.0) -> None:
+        """Create a rate limiter backed by a file.
+
+        Args:
+            path: Token bucket file. Created on first use.
+            rate: Requests allowed per `per_second` by all the processes together.
+            per_second: Time window in seconds.
+        """
+        self.path = path
+        super().__init__(rate=rate, per_second=per_second)
+
+    def _now(self) -> float:
+        """Wall clock, comparable between processes."""
+        return time.time()
+
+    @contextlib.contextmanager
+    def _synchronized(self) -> Iterator[None]:
+        """Load the token bucket state from the locked file and store it back."""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with self._lock, open(self.path, mode="a+b") as file, _lock_file(file):
+            content = file.read()
+            if content:
+                state = json.loads(content)
+                self._tokens = min(self.capacity, state["tokens"])
+                self._updated_at = state["updated_at"]
+                self._blocked_until = state["blocked_until"]
+
+            yield
+
+            file.seek(0)
+            file.truncate()
+            file.write(json.dumps({"tokens": self._tokens, "updated_at": self._updated_at, "blocked_until": self._blocked_until}).encode())
+            file.flush()
+
+
+_shared_limiters: dict[str, RateLimiter] = {}
+_shared_limiters_lock = threading.Lock()
+
+
+def get_shared_limiter(name: str, factory: Callable[[], RateLimiter]) -> RateLimiter:
+    """Get the rate limiter shared by all the requests to an API in this process.
+
+    Args:
+        name: Name of the API.
+        factory: Creates the limiter the first time it is requested.
+
+    Returns:
+        Shared rate limiter.
+    """
+    with _shared_limiters_lock:
+        if name not in _shared_limiters:
+            _shared_limiters[name] = factory()
+        return _shared_limiters[name]
+
+
+class RateLimitedTransport(httpx.AsyncBaseTransport):
+    """HTTPX transport that waits for a rate limiter token before sending each request.
+
+    Example:
+        ```python
+        import httpx
+
+        from pub_analyzer.internal.limiter import RateLimitedTransport, RequestPriority
+        from pub_analyzer.internal.report import get_rate_limiter
+
+        transport = RateLimitedTransport(get_rate_limiter(), priority=RequestPriority.INTERACTIVE)
+        async with httpx.AsyncClient(transport=transport) as client:
+            response = await client.get("https://api.openalex.org/authors/A5015201707")
+        ```
+    """
+
+    def __init__(
+        self,
+        limiter: RateLimiter,
+        transport: httpx.AsyncBaseTransport | None = None,
+        http2: bool = False,
+        priority: RequestPriority = RequestPriority.BULK,
+    ) -> None:
+        """Wrap a transport with a rate limiter.
+
+        Args:
+            limiter: Rate limiter of the requests.
+            transport: Transport used to send the requests. Defaults to a new `httpx.AsyncHTTPTransport`.
+            http2: Enable HTTP/2 on the default transport.
+            priority: Priority lane of the requests.
+        """
+        self.limiter = limiter
+        self.priority = priority
+        self._transport = transport or httpx.AsyncHTTPTransport(http2=http2)
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        """Send a request once the limiter allows it."""
+        async with self.limiter.request(self.priority):
+            return await self._transport.handle_async_request(request)
+
+    async def aclose(self) -> None:
+        """Close the wrapped transport."""
+        await self._transport.aclose()
@@ -0,0 +1,180 @@
+"""Progress of the report generation."""
+
+import collections
+import datetime
+import json
+import time
+from collections.abc import AsyncIterator
+from enum import Enum
+from typing import TextIO, TypeVar
+
+from pydantic import BaseModel, ConfigDict
+
+THROUGHPUT_WINDOW = 10.0
+"""Seconds of recent requests used to compute the throughput."""
+
+EventT = TypeVar("EventT")
+
+
+class ReportPhase(Enum):
+    """Phases of the report generation, in order."""
+
+    WORKS = "works"
+    """Fetching the works of the report entity."""
+    CITATIONS = "citations"
+    """Fetching the works that cite each work."""
+    SOURCES = "sources"
+    """Fetching the sources of the works."""
+
+
+class RequestStats:
+    """Counters of the requests made for a report.
+
+    Example:
+        ```python
+        from pub_analyzer.internal.progress import RequestStats
+
+        stats = RequestStats()
+        stats.add_request(size=len(response.content))
+        print(stats.throughput())
+        ```
+    """
+
+    def __init__(self, window: float = THROUGHPUT_WINDOW) -> None:
+        """Create empty counters.
+
+        Args:
+            window: Seconds of recent requests used to compute the throughput.
+        """
+        self.window = window
+        self.requests_count = 0
+        self.cache_hits = 0
+        self.bytes_count = 0
+        self._requests_times: collections.deque[float] = collections.deque()
+        self._started_at = time.monotonic()
+
+    def add_request(self, size: int) -> None:
+        """Count a request sent to the API.
+
+        Args:
+            size: Bytes of the response body.
+        """
+        self.requests_count += 1
+        self.bytes_count += size
+        self._requests_times.append(time.monotonic())
+
+    def add_cache_hit(self) -> None:
+        """Count a page served from the cache."""
+        self.cache_hits += 1
+
+    def throughput(self) -> float:
+        """Requests per second over the last `window` seconds."""
+        now = time.monotonic()
+        while self._requests_times and self._requests_times[0] < now - self.window:
+            self._requests_times.popleft()
+
+        elapsed = min(self.window, now - self._started_at)
+        return len(self._requests_times) / elapsed if elapsed > 0 else 0.0
+
+
+class ReportProgress(BaseModel):
+    """Report event: progress of the report generation."""
+
+    model_config = ConfigDict(ser_json_timedelta="float")
+
+    phase: ReportPhase
+    done: int
+    """Items of the phase completed: works fetched, works with their citations or sources fetched."""
+    total: int | None
+    """Items of the phase, if known."""
+    requests_count: int
+    """Requests sent to the API so far, including retries."""
+    cache_hits: int
+    """Pages served from the cache so far."""
+    bytes_count: int
+    """Bytes downloaded so far."""
+    throughput: float
+    """Recent requests per second."""
+    elapsed: datetime.timedelta
+    """Time since the report started."""
+    eta: datetime.timedelta | None
+    """Estimated time left to complete the phase, at the pace of the phase so far."""
+
+
+class ProgressTracker:
+    """Build the progress events of a report from its request counters."""
+
+    def __init__(self, stats: RequestStats | None = None) -> None:
+        """Start tracking a report.
+
+        Args:
+            stats: Counters of the requests made for the report.
+        """
+        self.stats = stats or RequestStats()
+        self.phase: ReportPhase | None = None
+        self._started_at = time.monotonic()
+        self._phase_started_at = self._started_at
+
+    def update(self, phase: ReportPhase, done: int, total: int | None = None) -> ReportProgress:
+        """Get the progress of the report.
+
+        Args:
+            phase: Current phase.
+            done: Items of the phase completed.
+            total: Items of the phase, if known.
+
+        Returns:
+            Progress event.
+        """
+        now = time.monotonic()
+        if phase is not self.phase:
+            self.phase = phase
+            self._phase_started_at = now
+
+        eta = None
+        if total is not None and done > 0:
+            phase_elapsed = now - self._phase_started_at
+            eta = datetime.timedelta(seconds=round(phase_elapsed / done * max(0, total - done)))
+
+        return ReportProgress(
+            phase=phase,
+            done=done,
+            total=total,
+            requests_count=self.stats.requests_count,
+            cache_hits=self.stats.cache_hits,
+            bytes_count=self.stats.bytes_count,
+            throughput=self.stats.throughput(),
+            elapsed=datetime.timedelta(seconds=round(now - self._started_at)),
+            eta=eta,
+        )
+
+
+async def log_progress(events: AsyncIterator[EventT], file: TextIO, labels: dict[str, str] | None = None) -> AsyncIterator[EventT]:
+    """Write the progress events of a report stream to a file as JSON lines.
+
+    Every event is passed through, so the stream can still be consumed.
+
+    Args:
+        events: Report stream, like the one of `stream_author_report`.
+        file: Text file where the progress is written, one JSON object per line.
+        labels: Extra fields added to every line, to tell apart the reports logged to the same file.
+
+    Yields:
+        Events of the report stream.
+
+    Example:
+        ```python
+        import sys
+
+        from pub_analyzer.internal.progress import log_progress
+        from pub_analyzer.internal.report import stream_author_report
+
+        async for event in log_progress(stream_author_report(author), sys.stderr):
+            ...
+        ```
+    """
+    async for event in events:
+        if isinstance(event, ReportProgress):
+            file.write(json.dumps({**(labels or {}), **event.model_dump(mode="json")}) + "\n")
+            file.flush()
+        yield event
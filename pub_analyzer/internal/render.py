@@ -7,10 +7,10 @@ from importlib.metadata import version
 import typst
 from textual import log
 
-from pub_analyzer.models.report import AuthorReport, InstitutionReport
+from pub_analyzer.models.report import AuthorReport, GroupReport, InstitutionReport
 
 
-def render_report(report: AuthorReport | InstitutionReport, file_path: pathlib.Path | None) -> bytes | None:
+def render_report(report: AuthorReport | InstitutionReport | GroupReport, file_path: pathlib.Path | None) -> bytes | None:
     """Render report to PDF.
 
     Args:
@@ -26,7 +26,7 @@ def render_report(report: AuthorReport | InstitutionReport, file_path: pathlib.P
     if isinstance(report, AuthorReport):
         templates_path = pathlib.Path(__file__).parent.resolve().joinpath("templates")
         typst_file = templates_path / "author_report.typ"
-    if isinstance(report, InstitutionReport):
+    if isinstance(report, InstitutionReport | GroupReport):
         raise NotImplementedError
 
     sys_inputs = {"report": report.model_dump_json(by_alias=True), "version": version("pub-analyzer")}
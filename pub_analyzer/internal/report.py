@@ -1,15 +1,35 @@
 """Functions to make reports."""
 
+import asyncio
 import datetime
+import email.utils
+import json
 import math
-from typing import Any, NewType
+import os
+import pathlib
+import random
+import time
+import weakref
+from collections.abc import AsyncGenerator, AsyncIterator, Awaitable, Iterable, Mapping, Sequence
+from typing import Any, Generic, NewType, TypeVar, overload
 
 import httpx
-from pydantic import TypeAdapter
+from pydantic import BaseModel, TypeAdapter, ValidationError
 from textual import log
 
 from pub_analyzer.internal import identifier
-from pub_analyzer.internal.limiter import RateLimiter
+from pub_analyzer.internal.cache import CacheTransport, ResponseCache, get_default_cache, normalize_url
+from pub_analyzer.internal.checkpoint import ReportCheckpoint, get_checkpoint_path
+from pub_analyzer.internal.limiter import (
+    AdaptiveRateLimiter,
+    FileRateLimiter,
+    RateLimitedTransport,
+    RateLimiter,
+    RequestPriority,
+    get_shared_limiter,
+)
+from pub_analyzer.internal.progress import ProgressTracker, ReportPhase, ReportProgress, RequestStats
+from pub_analyzer.internal.singleflight import SingleFlight
 from pub_analyzer.models.author import Author, AuthorOpenAlexKey, AuthorResult, AuthorYearCount, DehydratedAuthor
 from pub_analyzer.models.institution import (
     DehydratedInstitution,
@@ -23,14 +43,17 @@ from pub_analyzer.models.report import (
     CitationReport,
     CitationSummary,
     CitationType,
+    GroupMemberReport,
+    GroupReport,
     InstitutionReport,
     OpenAccessSummary,
+    ReportQuery,
     SourcesSummary,
     WorkReport,
     WorkTypeCounter,
 )
 from pub_analyzer.models.source import DehydratedSource, Source
-from pub_analyzer.models.work import Authorship, Work
+from pub_analyzer.models.work import Authorship, DehydratedWork, Work
 
 FromDate = NewType("FromDate", datetime.datetime)
 """DateTime marker for works published from this date."""
@@ -39,8 +62,50 @@ ToDate = NewType("ToDate", datetime.datetime)
 """DateTime marker for works published up to this date."""
 
 REQUEST_RATE_PER_SECOND = 8
-"""The OpenAlex API requires a maximum of 10 requests per second. We limit this to 8 per second."""
+"""The OpenAlex API requires a maximum of 10 requests per second. We limit this to 8 per second.
+
+Deployments with a higher allowance (API key or polite pool) can raise the limit with the `PUB_ANALYZER_RATE_LIMIT`
+environment variable, and let the rate adapt up to it with `PUB_ANALYZER_ADAPTIVE_RATE`.
+"""
 PER_PAGE_SIZE = 100
+CURSOR_PAGINATION_THRESHOLD = 10_000
+"""OpenAlex basic paging only reaches the first 10,000 results. Bigger result sets are walked with cursor paging."""
+CITES_BATCH_SIZE = 50
+"""Number of works combined with OR in a single `cites:` filter. OpenAlex allows up to 100 values per filter."""
+CITES_BATCH_CITATIONS = CURSOR_PAGINATION_THRESHOLD
+"""Maximum citations of the works combined in a single `cites:` filter, so that batches use parallel paging."""
+SOURCES_BATCH_SIZE = 50
+"""Number of sources combined with OR in a single `openalex:` filter."""
+AUTHORS_BATCH_SIZE = 50
+"""Number of authors combined with OR in a single `author.id:` filter of a group report."""
+MAX_CONCURRENT_TASKS = 16
+"""Maximum number of fetch tasks running at the same time. The rate limiter still governs the request rate."""
+MAX_RETRIES = 5
+"""Number of times a request is retried after a throttling response, a server error or a connection error."""
+RETRY_BACKOFF_BASE = 1.0
+"""Base delay in seconds of the exponential backoff between retries."""
+RETRY_BACKOFF_MAX = 60.0
+"""Maximum delay in seconds between retries."""
+RETRY_STATUS_CODES = {
+    httpx.codes.TOO_MANY_REQUESTS,
+    httpx.codes.INTERNAL_SERVER_ERROR,
+    httpx.codes.BAD_GATEWAY,
+    httpx.codes.SERVICE_UNAVAILABLE,
+    httpx.codes.GATEWAY_TIMEOUT,
+}
+"""HTTP status codes of the responses that are retried."""
+THROTTLING_STATUS_CODES = {httpx.codes.TOO_MANY_REQUESTS, httpx.codes.SERVICE_UNAVAILABLE}
+"""HTTP status codes that make an adaptive rate limiter slow down."""
+
+T = TypeVar("T")
+WorkT = TypeVar("WorkT", bound=DehydratedWork)
+YearCountT = TypeVar("YearCountT", AuthorYearCount, InstitutionYearCount)
+ReportT = TypeVar("ReportT", AuthorReport, InstitutionReport, GroupReport)
+
+_page_flights: SingleFlight[bytes] = SingleFlight()
+"""Pages being requested by any report of the process."""
+_client_flights: "weakref.WeakKeyDictionary[httpx.AsyncClient, set[asyncio.Task[Any]]]" = weakref.WeakKeyDictionary()
+"""Page flights running on each client, which may be shared with reports of other clients."""
 
 
 def _get_author_profiles_keys(
@@ -160,338 +225,2725 @@ def _get_valid_works(works: list[dict[str, Any]]) -> list[dict[str, Any]]:
     return valid_works
 
 
-def _get_year_counter(
-    counts_by_year: list[AuthorYearCount] | list[InstitutionYearCount], work_publication_year: int
-) -> AuthorYearCount | InstitutionYearCount | None:
-    """Iterate over the counts_by_year and return the corresponding year counter."""
-    return next((year_counter for year_counter in counts_by_year if year_counter.year == work_publication_year), None)
+def create_rate_limiter() -> RateLimiter:
+    """Create a rate limiter for the OpenAlex API from the deployment configuration.
 
+    The maximum rate defaults to `REQUEST_RATE_PER_SECOND` and can be changed with the `PUB_ANALYZER_RATE_LIMIT`
+    environment variable.
 
-async def _get_works(client: httpx.AsyncClient, url: str, limiter: RateLimiter) -> list[Work]:
-    """Get all works given a URL.
+    - If `PUB_ANALYZER_RATE_LIMIT_FILE` is set, the token bucket is stored in that file, so that all the processes
+      of the host share a single budget.
+    - Otherwise, if `PUB_ANALYZER_ADAPTIVE_RATE` is set, the rate starts at `REQUEST_RATE_PER_SECOND` (or the
+      limit, if lower) and adapts to the API responses up to the limit.
+
+    Returns:
+        Fixed, file backed or adaptive rate limiter.
+
+    Raises:
+        ValueError: `PUB_ANALYZER_RATE_LIMIT` is not a positive number.
+    """
+    rate_limit = float(os.environ.get("PUB_ANALYZER_RATE_LIMIT", REQUEST_RATE_PER_SECOND))
+    if rate_limit <= 0:
+        raise ValueError(f"PUB_ANALYZER_RATE_LIMIT must be a positive number, got {rate_limit}.")
+
+    if limiter_file := os.environ.get("PUB_ANALYZER_RATE_LIMIT_FILE"):
+        return FileRateLimiter(path=pathlib.Path(limiter_file), rate=rate_limit, per_second=1.0)
+    if os.environ.get("PUB_ANALYZER_ADAPTIVE_RATE"):
+        return AdaptiveRateLimiter(rate=min(REQUEST_RATE_PER_SECOND, rate_limit), min_rate=min(1.0, rate_limit), max_rate=rate_limit)
+    return RateLimiter(rate=rate_limit, per_second=1.0)
+
+
+def get_rate_limiter() -> RateLimiter:
+    """Get the rate limiter shared by all the OpenAlex API requests of the process.
+
+    Reports running at the same time and the search widgets draw from this single budget.
+
+    Returns:
+        Shared rate limiter, created with `create_rate_limiter` on first use.
+    """
+    return get_shared_limiter("openalex", create_rate_limiter)
+
+
+def get_interactive_transport() -> httpx.AsyncBaseTransport:
+    """Get a transport for the requests a user is waiting for, like searches and summaries.
+
+    Responses are served from the default cache and misses take the interactive lane of the shared rate limiter,
+    ahead of the report traffic.
+
+    Returns:
+        HTTPX transport.
+    """
+    limited_transport = RateLimitedTransport(get_rate_limiter(), priority=RequestPriority.INTERACTIVE)
+    return CacheTransport(get_default_cache(), transport=limited_transport)
+
+
+async def _gather_bounded(coroutines: Iterable[Awaitable[T]], limit: int = MAX_CONCURRENT_TASKS) -> list[T]:
+    """Run awaitables concurrently with at most `limit` of them in flight.
+
+    Args:
+        coroutines: Awaitables to be run.
+        limit: Maximum number of awaitables running at the same time.
+
+    Returns:
+        Results in the same order as the given awaitables.
+
+    Raises:
+        Exception: The first exception raised by any awaitable. Pending ones are cancelled.
+    """
+    semaphore = asyncio.Semaphore(limit)
+
+    async def _bounded(coroutine: Awaitable[T]) -> T:
+        async with semaphore:
+            return await coroutine
+
+    tasks = [asyncio.ensure_future(_bounded(coroutine)) for coroutine in coroutines]
+    try:
+        return list(await asyncio.gather(*tasks))
+    except BaseException:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        raise
 
-    Iterate over all pages of the URL
+
+async def _iter_bounded(coroutines: Iterable[Awaitable[T]], limit: int = MAX_CONCURRENT_TASKS) -> AsyncGenerator[T, None]:
+    """Run awaitables concurrently with at most `limit` of them in flight, yielding results as they complete.
+
+    Args:
+        coroutines: Awaitables to be run.
+        limit: Maximum number of awaitables running at the same time.
+
+    Yields:
+        Results in completion order.
+
+    Raises:
+        Exception: The first exception raised by any awaitable. Pending ones are cancelled, as well as when the
+            iteration is closed early.
+    """
+    semaphore = asyncio.Semaphore(limit)
+
+    async def _bounded(coroutine: Awaitable[T]) -> T:
+        async with semaphore:
+            return await coroutine
+
+    tasks = [asyncio.ensure_future(_bounded(coroutine)) for coroutine in coroutines]
+    try:
+        for next_result in asyncio.as_completed(tasks):
+            yield await next_result
+    finally:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+
+def _get_retry_after(response: httpx.Response) -> float | None:
+    """Get the seconds to wait before retrying, from the `Retry-After` header of a response.
+
+    Args:
+        response: Throttling or server error response.
+
+    Returns:
+        Seconds to wait or None if the header is missing or invalid.
+    """
+    retry_after: str | None = response.headers.get("Retry-After")
+    if retry_after is None:
+        return None
+
+    try:
+        return max(0.0, float(retry_after))
+    except ValueError:
+        pass
+
+    try:
+        retry_at = email.utils.parsedate_to_datetime(retry_after)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, (retry_at - datetime.datetime.now(tz=datetime.timezone.utc)).total_seconds())
+
+
+def _get_backoff(attempt: int) -> float:
+    """Get an exponential backoff delay with full jitter.
+
+    Args:
+        attempt: Number of the failed attempt, starting at zero.
+
+    Returns:
+        Seconds to wait before the next attempt.
+    """
+    return random.uniform(0, min(RETRY_BACKOFF_MAX, RETRY_BACKOFF_BASE * 2**attempt))
+
+
+async def _send_request(client: httpx.AsyncClient, url: str, limiter: RateLimiter, stats: RequestStats | None = None) -> httpx.Response:
+    """Send a GET request, retrying throttling responses, server errors and connection errors.
+
+    Throttling responses (429, or any retried status with a `Retry-After` header) put the shared limiter into a
+    cool-down, so that all the tasks using it back off together. Other failures are retried by this task alone
+    with exponential backoff and jitter.
 
     Args:
         client: HTTPX asynchronous client to be used to make the requests.
-        url: URL of works with all filters and sorting applied.
+        url: URL of the request.
+        limiter: Rate limiter shared by all the requests.
+        stats: Counters of the requests made for the report.
+
+    Returns:
+        Last response received. It may still be an error response once `MAX_RETRIES` is reached.
+
+    Raises:
+        httpx.TransportError: The request failed with a connection error `MAX_RETRIES` times.
+    """
+    attempt = 0
+    while True:
+        try:
+            async with limiter.request():
+                start = time.monotonic()
+                response = await client.get(url=url, follow_redirects=True)
+        except (httpx.TimeoutException, httpx.NetworkError, httpx.RemoteProtocolError) as exc:
+            if attempt >= MAX_RETRIES:
+                raise
+            delay = _get_backoff(attempt)
+            log.warning(f"Retrying {url} in {delay:.2f}s [{attempt + 1}/{MAX_RETRIES}]: {exc!r}")
+            await asyncio.sleep(delay)
+            attempt += 1
+            continue
+
+        limiter.on_response(latency=time.monotonic() - start, throttled=response.status_code in THROTTLING_STATUS_CODES)
+        if stats is not None:
+            stats.add_request(size=len(response.content))
+        if response.status_code not in RETRY_STATUS_CODES or attempt >= MAX_RETRIES:
+            return response
+
+        retry_after = _get_retry_after(response)
+        delay = retry_after if retry_after is not None else _get_backoff(attempt)
+        log.warning(f"Retrying {url} in {delay:.2f}s [{attempt + 1}/{MAX_RETRIES}]: Status code {response.status_code}")
+        if response.status_code == httpx.codes.TOO_MANY_REQUESTS or retry_after is not None:
+            limiter.cool_down(delay)
+        else:
+            await asyncio.sleep(delay)
+        attempt += 1
+
+
+async def _get_page(
+    client: httpx.AsyncClient,
+    url: str,
+    limiter: RateLimiter,
+    cache: ResponseCache | None = None,
+    stats: RequestStats | None = None,
+) -> dict[str, Any]:
+    """Get a single page of results given a URL.
+
+    Stored responses are served from the cache without waiting for the rate limiter. Throttling responses,
+    server errors and connection errors are retried. Concurrent requests of the same URL, from any report of
+    the process, share a single request, made with the client of the first one. See `_wait_client_flights`.
+
+    Args:
+        client: HTTPX asynchronous client to be used to make the requests.
+        url: URL of the page with all filters and sorting applied.
+        limiter: Rate limiter shared by all the requests.
+        cache: Response cache used to avoid repeated requests.
+        stats: Counters of the requests made for the report.
+
+    Returns:
+        Raw JSON response.
+
+    Raises:
+        httpx.HTTPStatusError: The response from OpenAlex API had an error HTTP status of 4xx or 5xx.
+    """
+    content = cache.get(url) if cache is not None else None
+    if content is not None and stats is not None:
+        stats.add_cache_hit()
+    if content is None:
+
+        async def _fetch_content() -> bytes:
+            flights = _client_flights.setdefault(client, set())
+            flight = asyncio.current_task()
+            if flight is not None:
+                flights.add(flight)
+            try:
+                response = await _send_request(client, url, limiter, stats)
+            finally:
+                if flight is not None:
+                    flights.discard(flight)
+            response.raise_for_status()
+
+            if cache is not None:
+                cache.set(url, response.content)
+            return response.content
+
+        content = await _page_flights.do(normalize_url(url), _fetch_content)
+
+    json_response: dict[str, Any] = json.loads(content)
+    return json_response
+
+
+async def _wait_client_flights(client: httpx.AsyncClient) -> None:
+    """Wait for the page requests running on a client, before it is closed.
+
+    A page request is shared by every report asking for the same URL at the same time, so it may still have
+    callers after the report that started it was cancelled.
+
+    Args:
+        client: HTTPX asynchronous client to be closed.
+    """
+    flights = [flight for flight in _client_flights.get(client, ()) if flight is not asyncio.current_task()]
+    if flights:
+        await asyncio.wait(flights)
+
+
+def _get_works_url(filters: str) -> str:
+    """Build the URL of works matching a filter, sorted by publication date.
+
+    Args:
+        filters: OpenAlex filter parameter value.
+
+    Returns:
+        URL of works.
+    """
+    return f"https://api.openalex.org/works?filter={filters}&sort=publication_date&per-page={PER_PAGE_SIZE}"
+
+
+def _get_select_fields(model: type[DehydratedWork]) -> str:
+    """Build the OpenAlex `select` parameter value with the fields of a work model.
+
+    Only the fields used by the model are downloaded, which reduces the transfer, decoding and validation
+    time of each page. `Work` is used for the works of the report and `DehydratedWork` for the citing works.
+
+    Args:
+        model: Work model used to validate the results.
 
     Returns:
-        List of Works Models.
+        Comma separated list of fields.
+
+    Example:
+        ```python
+        from pub_analyzer.internal.report import _get_select_fields
+        from pub_analyzer.models.work import DehydratedWork
+
+        print(_get_select_fields(DehydratedWork))
+        # 'id,ids,title,publication_year,publication_date,type,primary_location,authorships,cited_by_count,referenced_works'
+        ```
+    """
+    return ",".join("abstract_inverted_index" if field == "abstract" else field for field in model.model_fields)
+
+
+async def _iter_cursor_pages(
+    client: httpx.AsyncClient,
+    url: str,
+    limiter: RateLimiter,
+    cache: ResponseCache | None = None,
+    stats: RequestStats | None = None,
+    cursor: str | None = "*",
+) -> AsyncIterator[dict[str, Any]]:
+    """Iterate over all pages of a URL using cursor paging.
+
+    Cursor paging is not limited to the first 10,000 results and, unlike basic paging, does not skip
+    or duplicate records when several works share the same sorting value.
+
+    Args:
+        client: HTTPX asynchronous client to be used to make the requests.
+        url: URL of works with all filters and sorting applied.
+        limiter: Rate limiter shared by all the requests.
+        cache: Response cache used to avoid repeated requests.
+        stats: Counters of the requests made for the report.
+        cursor: Cursor of the first page. Defaults to the start of the results.
+
+    Yields:
+        Raw JSON response of each page.
+
+    Raises:
+        httpx.HTTPStatusError: One response from OpenAlex API had an error HTTP status of 4xx or 5xx.
+    """
+    while cursor:
+        page = await _get_page(client, url + f"&cursor={cursor}", limiter, cache, stats)
+        if not page["results"]:
+            break
+
+        yield page
+        cursor = page["meta"].get("next_cursor")
+
+
+async def _iter_works(
+    client: httpx.AsyncClient,
+    url: str,
+    limiter: RateLimiter,
+    model: type[WorkT],
+    cache: ResponseCache | None = None,
+    stats: RequestStats | None = None,
+) -> AsyncIterator[list[WorkT]]:
+    """Iterate over all works given a URL, one page at a time.
+
+    Get the first page of the URL with cursor paging and, once the total count is known, get the remaining pages
+    concurrently with basic paging. Result sets bigger than `CURSOR_PAGINATION_THRESHOLD` keep following the
+    cursor sequentially instead. Only the fields of `model` are requested.
+
+    Basic paging over works with the same sorting value can return a work in two pages and leave another one
+    out of every page. Each work is yielded once, and if fewer works than the total count were returned, the
+    remaining ones are walked again with cursor paging.
+
+    Args:
+        client: HTTPX asynchronous client to be used to make the requests.
+        url: URL of works with all filters and sorting applied.
+        limiter: Rate limiter shared by all the requests.
+        model: Work model used to select the fields and validate the results.
+        cache: Response cache used to avoid repeated requests.
+        stats: Counters of the requests made for the report.
+
+    Yields:
+        List of Works Models of each page, in page order.
 
     Raises:
         httpx.HTTPStatusError: One response from OpenAlex API had an error HTTP status of 4xx or 5xx.
     """
-    await limiter.acquire()
-    response = await client.get(url=url, follow_redirects=True)
-    response.raise_for_status()
+    url = url + f"&select={_get_select_fields(model)}"
+    works_adapter = TypeAdapter(list[model])  # type: ignore[valid-type]
+
+    yielded_ids: set[str] = set()
 
-    json_response = response.json()
+    def _get_new_works(results: list[dict[str, Any]]) -> list[WorkT]:
+        new_works = []
+        for work in results:
+            if work["id"] not in yielded_ids:
+                yielded_ids.add(work["id"])
+                new_works.append(work)
+        works: list[WorkT] = works_adapter.validate_python(_get_valid_works(new_works))
+        return works
+
+    json_response = await _get_page(client, url + "&cursor=*", limiter, cache, stats)
     meta_info = json_response["meta"]
+    yield _get_new_works(json_response["results"])
+
+    if meta_info["count"] > CURSOR_PAGINATION_THRESHOLD:
+        log.info(f"Using cursor paging for {meta_info['count']} works: {url}")
+        async for page_result in _iter_cursor_pages(client, url, limiter, cache, stats, cursor=meta_info.get("next_cursor")):
+            yield _get_new_works(page_result["results"])
+        return
+
     page_count = math.ceil(meta_info["count"] / meta_info["per_page"])
+    pages = await _gather_bounded(
+        _get_page(client, url + f"&page={page_number}", limiter, cache, stats) for page_number in range(2, page_count + 1)
+    )
+    pages_ids = yielded_ids.union(work["id"] for page_result in pages for work in page_result["results"])
+    if len(pages_ids) < meta_info["count"]:
+        log.warning(f"Basic paging returned {len(pages_ids)} of {meta_info['count']} works, using cursor paging: {url}")
+        async for page_result in _iter_cursor_pages(client, url, limiter, cache, stats, cursor=meta_info.get("next_cursor")):
+            yield _get_new_works(page_result["results"])
+        if len(yielded_ids) < meta_info["count"]:
+            log.warning(f"Cursor paging returned {len(yielded_ids)} of {meta_info['count']} works: {url}")
+        return
+
+    for page_result in pages:
+        yield _get_new_works(page_result["results"])
+
+
+async def _get_works(
+    client: httpx.AsyncClient,
+    url: str,
+    limiter: RateLimiter,
+    model: type[WorkT],
+    cache: ResponseCache | None = None,
+    stats: RequestStats | None = None,
+) -> list[WorkT]:
+    """Get all works given a URL.
+
+    Collect all the pages yielded by `_iter_works`.
+
+    Args:
+        client: HTTPX asynchronous client to be used to make the requests.
+        url: URL of works with all filters and sorting applied.
+        limiter: Rate limiter shared by all the requests.
+        model: Work model used to select the fields and validate the results.
+        cache: Response cache used to avoid repeated requests.
+        stats: Counters of the requests made for the report.
+
+    Returns:
+        List of Works Models in page order.
+
+    Raises:
+        httpx.HTTPStatusError: One response from OpenAlex API had an error HTTP status of 4xx or 5xx.
+    """
+    works: list[WorkT] = []
+    async for page_works in _iter_works(client, url, limiter, model, cache, stats):
+        works.extend(page_works)
+
+    return works
+
+
+def _get_referenced_works_keys(work: DehydratedWork) -> set[str]:
+    """Collect OpenAlex keys from the works referenced by a work.
+
+    Args:
+        work: Work model instance.
+
+    Returns:
+        Works keys IDs referenced by the work.
+    """
+    return {referenced_work.path.rpartition("/")[2] for referenced_work in work.referenced_works if referenced_work.path}
+
+
+class CitationFetchBatch(BaseModel):
+    """Works whose citations are requested together with a single `cites:` filter."""
+
+    works_ids: list[str]
+    cited_by_count: int
+
+    @property
+    def requests_count(self) -> int:
+        """Pages needed in the worst case, when no citing work is shared between the works."""
+        return max(1, math.ceil(self.cited_by_count / PER_PAGE_SIZE))
+
+
+class CitationFetchPlan(BaseModel):
+    """Requests needed to get the works that cite a list of works."""
+
+    batches: list[CitationFetchBatch]
+    skipped_works_ids: list[str]
+
+    @property
+    def requests_count(self) -> int:
+        """Number of requests of the plan, at most."""
+        return sum(batch.requests_count for batch in self.batches)
+
+    def estimate_duration(self, rate: float = REQUEST_RATE_PER_SECOND) -> datetime.timedelta:
+        """Estimate the time needed to make all the requests.
+
+        Args:
+            rate: Requests per second allowed by the rate limiter.
 
-    works_data = list(_get_valid_works(json_response["results"]))
+        Returns:
+            Estimated duration.
+        """
+        return datetime.timedelta(seconds=self.requests_count / rate)
 
-    for page_number in range(1, page_count):
-        await limiter.acquire()
-        page_result = (await client.get(url + f"&page={page_number + 1}", follow_redirects=True)).json()
-        works_data.extend(_get_valid_works(page_result["results"]))
 
-    return TypeAdapter(list[Work]).validate_python(works_data)
+def plan_citation_fetch(works: Sequence[Work], skip_uncited: bool = True) -> CitationFetchPlan:
+    """Plan the requests needed to get the works that cite each one of the given works.
 
+    Works without citations are skipped, as a filter of the citing works can only remove citations. The
+    remaining works are sorted from the most to the least cited and packed into batches of at most
+    `CITES_BATCH_SIZE` works and `CITES_BATCH_CITATIONS` citations, so that each batch is fetched with parallel
+    page requests. A work with more citations than that gets a batch of its own, fetched with cursor paging.
+    Batches are ordered largest first, so that the longest ones start early.
 
-async def _get_source(client: httpx.AsyncClient, url: str, limiter: RateLimiter) -> Source:
-    """Get source given a URL.
+    Args:
+        works: Cited works, with their `cited_by_count`.
+        skip_uncited: Skip the works without citations. Disable it if the counts may be outdated.
+
+    Returns:
+        Citation fetch plan.
+    """
+    skipped_works_ids: list[str] = []
+    cited_works: list[tuple[str, int]] = []
+    for work in works:
+        work_id = identifier.get_work_id(work)
+        if skip_uncited and work.cited_by_count == 0:
+            skipped_works_ids.append(work_id)
+        else:
+            cited_works.append((work_id, work.cited_by_count))
+
+    batches: list[CitationFetchBatch] = []
+    batch_ids: list[str] = []
+    batch_count = 0
+    for work_id, cited_by_count in sorted(cited_works, key=lambda cited_work: cited_work[1], reverse=True):
+        if batch_ids and (len(batch_ids) >= CITES_BATCH_SIZE or batch_count + cited_by_count > CITES_BATCH_CITATIONS):
+            batches.append(CitationFetchBatch(works_ids=batch_ids, cited_by_count=batch_count))
+            batch_ids, batch_count = [], 0
+        batch_ids.append(work_id)
+        batch_count += cited_by_count
+
+    if batch_ids:
+        batches.append(CitationFetchBatch(works_ids=batch_ids, cited_by_count=batch_count))
+
+    return CitationFetchPlan(batches=batches, skipped_works_ids=skipped_works_ids)
+
+
+async def _iter_cited_by_works(
+    client: httpx.AsyncClient,
+    plan: CitationFetchPlan,
+    filters: str,
+    limiter: RateLimiter,
+    cache: ResponseCache | None = None,
+    stats: RequestStats | None = None,
+) -> AsyncIterator[dict[str, list[DehydratedWork]]]:
+    """Iterate over the works that cite each one of the works of a plan, one batch at a time.
+
+    Each batch of the plan is requested with a `cites:W1|W2|...` filter, so that a single request covers many
+    works. Each citing work is mapped back to the works it cites through its `referenced_works` field, only once
+    even if it is returned in two pages, see `_iter_works`.
+
+    Args:
+        client: HTTPX asynchronous client to be used to make the requests.
+        plan: Citation fetch plan made with `plan_citation_fetch`.
+        filters: Extra filters applied to the citing works. Each one must start with a comma.
+        limiter: Rate limiter shared by all the requests.
+        cache: Response cache used to avoid repeated requests.
+        stats: Counters of the requests made for the report.
+
+    Yields:
+        Citing works by cited work OpenAlex key of each batch, as soon as the batch is complete. Skipped works
+            are yielded first, as a batch without citations.
+
+    Raises:
+        httpx.HTTPStatusError: One response from OpenAlex API had an error HTTP status of 4xx or 5xx.
+    """
+    log.info(
+        f"Citations plan: {len(plan.batches)} batches, {len(plan.skipped_works_ids)} works without citations skipped, "
+        f"{plan.requests_count} requests at most (~{plan.estimate_duration(limiter.rate)})."
+    )
+
+    async def _get_cited_by_batch(batch: CitationFetchBatch) -> dict[str, list[DehydratedWork]]:
+        url = _get_works_url(f"cites:{'|'.join(batch.works_ids)}{filters}")
+        citing_works = await _get_works(client, url, limiter, DehydratedWork, cache, stats)
+
+        batch_cited_by: dict[str, list[DehydratedWork]] = {work_id: [] for work_id in batch.works_ids}
+        for citing_work in citing_works:
+            for work_id in _get_referenced_works_keys(citing_work) & batch_cited_by.keys():
+                batch_cited_by[work_id].append(citing_work)
+
+        return batch_cited_by
+
+    if plan.skipped_works_ids:
+        yield {work_id: [] for work_id in plan.skipped_works_ids}
+
+    async for batch_cited_by in _iter_bounded(_get_cited_by_batch(batch) for batch in plan.batches):
+        yield batch_cited_by
+
+
+async def _get_cited_by_works(
+    client: httpx.AsyncClient,
+    plan: CitationFetchPlan,
+    filters: str,
+    limiter: RateLimiter,
+    cache: ResponseCache | None = None,
+    stats: RequestStats | None = None,
+) -> dict[str, list[DehydratedWork]]:
+    """Get the works that cite each one of the works of a plan.
+
+    Collect all the batches yielded by `_iter_cited_by_works`.
 
     Args:
         client: HTTPX asynchronous client to be used to make the requests.
-        url: URL of works with all filters.
+        plan: Citation fetch plan made with `plan_citation_fetch`.
+        filters: Extra filters applied to the citing works. Each one must start with a comma.
+        limiter: Rate limiter shared by all the requests.
+        cache: Response cache used to avoid repeated requests.
+        stats: Counters of the requests made for the report.
 
     Returns:
-        Source Model.
+        Citing works by cited work OpenAlex key, including the skipped works.
 
     Raises:
         httpx.HTTPStatusError: One response from OpenAlex API had an error HTTP status of 4xx or 5xx.
     """
-    await limiter.acquire()
-    response = await client.get(url=url, follow_redirects=True)
-    response.raise_for_status()
+    cited_by: dict[str, list[DehydratedWork]] = {}
+    async for batch_cited_by in _iter_cited_by_works(client, plan, filters, limiter, cache, stats):
+        cited_by.update(batch_cited_by)
+
+    return cited_by
 
-    json_response = response.json()
-    hp_url = json_response["homepage_url"]
+
+def _sanitize_source(source: dict[str, Any]) -> dict[str, Any]:
+    """Discard the source homepage URL if it is not a valid HTTP URL.
+
+    Args:
+        source: Raw source.
+
+    Returns:
+        Source with a valid `homepage_url` or None.
+    """
+    hp_url = source.get("homepage_url")
     if isinstance(hp_url, str):
         if not hp_url.startswith(("http", "https")):
-            json_response["homepage_url"] = None
-            log.warning(f"Discarted source homepage url: {url}")
+            source["homepage_url"] = None
+            log.warning(f"Discarted source homepage url: {source['id']}")
 
-    return Source(**json_response)
+    return source
 
 
-async def make_author_report(  # noqa: C901
-    author: Author,
-    extra_profiles: list[Author | AuthorResult | DehydratedAuthor] | None = None,
-    pub_from_date: FromDate | None = None,
-    pub_to_date: ToDate | None = None,
-    cited_from_date: FromDate | None = None,
-    cited_to_date: ToDate | None = None,
-) -> AuthorReport:
-    """Make a scientific production report by Author.
+async def _get_sources_one_by_one(
+    client: httpx.AsyncClient,
+    sources_ids: list[str],
+    limiter: RateLimiter,
+    cache: ResponseCache | None = None,
+    stats: RequestStats | None = None,
+) -> list[dict[str, Any]]:
+    """Request sources one by one, skipping with a warning the ones that can not be retrieved.
 
     Args:
-        author: Author to whom the report is generated.
-        extra_profiles: List of author profiles whose works will be attached.
+        client: HTTPX asynchronous client to be used to make the requests.
+        sources_ids: OpenAlex keys of the sources.
+        limiter: Rate limiter shared by all the requests.
+        cache: Response cache used to avoid repeated requests.
+        stats: Counters of the requests made for the report.
 
-        pub_from_date: Filter works published from this date.
-        pub_to_date: Filter works published up to this date.
+    Returns:
+        Raw JSON of the retrieved sources.
+    """
 
-        cited_from_date: Filter works that cite the author, published after this date.
-        cited_to_date: Filter works that cite the author, published up to this date.
+    async def _get_source(source_id: str) -> dict[str, Any] | None:
+        try:
+            return await _get_page(client, f"https://api.openalex.org/sources/{source_id}", limiter, cache, stats)
+        except httpx.HTTPStatusError as exc:
+            log.warning(f"Fail to retrive {source_id}: {exc}")
+            return None
+
+    sources = await asyncio.gather(*(_get_source(source_id) for source_id in sources_ids))
+    return [source for source in sources if source is not None]
+
+
+async def _get_sources(
+    client: httpx.AsyncClient,
+    sources_ids: list[str],
+    limiter: RateLimiter,
+    cache: ResponseCache | None = None,
+    ignore_errors: bool = False,
+    stats: RequestStats | None = None,
+) -> list[Source]:
+    """Get sources full info given their IDs.
+
+    Sources are requested in batches of `SOURCES_BATCH_SIZE` with an `openalex:S1|S2|...` filter. When errors are
+    ignored, the sources of a failed batch are requested one by one, so that only the failed ones are skipped.
+
+    Args:
+        client: HTTPX asynchronous client to be used to make the requests.
+        sources_ids: OpenAlex keys of the sources.
+        limiter: Rate limiter shared by all the requests.
+        cache: Response cache used to avoid repeated requests.
+        ignore_errors: Skip, with a warning, the sources that can not be retrieved or validated instead of raising.
+        stats: Counters of the requests made for the report.
 
     Returns:
-        Author's scientific production report Model.
+        List of Source Models, in the same order as `sources_ids`.
 
     Raises:
         httpx.HTTPStatusError: One response from OpenAlex API had an error HTTP status of 4xx or 5xx.
     """
-    author_profiles_keys = _get_author_profiles_keys(author, extra_profiles)
-    profiles_query_parameter = "|".join(author_profiles_keys)
 
-    pub_from_filter = f",from_publication_date:{pub_from_date:%Y-%m-%d}" if pub_from_date else ""
-    pub_to_filter = f",to_publication_date:{pub_to_date:%Y-%m-%d}" if pub_to_date else ""
-    url = f"https://api.openalex.org/works?filter=author.id:{profiles_query_parameter}{pub_from_filter}{pub_to_filter}&sort=publication_date&per-page={PER_PAGE_SIZE}"
+    async def _get_sources_batch(batch: list[str]) -> list[dict[str, Any]]:
+        url = f"https://api.openalex.org/sources?filter=openalex:{'|'.join(batch)}&per-page={PER_PAGE_SIZE}"
+        try:
+            results: list[dict[str, Any]] = (await _get_page(client, url, limiter, cache, stats))["results"]
+        except httpx.HTTPStatusError as exc:
+            if not ignore_errors:
+                raise
+            log.warning(f"Fail to retrive {'|'.join(batch)}: {exc}")
+            return await _get_sources_one_by_one(client, batch, limiter, cache, stats) if len(batch) > 1 else []
+        return results
+
+    batches = [sources_ids[idx : idx + SOURCES_BATCH_SIZE] for idx in range(0, len(sources_ids), SOURCES_BATCH_SIZE)]
+    batches_results = await _gather_bounded(_get_sources_batch(batch) for batch in batches)
+    sources_data = {source["id"].rpartition("/")[2]: source for batch_result in batches_results for source in batch_result}
+
+    sources: list[Source] = []
+    for source_id in sources_ids:
+        source_data = sources_data.get(source_id)
+        if source_data is None:
+            log.warning(f"Fail to retrive {source_id}: Source not found.")
+            continue
+
+        try:
+            sources.append(Source(**_sanitize_source(source_data)))
+        except ValidationError as exc:
+            if not ignore_errors:
+                raise
+            log.warning(f"Fail to retrive {source_id}: {exc}")
+
+    return sources
+
+
+def _make_work_report(work: Work, cited_by_works: list[DehydratedWork]) -> WorkReport:
+    """Classify the citations of a work and summarize them.
 
-    limiter = RateLimiter(rate=REQUEST_RATE_PER_SECOND, per_second=1.0)
-    async with httpx.AsyncClient(http2=True, timeout=None) as client:
-        # Getting all the author works.
-        author_works = await _get_works(client, url, limiter)
+    Args:
+        work: Evaluated work.
+        cited_by_works: Works that cite the evaluated work.
 
-        # Extra filters
-        cited_from_filter = f",from_publication_date:{cited_from_date:%Y-%m-%d}" if cited_from_date else ""
-        cited_to_filter = f",to_publication_date:{cited_to_date:%Y-%m-%d}" if cited_to_date else ""
+    Returns:
+        Work report.
+    """
+    work_authors = _get_authors_list(authorships=work.authorships)
+    cited_by: list[CitationReport] = []
+    work_citation_summary = CitationSummary()
+    for cited_by_work in cited_by_works:
+        cited_authors = _get_authors_list(authorships=cited_by_work.authorships)
+        citation_type = _get_citation_type(work_authors, cited_authors)
 
-        # Report fields.
-        works: list[WorkReport] = []
-        report_citation_summary = CitationSummary()
-        open_access_summary = OpenAccessSummary()
-        works_type_counter: list[WorkTypeCounter] = []
-        dehydrated_sources: list[DehydratedSource] = []
-        counts_by_year: list[AuthorYearCount] = []
-
-        # Getting all works that have cited the author.
-        author_works_count = len(author_works)
-        for idx_work, author_work in enumerate(author_works, 1):
-            work_id = identifier.get_work_id(author_work)
-            log.info(f"[{work_id}] Work [{idx_work}/{author_works_count}]")
-
-            work_authors = _get_authors_list(authorships=author_work.authorships)
-            cited_by_api_url = f"https://api.openalex.org/works?filter=cites:{work_id}{cited_from_filter}{cited_to_filter}&sort=publication_date&per-page={PER_PAGE_SIZE}"
-
-            # Add work to the count by year
-            if author_work.publication_year:
-                year_counter = _get_year_counter(counts_by_year, author_work.publication_year)
-                if year_counter:
-                    year_counter.works_count += 1
-                else:
-                    counts_by_year.append(AuthorYearCount(year=author_work.publication_year, works_count=1, cited_by_count=0))
-
-            # Adding the type of OpenAccess in the counter.
-            open_access_summary.add_oa_type(author_work.open_access.oa_status)
-
-            # Adding the work type to works type counter.
-            work_type = next((work_type for work_type in works_type_counter if work_type.type_name == author_work.type), None)
-            if work_type:
-                work_type.count += 1
-            else:
-                works_type_counter.append(WorkTypeCounter(type_name=author_work.type, count=1))
-
-            # Add Sources to global list.
-            for location in author_work.locations:
-                if location.source and not any(source.id == location.source.id for source in dehydrated_sources):
-                    dehydrated_sources.append(location.source)
-
-            cited_by_works = await _get_works(client, cited_by_api_url, limiter)
-            cited_by: list[CitationReport] = []
-            work_citation_summary = CitationSummary()
-            for cited_by_work in cited_by_works:
-                cited_authors = _get_authors_list(authorships=cited_by_work.authorships)
-                citation_type = _get_citation_type(work_authors, cited_authors)
-
-                # Adding the type of cites in the counters.
-                report_citation_summary.add_cite_type(citation_type)
-                work_citation_summary.add_cite_type(citation_type)
-
-                # Add work to the count by year
-                if cited_by_work.publication_year:
-                    year_counter = _get_year_counter(counts_by_year, cited_by_work.publication_year)
-                    if year_counter:
-                        year_counter.cited_by_count += 1
-                    else:
-                        counts_by_year.append(AuthorYearCount(year=cited_by_work.publication_year, works_count=0, cited_by_count=1))
-
-                cited_by.append(CitationReport(work=cited_by_work, citation_type=citation_type))
-
-            works.append(WorkReport(work=author_work, cited_by=cited_by, citation_summary=work_citation_summary))
+        work_citation_summary.add_cite_type(citation_type)
+        cited_by.append(CitationReport(work=cited_by_work, citation_type=citation_type))
 
-        # Replace counts by year
-        counts_by_year.sort(key=lambda c: c.year)
-        author.counts_by_year = counts_by_year
+    return WorkReport(work=work, cited_by=cited_by, citation_summary=work_citation_summary)
 
-        # Get sources full info.
-        sources: list[Source] = []
-        sources_count = len(dehydrated_sources)
-        for idx, dehydrated_source in enumerate(dehydrated_sources, 1):
-            source_id = identifier.get_source_id(dehydrated_source)
-            source_url = f"https://api.openalex.org/sources/{source_id}"
 
-            log.info(f"Getting Sources... [{idx}/{sources_count}]")
-            sources.append(await _get_source(client, source_url, limiter))
+def _get_citation_summary(works: list[WorkReport]) -> CitationSummary:
+    """Count the citations of all works by citation type."""
+    citation_summary = CitationSummary()
+    for work_report in works:
+        citation_summary.type_a_count += work_report.citation_summary.type_a_count
+        citation_summary.type_b_count += work_report.citation_summary.type_b_count
 
-        # Sort sources by h_index
-        sources_sorted = sorted(sources, key=lambda source: source.summary_stats.two_yr_mean_citedness, reverse=True)
-        sources_summary = SourcesSummary(sources=sources_sorted)
+    return citation_summary
 
-    return AuthorReport(
-        author=author,
-        works=works,
-        citation_summary=report_citation_summary,
-        open_access_summary=open_access_summary,
-        works_type_summary=works_type_counter,
-        sources_summary=sources_summary,
-    )
 
+def _get_open_access_summary(works: list[WorkReport]) -> OpenAccessSummary:
+    """Count the works by Open Access type."""
+    open_access_summary = OpenAccessSummary()
+    for work_report in works:
+        open_access_summary.add_oa_type(work_report.work.open_access.oa_status)
 
-async def make_institution_report(  # noqa: C901
-    institution: Institution,
-    extra_profiles: list[Institution | InstitutionResult | DehydratedInstitution] | None = None,
-    pub_from_date: FromDate | None = None,
-    pub_to_date: ToDate | None = None,
-    cited_from_date: FromDate | None = None,
-    cited_to_date: ToDate | None = None,
-) -> InstitutionReport:
-    """Make a scientific production report by Institution.
+    return open_access_summary
 
-    Args:
-        institution: Institution to which the report is generated.
-        extra_profiles: List of institutions profiles whose works will be attached.
 
-        pub_from_date: Filter works published from this date.
-        pub_to_date: Filter works published up to this date.
+def _get_works_type_summary(works: list[WorkReport]) -> list[WorkTypeCounter]:
+    """Count the works by type, in order of first appearance."""
+    works_type_counter: dict[str, WorkTypeCounter] = {}
+    for work_report in works:
+        work_type = work_report.work.type
+        if work_type in works_type_counter:
+            works_type_counter[work_type].count += 1
+        else:
+            works_type_counter[work_type] = WorkTypeCounter(type_name=work_type, count=1)
 
-        cited_from_date: Filter works that cite the institution, published after this date.
-        cited_to_date: Filter works that cite the institution, published up to this date.
+    return list(works_type_counter.values())
 
-    Returns:
-        Institution's scientific production report Model.
 
-    Raises:
-        httpx.HTTPStatusError: One response from OpenAlex API had an error HTTP status of 4xx or 5xx.
+def _get_counts_by_year(works: list[WorkReport], year_count_model: type[YearCountT]) -> list[YearCountT]:
+    """Count the works published and the citations received in each year.
+
+    Args:
+        works: Works reports.
+        year_count_model: Year counter model of the report entity.
+
+    Returns:
+        Year counters sorted by year.
     """
-    institution_keys = _get_institution_keys(institution, extra_profiles)
-    institution_query_parameter = "|".join(institution_keys)
+    counts_by_year: dict[int, YearCountT] = {}
 
-    pub_from_filter = f",from_publication_date:{pub_from_date:%Y-%m-%d}" if pub_from_date else ""
-    pub_to_filter = f",to_publication_date:{pub_to_date:%Y-%m-%d}" if pub_to_date else ""
-    url = f"https://api.openalex.org/works?filter=institutions.id:{institution_query_parameter}{pub_from_filter}{pub_to_filter}&sort=publication_date&per-page={PER_PAGE_SIZE}"
+    def _get_year_counter(year: int) -> YearCountT:
+        if year not in counts_by_year:
+            counts_by_year[year] = year_count_model(year=year, works_count=0, cited_by_count=0)
+        return counts_by_year[year]
 
-    limiter = RateLimiter(rate=REQUEST_RATE_PER_SECOND, per_second=1.0)
-    async with httpx.AsyncClient(http2=True, timeout=None) as client:
-        # Getting all the institution works.
-        institution_works = await _get_works(client=client, url=url, limiter=limiter)
+    for work_report in works:
+        if work_report.work.publication_year:
+            _get_year_counter(work_report.work.publication_year).works_count += 1
 
-        # Extra filters
-        cited_from_filter = f",from_publication_date:{cited_from_date:%Y-%m-%d}" if cited_from_date else ""
-        cited_to_filter = f",to_publication_date:{cited_to_date:%Y-%m-%d}" if cited_to_date else ""
+        for citation in work_report.cited_by:
+            if citation.work.publication_year:
+                _get_year_counter(citation.work.publication_year).cited_by_count += 1
 
-        # Report fields.
-        works: list[WorkReport] = []
-        report_citation_summary = CitationSummary()
-        open_access_summary = OpenAccessSummary()
-        works_type_counter: list[WorkTypeCounter] = []
-        dehydrated_sources: list[DehydratedSource] = []
-        counts_by_year: list[InstitutionYearCount] = []
-
-        # Getting all works that have cited a work.
-        institution_works_count = len(institution_works)
-        for idx_work, institution_work in enumerate(institution_works, 1):
-            work_id = identifier.get_work_id(institution_work)
-            log.info(f"[{work_id}] Work [{idx_work}/{institution_works_count}]")
-
-            work_authors = _get_authors_list(authorships=institution_work.authorships)
-            cited_by_api_url = f"https://api.openalex.org/works?filter=cites:{work_id}{cited_from_filter}{cited_to_filter}&sort=publication_date&per-page={PER_PAGE_SIZE}"
-
-            # Add work to the count by year
-            if institution_work.publication_year:
-                year_counter = _get_year_counter(counts_by_year, institution_work.publication_year)
-                if year_counter:
-                    year_counter.works_count += 1
-                else:
-                    counts_by_year.append(InstitutionYearCount(year=institution_work.publication_year, works_count=1, cited_by_count=0))
-
-            # Adding the type of OpenAccess in the counter.
-            open_access_summary.add_oa_type(institution_work.open_access.oa_status)
-
-            # Adding the work type to works type counter.
-            work_type = next((work_type for work_type in works_type_counter if work_type.type_name == institution_work.type), None)
-            if work_type:
-                work_type.count += 1
-            else:
-                works_type_counter.append(WorkTypeCounter(type_name=institution_work.type, count=1))
-
-            # Add Sources to global list.
-            for location in institution_work.locations:
-                if location.source and not any(source.id == location.source.id for source in dehydrated_sources):
-                    dehydrated_sources.append(location.source)
-
-            cited_by_works = await _get_works(client, cited_by_api_url, limiter)
-            cited_by: list[CitationReport] = []
-            work_citation_summary = CitationSummary()
-            for cited_by_work in cited_by_works:
-                cited_authors = _get_authors_list(authorships=cited_by_work.authorships)
-                citation_type = _get_citation_type(work_authors, cited_authors)
-
-                # Adding the type of cites in the counters.
-                report_citation_summary.add_cite_type(citation_type)
-                work_citation_summary.add_cite_type(citation_type)
-
-                # Add work to the count by year
-                if cited_by_work.publication_year:
-                    year_counter = _get_year_counter(counts_by_year, cited_by_work.publication_year)
-                    if year_counter:
-                        year_counter.cited_by_count += 1
-                    else:
-                        counts_by_year.append(InstitutionYearCount(year=cited_by_work.publication_year, works_count=0, cited_by_count=1))
-
-                cited_by.append(CitationReport(work=cited_by_work, citation_type=citation_type))
-
-            works.append(WorkReport(work=institution_work, cited_by=cited_by, citation_summary=work_citation_summary))
+    return sorted(counts_by_year.values(), key=lambda year_counter: year_counter.year)
 
-        # Replace counts by year
-        counts_by_year.sort(key=lambda c: c.year)
-        institution.counts_by_year = counts_by_year
 
-        # Get sources full info.
-        sources: list[Source] = []
-        sources_count = len(dehydrated_sources)
-        for idx, dehydrated_source in enumerate(dehydrated_sources, 1):
-            source_id = identifier.get_source_id(dehydrated_source)
-            source_url = f"https://api.openalex.org/sources/{source_id}"
+def _get_dehydrated_sources(works: list[WorkReport]) -> list[DehydratedSource]:
+    """Collect the sources of all works locations, in order of first appearance."""
+    dehydrated_sources: dict[str, DehydratedSource] = {}
+    for work_report in works:
+        for location in work_report.work.locations:
+            if location.source and str(location.source.id) not in dehydrated_sources:
+                dehydrated_sources[str(location.source.id)] = location.source
 
-            log.info(f"[{source_id}] Getting Sources... [{idx}/{sources_count}]")
+    return list(dehydrated_sources.values())
 
-            try:
-                sources.append(await _get_source(client, source_url, limiter))
-            except httpx.HTTPStatusError as exc:
-                log.warning(f"Fail to retrive {source_id}: {exc}")
-
-        # Sort sources by h_index
-        sources_sorted = sorted(sources, key=lambda source: source.summary_stats.two_yr_mean_citedness, reverse=True)
-        sources_summary = SourcesSummary(sources=sources_sorted)
-
-    return InstitutionReport(
-        institution=institution,
-        works=works,
-        citation_summary=report_citation_summary,
-        open_access_summary=open_access_summary,
-        works_type_summary=works_type_counter,
-        sources_summary=sources_summary,
-    )
+
+def _get_sources_summary(sources: list[Source]) -> SourcesSummary:
+    """Sort sources by their 2-year mean citedness."""
+    sources_sorted = sorted(sources, key=lambda source: source.summary_stats.two_yr_mean_citedness, reverse=True)
+    return SourcesSummary(sources=sources_sorted)
+
+
+def _get_group_members(authors: list[Author], works: list[WorkReport]) -> list[GroupMemberReport]:
+    """Summarize the works of each author of a group and replace their counts by year.
+
+    A work of several authors of the group counts for each one of them.
+
+    Args:
+        authors: Authors of the group.
+        works: Works reports of the group.
+
+    Returns:
+        Summary of each author, in the same order.
+    """
+    works_authors = [set(_get_authors_list(authorships=work_report.work.authorships)) for work_report in works]
+
+    members: list[GroupMemberReport] = []
+    for author in authors:
+        author_key = identifier.get_author_id(author)
+        author_works = [work_report for work_report, authors_keys in zip(works, works_authors, strict=True) if author_key in authors_keys]
+        members.append(_get_group_member(author, author_works))
+
+    return members
+
+
+def _get_group_member(author: Author, works: list[WorkReport]) -> GroupMemberReport:
+    """Summarize the works of an author of a group and replace its counts by year.
+
+    Args:
+        author: Author of the group.
+        works: Works reports of the author.
+
+    Returns:
+        Summary of the author.
+    """
+    author.counts_by_year = _get_counts_by_year(works, AuthorYearCount)
+    return GroupMemberReport(
+        author=author,
+        works_count=len(works),
+        citation_summary=_get_citation_summary(works),
+        open_access_summary=_get_open_access_summary(works),
+        works_type_summary=_get_works_type_summary(works),
+    )
+
+
+def _get_refresh_query(
+    query: ReportQuery | None,
+    extra_profiles: list[str] | None = None,
+    pub_from_date: FromDate | None = None,
+    pub_to_date: ToDate | None = None,
+    cited_from_date: FromDate | None = None,
+    cited_to_date: ToDate | None = None,
+) -> ReportQuery:
+    """Profiles and filters of a refreshed report: the given ones, or else the ones the report was made with.
+
+    Args:
+        query: Profiles and filters recorded in the report, if any.
+        extra_profiles: OpenAlex keys of the extra profiles.
+        pub_from_date: Filter works published from this date.
+        pub_to_date: Filter works published up to this date.
+        cited_from_date: Filter citing works published after this date.
+        cited_to_date: Filter citing works published up to this date.
+
+    Returns:
+        Profiles and filters of the refreshed report.
+    """
+    query = query or ReportQuery()
+    return ReportQuery(
+        extra_profiles=query.extra_profiles if extra_profiles is None else extra_profiles,
+        pub_from_date=pub_from_date or query.pub_from_date,
+        pub_to_date=pub_to_date or query.pub_to_date,
+        cited_from_date=cited_from_date or query.cited_from_date,
+        cited_to_date=cited_to_date or query.cited_to_date,
+    )
+
+
+async def _iter_refresh_works(
+    client: httpx.AsyncClient,
+    works_reports: dict[str, WorkReport],
+    works_filter: str,
+    cited_filters: str,
+    since: datetime.datetime,
+    limiter: RateLimiter,
+    cache: ResponseCache | None = None,
+    tracker: ProgressTracker | None = None,
+) -> AsyncIterator[ReportProgress]:
+    """Merge the works and citations updated since a date into existing works reports, yielding the progress.
+
+    Only three kinds of queries are made: works updated since the date, all the citations of the new works,
+    and the citations updated since the date of the already known works. The `updated_date` of a work also
+    changes when the work is created, so new works and new citations are both included.
+
+    Args:
+        client: HTTPX asynchronous client to be used to make the requests.
+        works_reports: Works reports of the existing report by work OpenAlex key. The updated and new works
+            reports are stored in it.
+        works_filter: OpenAlex filter of the report works.
+        cited_filters: Extra filters applied to the citing works. Each one must start with a comma.
+        since: Only works and citations updated from this date are requested.
+        limiter: Rate limiter shared by all the requests.
+        cache: Response cache used to avoid repeated requests.
+        tracker: Progress tracker of the report.
+
+    Yields:
+        Progress of the refresh, once the updated works are fetched and after each batch of citations.
+
+    Raises:
+        httpx.HTTPStatusError: One response from OpenAlex API had an error HTTP status of 4xx or 5xx.
+
+    Info:
+        Citations removed from OpenAlex after the report generation are not detected.
+    """
+    tracker = tracker or ProgressTracker()
+    since_filter = f",from_updated_date:{since:%Y-%m-%d}"
+    known_works_ids = list(works_reports)
+
+    yield tracker.update(ReportPhase.WORKS, done=0)
+    updated_works = await _get_works(client, _get_works_url(f"{works_filter}{since_filter}"), limiter, Work, cache, tracker.stats)
+    log.info(f"Updated works since {since:%Y-%m-%d}: {len(updated_works)}")
+    yield tracker.update(ReportPhase.WORKS, done=len(updated_works), total=len(updated_works))
+
+    new_works: dict[str, Work] = {}
+    for updated_work in updated_works:
+        work_id = identifier.get_work_id(updated_work)
+        if work_id in works_reports:
+            cited_by_works = [citation.work for citation in works_reports[work_id].cited_by]
+            works_reports[work_id] = _make_work_report(updated_work, cited_by_works)
+        else:
+            new_works[work_id] = updated_work
+
+    citations_total = len(new_works) + len(known_works_ids)
+    citations_done = 0
+    yield tracker.update(ReportPhase.CITATIONS, done=citations_done, total=citations_total)
+
+    # All the citations of the new works.
+    new_plan = plan_citation_fetch(list(new_works.values()))
+    async for new_cited_by in _iter_cited_by_works(client, new_plan, cited_filters, limiter, cache, tracker.stats):
+        for work_id, cited_by_works in new_cited_by.items():
+            works_reports[work_id] = _make_work_report(new_works[work_id], cited_by_works)
+        citations_done += len(new_cited_by)
+        yield tracker.update(ReportPhase.CITATIONS, done=citations_done, total=citations_total)
+
+    # Only the updated citations of the known works. Their citation counts may be outdated, so none is skipped.
+    known_works_plan = plan_citation_fetch([works_reports[work_id].work for work_id in known_works_ids], skip_uncited=False)
+    updated_cited_by_batches = _iter_cited_by_works(
+        client, known_works_plan, f"{cited_filters}{since_filter}", limiter, cache, tracker.stats
+    )
+    async for updated_cited_by in updated_cited_by_batches:
+        for work_id, updated_cited_by_works in updated_cited_by.items():
+            if not updated_cited_by_works:
+                continue
+
+            work_report = works_reports[work_id]
+            cited_by = {str(citation.work.id): citation.work for citation in work_report.cited_by}
+            cited_by.update((str(cited_by_work.id), cited_by_work) for cited_by_work in updated_cited_by_works)
+
+            cited_by_works = sorted(cited_by.values(), key=lambda cited_by_work: cited_by_work.publication_date or "")
+            works_reports[work_id] = _make_work_report(work_report.work, cited_by_works)
+        citations_done += len(updated_cited_by)
+        yield tracker.update(ReportPhase.CITATIONS, done=citations_done, total=citations_total)
+
+
+def _sort_works_reports(works_reports: Iterable[WorkReport]) -> list[WorkReport]:
+    """Sort works reports by publication date."""
+    return sorted(works_reports, key=lambda work_report: work_report.work.publication_date or "")
+
+
+async def _get_report_sources(
+    client: httpx.AsyncClient,
+    works: list[WorkReport],
+    known_sources: list[Source],
+    limiter: RateLimiter,
+    cache: ResponseCache | None = None,
+    ignore_errors: bool = False,
+    checkpoint: ReportCheckpoint | None = None,
+    stats: RequestStats | None = None,
+) -> list[Source]:
+    """Get the sources of the works, requesting only the ones not already known.
+
+    Args:
+        client: HTTPX asynchronous client to be used to make the requests.
+        works: Works reports.
+        known_sources: Sources already retrieved, from a previous report or a checkpoint.
+        limiter: Rate limiter shared by all the requests.
+        cache: Response cache used to avoid repeated requests.
+        ignore_errors: Skip, with a warning, the sources that can not be retrieved or validated instead of raising.
+        checkpoint: Checkpoint where the new sources are saved.
+        stats: Counters of the requests made for the report.
+
+    Returns:
+        List of Source Models, in order of first appearance in the works.
+    """
+    known_sources_by_id = {identifier.get_source_id(source): source for source in known_sources}
+    sources_ids = [identifier.get_source_id(dehydrated_source) for dehydrated_source in _get_dehydrated_sources(works)]
+
+    new_sources_ids = [source_id for source_id in sources_ids if source_id not in known_sources_by_id]
+    log.info(f"Getting Sources... [{len(new_sources_ids)}]")
+    new_sources = await _get_sources(client, new_sources_ids, limiter, cache, ignore_errors=ignore_errors, stats=stats)
+    if checkpoint:
+        checkpoint.save_sources(new_sources)
+
+    sources_by_id = known_sources_by_id | {identifier.get_source_id(source): source for source in new_sources}
+    return [sources_by_id[source_id] for source_id in sources_ids if source_id in sources_by_id]
+
+
+class WorksFetched(BaseModel):
+    """Report event: works of the report entity retrieved from the API or a checkpoint."""
+
+    works: list[Work]
+
+
+class WorkReportCompleted(BaseModel):
+    """Report event: report of a work whose citations are complete."""
+
+    work_report: WorkReport
+    completed_count: int
+    """Works reports completed so far, including this one."""
+    works_count: int
+    """Works of the report entity fetched so far."""
+    citation_summary: CitationSummary
+    """Citation summary of the works reports completed so far."""
+    open_access_summary: OpenAccessSummary
+    """Open Access summary of the works reports completed so far."""
+
+
+class SourcesFetched(BaseModel):
+    """Report event: full info of the sources of all the works."""
+
+    sources: list[Source]
+
+
+class ReportFinished(BaseModel, Generic[ReportT]):
+    """Report event: the finished report, always the last event of a report stream."""
+
+    report: ReportT
+
+
+ReportEvent = WorksFetched | WorkReportCompleted | SourcesFetched | ReportProgress
+"""Events of a report stream, before the report is finished."""
+
+
+class _ReportBuilder:
+    """Works reports collected while a report is streamed, with running summaries.
+
+    Works reports complete in any order. They are kept by work OpenAlex key and returned in the order the
+    works were fetched, so the finished report is the same regardless of the completion order.
+    """
+
+    def __init__(self) -> None:
+        self.works_ids: list[str] = []
+        self.works_reports: dict[str, WorkReport] = {}
+        self.citation_summary = CitationSummary()
+        self.open_access_summary = OpenAccessSummary()
+
+    def add_works(self, works: list[Work]) -> WorksFetched:
+        """Add fetched works, whose reports are not complete yet."""
+        self.works_ids.extend(identifier.get_work_id(work) for work in works)
+        return WorksFetched(works=works)
+
+    def add_work_report(self, work_id: str, work_report: WorkReport) -> WorkReportCompleted:
+        """Add a complete work report and update the running summaries."""
+        self.works_reports[work_id] = work_report
+        self.citation_summary.type_a_count += work_report.citation_summary.type_a_count
+        self.citation_summary.type_b_count += work_report.citation_summary.type_b_count
+        self.open_access_summary.add_oa_type(work_report.work.open_access.oa_status)
+
+        log.info(f"[{work_id}] Work [{len(self.works_reports)}/{len(self.works_ids)}]")
+        return WorkReportCompleted(
+            work_report=work_report,
+            completed_count=len(self.works_reports),
+            works_count=len(self.works_ids),
+            citation_summary=self.citation_summary.model_copy(),
+            open_access_summary=self.open_access_summary.model_copy(),
+        )
+
+    @property
+    def works(self) -> list[WorkReport]:
+        """Works reports in the order the works were fetched."""
+        return [self.works_reports[work_id] for work_id in self.works_ids]
+
+
+async def _iter_works_reports(
+    client: httpx.AsyncClient,
+    builder: _ReportBuilder,
+    urls: Sequence[str],
+    cited_filters: str,
+    limiter: RateLimiter,
+    cache: ResponseCache | None = None,
+    checkpoint: ReportCheckpoint | None = None,
+    tracker: ProgressTracker | None = None,
+) -> AsyncIterator[WorksFetched | WorkReportCompleted | ReportProgress]:
+    """Get the works of a report and the works that cite each one of them, as they arrive.
+
+    Works are yielded one page at a time, each one only the first time it is found in any of the URLs. Once all
+    of them are known their citations are requested in batches, so the citations of a work are requested once,
+    and the report of each work is yielded as soon as its batch is complete. With a checkpoint, the works and
+    the citations of each batch are saved as soon as they are retrieved, and only the works without saved
+    citations are requested. A progress event follows each one of them.
+
+    Args:
+        client: HTTPX asynchronous client to be used to make the requests.
+        builder: Collects the works reports.
+        urls: URLs of the report works.
+        cited_filters: Extra filters applied to the citing works. Each one must start with a comma.
+        limiter: Rate limiter shared by all the requests.
+        cache: Response cache used to avoid repeated requests.
+        checkpoint: Checkpoint of the report progress.
+        tracker: Progress tracker of the report.
+
+    Yields:
+        Works fetched, works reports completed and the progress of the report.
+
+    Raises:
+        httpx.HTTPStatusError: One response from OpenAlex API had an error HTTP status of 4xx or 5xx.
+    """
+    tracker = tracker or ProgressTracker()
+
+    works: list[Work] = []
+    if checkpoint and checkpoint.works is not None:
+        works = checkpoint.works
+        yield builder.add_works(works)
+        yield tracker.update(ReportPhase.WORKS, done=len(works), total=len(works))
+    else:
+        works_ids: set[str] = set()
+        for url in urls:
+            async for page_works in _iter_works(client, url, limiter, Work, cache, tracker.stats):
+                new_works = [work for work in page_works if identifier.get_work_id(work) not in works_ids]
+                works_ids.update(identifier.get_work_id(work) for work in new_works)
+                works.extend(new_works)
+                yield builder.add_works(new_works)
+                yield tracker.update(ReportPhase.WORKS, done=len(works))
+        if checkpoint:
+            checkpoint.save_works(works)
+
+    works_by_id = {identifier.get_work_id(work): work for work in works}
+    yield tracker.update(ReportPhase.CITATIONS, done=0, total=len(works_by_id))
+
+    completed_cited_by = dict(checkpoint.cited_by) if checkpoint else {}
+    for work_id, work in works_by_id.items():
+        if work_id in completed_cited_by:
+            yield builder.add_work_report(work_id, _make_work_report(work, completed_cited_by[work_id]))
+            yield tracker.update(ReportPhase.CITATIONS, done=len(builder.works_reports), total=len(works_by_id))
+
+    plan = plan_citation_fetch([work for work_id, work in works_by_id.items() if work_id not in completed_cited_by])
+    async for batch_cited_by in _iter_cited_by_works(client, plan, cited_filters, limiter, cache, tracker.stats):
+        if checkpoint:
+            checkpoint.save_cited_by(batch_cited_by)
+        for work_id, cited_by_works in batch_cited_by.items():
+            yield builder.add_work_report(work_id, _make_work_report(works_by_id[work_id], cited_by_works))
+            yield tracker.update(ReportPhase.CITATIONS, done=len(builder.works_reports), total=len(works_by_id))
+
+
+async def finish_report(report_stream: AsyncIterator[ReportEvent | ReportFinished[ReportT]]) -> ReportT:
+    """Consume a report stream, discarding the partial results, until the report is finished.
+
+    The stream is consumed to the end, so that it is closed in the current task.
+
+    Args:
+        report_stream: Report stream, like the one of `stream_author_report`.
+
+    Returns:
+        Finished report.
+
+    Raises:
+        RuntimeError: The stream ended without a report.
+    """
+    report: ReportT | None = None
+    async for event in report_stream:
+        if isinstance(event, ReportFinished):
+            report = event.report
+
+    if report is None:
+        raise RuntimeError("The report stream ended without a report.")
+    return report
+
+
+PublicationDates = tuple[FromDate | None, ToDate | None]
+"""Publication date filters of a report or of one of its shards."""
+
+
+async def _get_works_counts_by_year(
+    client: httpx.AsyncClient, filters: str, limiter: RateLimiter, cache: ResponseCache | None = None
+) -> dict[int, int]:
+    """Count the works matching a filter by publication year, with a single request.
+
+    Args:
+        client: HTTPX asynchronous client to be used to make the requests.
+        filters: OpenAlex filter parameter value.
+        limiter: Rate limiter shared by all the requests.
+        cache: Response cache used to avoid repeated requests.
+
+    Returns:
+        Works count of each publication year with works.
+
+    Raises:
+        httpx.HTTPStatusError: The response from OpenAlex API had an error HTTP status of 4xx or 5xx.
+    """
+    url = f"https://api.openalex.org/works?filter={filters}&group_by=publication_year"
+    json_response = await _get_page(client, url, limiter, cache)
+    return {int(group["key"]): group["count"] for group in json_response["group_by"] if str(group["key"]).isdigit()}
+
+
+def _split_balanced(counts: Sequence[int], parts: int) -> list[int]:
+    """Split a sequence of counts into `parts` contiguous groups with the smallest maximum sum.
+
+    Returns:
+        Index where each group starts.
+    """
+
+    def _greedy_starts(capacity: int, fill: bool = False) -> list[int]:
+        starts, group_sum = [0], 0
+        for idx, count in enumerate(counts[1:], start=1):
+            group_sum += counts[idx - 1]
+            # With `fill`, the last counts are split further so that there are exactly `parts` groups.
+            if (group_sum + count > capacity and group_sum > 0) or (fill and len(counts) - idx <= parts - len(starts)):
+                starts.append(idx)
+                group_sum = 0
+        return starts
+
+    low, high = max(counts, default=0), sum(counts)
+    while low < high:
+        capacity = (low + high) // 2
+        if len(_greedy_starts(capacity)) <= parts:
+            high = capacity
+        else:
+            low = capacity + 1
+
+    return _greedy_starts(low, fill=True)
+
+
+def plan_publication_shards(
+    years_counts: Mapping[int, int],
+    shards: int,
+    pub_from_date: FromDate | None = None,
+    pub_to_date: ToDate | None = None,
+    max_works: int = CURSOR_PAGINATION_THRESHOLD,
+) -> list[PublicationDates]:
+    """Split the publication dates of a report into ranges of whole years with a balanced works count.
+
+    There are at least `shards` ranges, so that every worker is busy, and more if needed to keep each one
+    under `max_works`, so that its works are requested concurrently instead of with cursor paging. A single
+    year is never split. The years go from `pub_from_date` to `pub_to_date`, or are those of `years_counts`
+    when they are not given, and then the first and last ranges are open-ended.
+
+    Args:
+        years_counts: Works count of each publication year, like the one of `ReportSession.plan_institution_shards`.
+        shards: Minimum number of ranges. There are fewer if there are not enough years.
+        pub_from_date: Filter works published from this date.
+        pub_to_date: Filter works published up to this date.
+        max_works: Maximum works of a range, when possible.
+
+    Returns:
+        Publication date filters of each range, in date order.
+
+    Example:
+        ```python
+        from pub_analyzer.internal.report import plan_publication_shards
+
+        plan_publication_shards({2021: 12_000, 2022: 9_000, 2023: 3_000}, shards=2)
+        # [(None, ToDate(2021-12-31)), (FromDate(2022-01-01), None)]
+        ```
+    """
+    if not years_counts and (pub_from_date is None or pub_to_date is None):
+        return [(pub_from_date, pub_to_date)]
+
+    first_year = pub_from_date.year if pub_from_date else min(years_counts)
+    last_year = pub_to_date.year if pub_to_date else max(years_counts)
+    if first_year >= last_year:
+        return [(pub_from_date, pub_to_date)]
+
+    years = list(range(first_year, last_year + 1))
+    counts = [years_counts.get(year, 0) for year in years]
+    parts = min(len(years), max(shards, math.ceil(sum(counts) / max_works)))
+    if parts <= 1:
+        return [(pub_from_date, pub_to_date)]
+
+    starts = _split_balanced(counts, parts)
+    ranges: list[PublicationDates] = []
+    for idx, start in enumerate(starts):
+        from_date = FromDate(datetime.datetime(years[start], 1, 1)) if idx > 0 else pub_from_date
+        to_date = ToDate(datetime.datetime(years[starts[idx + 1]] - 1, 12, 31)) if idx < len(starts) - 1 else pub_to_date
+        ranges.append((from_date, to_date))
+
+    return ranges
+
+
+def _merge_works(reports: Sequence[AuthorReport | InstitutionReport | GroupReport]) -> list[WorkReport]:
+    """Join the works reports of many reports, each work only once.
+
+    A work found in several reports keeps the version of the last generated one, with the citations of all of them.
+
+    Args:
+        reports: Reports to be merged.
+
+    Returns:
+        Works reports sorted by publication date.
+    """
+    works_reports: dict[str, WorkReport] = {}
+    for report in sorted(reports, key=lambda report: report.generated_at.timestamp() if report.generated_at else -math.inf):
+        for work_report in report.works:
+            work_id = identifier.get_work_id(work_report.work)
+            if work_id not in works_reports:
+                works_reports[work_id] = work_report
+                continue
+
+            cited_by = {str(citation.work.id): citation.work for citation in works_reports[work_id].cited_by}
+            cited_by.update((str(citation.work.id), citation.work) for citation in work_report.cited_by)
+
+            cited_by_works = sorted(cited_by.values(), key=lambda cited_by_work: cited_by_work.publication_date or "")
+            works_reports[work_id] = _make_work_report(work_report.work, cited_by_works)
+
+    return sorted(works_reports.values(), key=lambda work_report: work_report.work.publication_date or "")
+
+
+def _merge_queries(queries: Sequence[ReportQuery | None]) -> ReportQuery | None:
+    """Profiles and filters of a merged report.
+
+    Args:
+        queries: Profiles and filters of each merged report.
+
+    Returns:
+        Filters covering the publication dates of all the reports, if they were made with the same profiles and
+            citation filters. Otherwise, none.
+    """
+    if not queries or any(query is None for query in queries):
+        return None
+
+    known_queries = [query for query in queries if query is not None]
+    first_query = known_queries[0]
+    if any(
+        (query.extra_profiles, query.cited_from_date, query.cited_to_date)
+        != (first_query.extra_profiles, first_query.cited_from_date, first_query.cited_to_date)
+        for query in known_queries
+    ):
+        return None
+
+    pub_from_dates = [query.pub_from_date for query in known_queries]
+    pub_to_dates = [query.pub_to_date for query in known_queries]
+    return first_query.model_copy(
+        update={
+            "pub_from_date": None if None in pub_from_dates else min(date for date in pub_from_dates if date),
+            "pub_to_date": None if None in pub_to_dates else max(date for date in pub_to_dates if date),
+        }
+    )
+
+
+def _get_merged_authors_members(reports: Sequence[AuthorReport], works: list[WorkReport]) -> list[GroupMemberReport]:
+    """Summarize the works of each author of many author reports, merged into a group.
+
+    A work counts for an author if it is in one of the reports of the author, so the works of the extra profiles
+    of a report are counted as well.
+
+    Args:
+        reports: Author reports of different authors.
+        works: Merged works reports.
+
+    Returns:
+        Summary of each author, in the order of their first report.
+    """
+    authors: dict[str, Author] = {}
+    authors_works_ids: dict[str, set[str]] = {}
+    for report in reports:
+        author_key = identifier.get_author_id(report.author)
+        authors.setdefault(author_key, report.author.model_copy(deep=True))
+        authors_works_ids.setdefault(author_key, set()).update(identifier.get_work_id(work_report.work) for work_report in report.works)
+
+    return [
+        _get_group_member(
+            author, [work_report for work_report in works if identifier.get_work_id(work_report.work) in authors_works_ids[author_key]]
+        )
+        for author_key, author in authors.items()
+    ]
+
+
+def _get_groups_authors(reports: Sequence[GroupReport]) -> list[Author]:
+    """Authors of all the members of many group reports, each one once.
+
+    Args:
+        reports: Group reports.
+
+    Returns:
+        Copies of the authors, in the order of their first group.
+    """
+    authors: dict[str, Author] = {}
+    for report in reports:
+        for member in report.members:
+            authors.setdefault(identifier.get_author_id(member.author), member.author.model_copy(deep=True))
+
+    return list(authors.values())
+
+
+@overload
+def merge_reports(reports: Sequence[AuthorReport]) -> AuthorReport | GroupReport: ...
+
+
+@overload
+def merge_reports(reports: Sequence[InstitutionReport]) -> InstitutionReport: ...
+
+
+@overload
+def merge_reports(reports: Sequence[GroupReport]) -> GroupReport: ...
+
+
+def merge_reports(
+    reports: Sequence[AuthorReport] | Sequence[InstitutionReport] | Sequence[GroupReport],
+) -> AuthorReport | InstitutionReport | GroupReport:
+    """Merge many reports of the same type into a single report, without requests to the API.
+
+    The works found in several reports are kept once, with the citations of all of them. The summaries, counts by
+    year and sources are computed again from the merged works. It was generated when the oldest report was, so
+    that refreshing it requests everything updated since then. The merged report is:
+
+    - For reports of the same author or institution, like pieces of different publication date ranges, a report
+        of that author or institution, whose publication date filters cover the ones of all the reports.
+    - For author reports of different authors, a `GroupReport` whose members are those authors. A work counts for
+        a member if it is in one of the reports of the member.
+    - For group reports, a group report of all their members.
+
+    Merging the reports of the publication date ranges of `plan_publication_shards`, made with the same citation
+    filters, gives the report made without ranges.
+
+    Args:
+        reports: Reports to be merged.
+
+    Returns:
+        Merged report Model.
+
+    Raises:
+        ValueError: There are no reports to merge, they are not of the same type, or they are institution reports of
+            different institutions.
+
+    Example:
+        ```python
+        from pub_analyzer.internal.report import merge_reports
+        from pub_analyzer.models.report import AuthorReport
+
+        reports = []
+        for path in ["report-2020.json", "report-2024.json"]:
+            with open(path, encoding="utf-8") as file:
+                reports.append(AuthorReport.model_validate_json(file.read()))
+
+        report = merge_reports(reports)
+        ```
+    """
+    if not reports:
+        raise ValueError("There are no reports to merge.")
+    if any(type(report) is not type(reports[0]) for report in reports):
+        raise ValueError("The reports to merge must be of the same type.")
+
+    institutions_ids = {identifier.get_institution_id(report.institution) for report in reports if isinstance(report, InstitutionReport)}
+    if len(institutions_ids) > 1:
+        raise ValueError("The institution reports to merge must be of the same institution.")
+
+    works = _merge_works(reports)
+
+    sources_by_id = {identifier.get_source_id(source): source for report in reports for source in report.sources_summary.sources}
+    sources_ids = [identifier.get_source_id(dehydrated_source) for dehydrated_source in _get_dehydrated_sources(works)]
+    sources = [sources_by_id[source_id] for source_id in sources_ids if source_id in sources_by_id]
+
+    generated_at = min((report.generated_at for report in reports if report.generated_at), default=None, key=lambda date: date.timestamp())
+
+    update: dict[str, Any] = {
+        "works": works,
+        "citation_summary": _get_citation_summary(works),
+        "open_access_summary": _get_open_access_summary(works),
+        "works_type_summary": _get_works_type_summary(works),
+        "sources_summary": _get_sources_summary(sources),
+        "generated_at": generated_at,
+    }
+    author_reports = [author_report for author_report in reports if isinstance(author_report, AuthorReport)]
+    if len({identifier.get_author_id(author_report.author) for author_report in author_reports}) > 1:
+        return GroupReport(members=_get_merged_authors_members(author_reports, works), **update)
+
+    first_report = reports[0]
+    match first_report:
+        case AuthorReport():
+            author = first_report.author.model_copy(deep=True)
+            author.counts_by_year = _get_counts_by_year(works, AuthorYearCount)
+            update["author"] = author
+            update["query"] = _merge_queries([author_report.query for author_report in author_reports])
+        case InstitutionReport():
+            institution = first_report.institution.model_copy(deep=True)
+            institution.counts_by_year = _get_counts_by_year(works, InstitutionYearCount)
+            update["institution"] = institution
+            update["query"] = _merge_queries(
+                [institution_report.query for institution_report in reports if isinstance(institution_report, InstitutionReport)]
+            )
+        case GroupReport():
+            group_reports = [group_report for group_report in reports if isinstance(group_report, GroupReport)]
+            update["members"] = _get_group_members(_get_groups_authors(group_reports), works)
+
+    return first_report.model_copy(update=update)
+
+
+class ReportSession:
+    """HTTP client, rate limiter and caches shared by many reports.
+
+    The module functions, like `make_author_report`, open a new session for every report. Reusing one session
+    keeps the HTTP/2 connections to the API open between reports, and the sources and entities already
+    retrieved are not requested again. A session must be used from a single event loop.
+
+    Example:
+        ```python
+        from pub_analyzer.internal.cache import get_default_cache
+        from pub_analyzer.internal.report import ReportSession
+
+        async with ReportSession(cache=get_default_cache()) as session:
+            for author_id in ["A5015201707", "A5090292188"]:
+                author = await session.get_author(author_id)
+                report = await session.make_author_report(author)
+        ```
+    """
+
+    def __init__(
+        self, cache: ResponseCache | None = None, limiter: RateLimiter | None = None, checkpoint_dir: pathlib.Path | None = None
+    ) -> None:
+        """Open a session.
+
+        Args:
+            cache: Response cache used to avoid repeated requests. Disabled by default.
+            limiter: Rate limiter of the requests. Defaults to the process-wide OpenAlex limiter.
+            checkpoint_dir: Directory where the progress is saved while each report is made. A failed or cancelled
+                report resumes from its checkpoint when it is made again with the same parameters. Disabled by default.
+        """
+        self.cache = cache
+        self.limiter = limiter or get_rate_limiter()
+        self.checkpoint_dir = checkpoint_dir
+        self.client = httpx.AsyncClient(http2=True, timeout=None)
+
+        self._sources: dict[str, Source] = {}
+        self._authors: dict[str, Author] = {}
+        self._institutions: dict[str, Institution] = {}
+
+    async def __aenter__(self) -> "ReportSession":
+        """Use the session as an asynchronous context manager, closed on exit."""
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        """Close the session."""
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """Close the HTTP connections of the session, once the requests shared with other sessions are finished."""
+        try:
+            await _wait_client_flights(self.client)
+        finally:
+            await self.client.aclose()
+
+    async def get_author(self, author_id: str) -> Author:
+        """Get an author, requesting it only the first time.
+
+        Args:
+            author_id: OpenAlex key or ID of the author.
+
+        Returns:
+            Author Model.
+
+        Raises:
+            httpx.HTTPStatusError: The response from OpenAlex API had an error HTTP status of 4xx or 5xx.
+        """
+        key = author_id.rstrip("/").rpartition("/")[2]
+        if key not in self._authors:
+            url = f"https://api.openalex.org/authors/{key}"
+            self._authors[key] = Author(**await _get_page(self.client, url, self.limiter, self.cache))
+        return self._authors[key].model_copy(deep=True)
+
+    async def get_institution(self, institution_id: str) -> Institution:
+        """Get an institution, requesting it only the first time.
+
+        Args:
+            institution_id: OpenAlex key or ID of the institution.
+
+        Returns:
+            Institution Model.
+
+        Raises:
+            httpx.HTTPStatusError: The response from OpenAlex API had an error HTTP status of 4xx or 5xx.
+        """
+        key = institution_id.rstrip("/").rpartition("/")[2]
+        if key not in self._institutions:
+            url = f"https://api.openalex.org/institutions/{key}"
+            self._institutions[key] = Institution(**await _get_page(self.client, url, self.limiter, self.cache))
+        return self._institutions[key].model_copy(deep=True)
+
+    async def _get_report_sources(
+        self,
+        works: list[WorkReport],
+        known_sources: list[Source],
+        ignore_errors: bool = False,
+        checkpoint: ReportCheckpoint | None = None,
+        stats: RequestStats | None = None,
+    ) -> list[Source]:
+        """Get the sources of the works, requesting only the ones not retrieved before by the session."""
+        sources = await _get_report_sources(
+            self.client,
+            works,
+            [*self._sources.values(), *known_sources],
+            self.limiter,
+            self.cache,
+            ignore_errors=ignore_errors,
+            checkpoint=checkpoint,
+            stats=stats,
+        )
+        self._sources.update((identifier.get_source_id(source), source) for source in sources)
+        return sources
+
+    async def stream_author_report(
+        self,
+        author: Author,
+        extra_profiles: list[Author | AuthorResult | DehydratedAuthor] | None = None,
+        pub_from_date: FromDate | None = None,
+        pub_to_date: ToDate | None = None,
+        cited_from_date: FromDate | None = None,
+        cited_to_date: ToDate | None = None,
+    ) -> AsyncIterator[ReportEvent | ReportFinished[AuthorReport]]:
+        """Make a scientific production report by Author, yielding the partial results as they arrive.
+
+        See the module function `stream_author_report`.
+
+        Args:
+            author: Author to whom the report is generated.
+            extra_profiles: List of author profiles whose works will be attached.
+
+            pub_from_date: Filter works published from this date.
+            pub_to_date: Filter works published up to this date.
+
+            cited_from_date: Filter works that cite the author, published after this date.
+            cited_to_date: Filter works that cite the author, published up to this date.
+
+        Yields:
+            Works as they are fetched, works reports as their citations complete, the sources, the progress of the
+                report after each one of them, and finally the report.
+
+        Raises:
+            httpx.HTTPStatusError: One response from OpenAlex API had an error HTTP status of 4xx or 5xx.
+        """
+        generated_at = datetime.datetime.now(tz=datetime.timezone.utc)
+
+        author_profiles_keys = _get_author_profiles_keys(author, extra_profiles)
+        profiles_query_parameter = "|".join(author_profiles_keys)
+
+        pub_from_filter = f",from_publication_date:{pub_from_date:%Y-%m-%d}" if pub_from_date else ""
+        pub_to_filter = f",to_publication_date:{pub_to_date:%Y-%m-%d}" if pub_to_date else ""
+        url = _get_works_url(f"author.id:{profiles_query_parameter}{pub_from_filter}{pub_to_filter}")
+
+        # Extra filters
+        cited_from_filter = f",from_publication_date:{cited_from_date:%Y-%m-%d}" if cited_from_date else ""
+        cited_to_filter = f",to_publication_date:{cited_to_date:%Y-%m-%d}" if cited_to_date else ""
+        cited_filters = f"{cited_from_filter}{cited_to_filter}"
+
+        checkpoint_dir = self.checkpoint_dir
+        checkpoint = ReportCheckpoint(get_checkpoint_path(checkpoint_dir, key=f"{url}{cited_filters}")) if checkpoint_dir else None
+
+        builder = _ReportBuilder()
+        tracker = ProgressTracker()
+
+        # Getting all the author works and all works that have cited the author, in batches.
+        async for event in _iter_works_reports(self.client, builder, [url], cited_filters, self.limiter, self.cache, checkpoint, tracker):
+            yield event
+        works = builder.works
+
+        # Replace counts by year
+        author.counts_by_year = _get_counts_by_year(works, AuthorYearCount)
+
+        # Get sources full info.
+        yield tracker.update(ReportPhase.SOURCES, done=0)
+        known_sources = checkpoint.sources if checkpoint else []
+        sources = await self._get_report_sources(works, known_sources, checkpoint=checkpoint, stats=tracker.stats)
+        yield SourcesFetched(sources=sources)
+        yield tracker.update(ReportPhase.SOURCES, done=len(sources), total=len(sources))
+
+        if checkpoint:
+            checkpoint.remove()
+
+        report = AuthorReport(
+            author=author,
+            works=works,
+            citation_summary=_get_citation_summary(works),
+            open_access_summary=_get_open_access_summary(works),
+            works_type_summary=_get_works_type_summary(works),
+            sources_summary=_get_sources_summary(sources),
+            generated_at=generated_at,
+            query=ReportQuery(
+                extra_profiles=author_profiles_keys[1:],
+                pub_from_date=pub_from_date,
+                pub_to_date=pub_to_date,
+                cited_from_date=cited_from_date,
+                cited_to_date=cited_to_date,
+            ),
+        )
+        yield ReportFinished(report=report)
+
+    async def make_author_report(
+        self,
+        author: Author,
+        extra_profiles: list[Author | AuthorResult | DehydratedAuthor] | None = None,
+        pub_from_date: FromDate | None = None,
+        pub_to_date: ToDate | None = None,
+        cited_from_date: FromDate | None = None,
+        cited_to_date: ToDate | None = None,
+    ) -> AuthorReport:
+        """Make a scientific production report by Author.
+
+        See the module function `make_author_report`.
+
+        Args:
+            author: Author to whom the report is generated.
+            extra_profiles: List of author profiles whose works will be attached.
+
+            pub_from_date: Filter works published from this date.
+            pub_to_date: Filter works published up to this date.
+
+            cited_from_date: Filter works that cite the author, published after this date.
+            cited_to_date: Filter works that cite the author, published up to this date.
+
+        Returns:
+            Author's scientific production report Model.
+
+        Raises:
+            httpx.HTTPStatusError: One response from OpenAlex API had an error HTTP status of 4xx or 5xx.
+        """
+        report_stream = self.stream_author_report(author, extra_profiles, pub_from_date, pub_to_date, cited_from_date, cited_to_date)
+        return await finish_report(report_stream)
+
+    async def stream_institution_report(
+        self,
+        institution: Institution,
+        extra_profiles: list[Institution | InstitutionResult | DehydratedInstitution] | None = None,
+        pub_from_date: FromDate | None = None,
+        pub_to_date: ToDate | None = None,
+        cited_from_date: FromDate | None = None,
+        cited_to_date: ToDate | None = None,
+    ) -> AsyncIterator[ReportEvent | ReportFinished[InstitutionReport]]:
+        """Make a scientific production report by Institution, yielding the partial results as they arrive.
+
+        See the module function `stream_institution_report`.
+
+        Args:
+            institution: Institution to which the report is generated.
+            extra_profiles: List of institutions profiles whose works will be attached.
+
+            pub_from_date: Filter works published from this date.
+            pub_to_date: Filter works published up to this date.
+
+            cited_from_date: Filter works that cite the institution, published after this date.
+            cited_to_date: Filter works that cite the institution, published up to this date.
+
+        Yields:
+            Works as they are fetched, works reports as their citations complete, the sources, the progress of the
+                report after each one of them, and finally the report.
+
+        Raises:
+            httpx.HTTPStatusError: One response from OpenAlex API had an error HTTP status of 4xx or 5xx.
+        """
+        generated_at = datetime.datetime.now(tz=datetime.timezone.utc)
+
+        institution_keys = _get_institution_keys(institution, extra_profiles)
+        institution_query_parameter = "|".join(institution_keys)
+
+        pub_from_filter = f",from_publication_date:{pub_from_date:%Y-%m-%d}" if pub_from_date else ""
+        pub_to_filter = f",to_publication_date:{pub_to_date:%Y-%m-%d}" if pub_to_date else ""
+        url = _get_works_url(f"institutions.id:{institution_query_parameter}{pub_from_filter}{pub_to_filter}")
+
+        # Extra filters
+        cited_from_filter = f",from_publication_date:{cited_from_date:%Y-%m-%d}" if cited_from_date else ""
+        cited_to_filter = f",to_publication_date:{cited_to_date:%Y-%m-%d}" if cited_to_date else ""
+        cited_filters = f"{cited_from_filter}{cited_to_filter}"
+
+        checkpoint_dir = self.checkpoint_dir
+        checkpoint = ReportCheckpoint(get_checkpoint_path(checkpoint_dir, key=f"{url}{cited_filters}")) if checkpoint_dir else None
+
+        builder = _ReportBuilder()
+        tracker = ProgressTracker()
+
+        # Getting all the institution works and all works that have cited a work, in batches.
+        async for event in _iter_works_reports(self.client, builder, [url], cited_filters, self.limiter, self.cache, checkpoint, tracker):
+            yield event
+        works = builder.works
+
+        # Replace counts by year
+        institution.counts_by_year = _get_counts_by_year(works, InstitutionYearCount)
+
+        # Get sources full info.
+        yield tracker.update(ReportPhase.SOURCES, done=0)
+        known_sources = checkpoint.sources if checkpoint else []
+        sources = await self._get_report_sources(works, known_sources, ignore_errors=True, checkpoint=checkpoint, stats=tracker.stats)
+        yield SourcesFetched(sources=sources)
+        yield tracker.update(ReportPhase.SOURCES, done=len(sources), total=len(sources))
+
+        if checkpoint:
+            checkpoint.remove()
+
+        report = InstitutionReport(
+            institution=institution,
+            works=works,
+            citation_summary=_get_citation_summary(works),
+            open_access_summary=_get_open_access_summary(works),
+            works_type_summary=_get_works_type_summary(works),
+            sources_summary=_get_sources_summary(sources),
+            generated_at=generated_at,
+            query=ReportQuery(
+                extra_profiles=institution_keys[1:],
+                pub_from_date=pub_from_date,
+                pub_to_date=pub_to_date,
+                cited_from_date=cited_from_date,
+                cited_to_date=cited_to_date,
+            ),
+        )
+        yield ReportFinished(report=report)
+
+    async def plan_institution_shards(
+        self,
+        institution: Institution,
+        shards: int,
+        extra_profiles: list[Institution | InstitutionResult | DehydratedInstitution] | None = None,
+        pub_from_date: FromDate | None = None,
+        pub_to_date: ToDate | None = None,
+    ) -> list[PublicationDates]:
+        """Split the publication dates of an institution report into ranges with a balanced works count.
+
+        The works count of each year is requested to the API, so the ranges are balanced also for the years
+        before the institution `counts_by_year`. See `plan_publication_shards`.
+
+        Args:
+            institution: Institution to which the report is generated.
+            shards: Minimum number of ranges.
+            extra_profiles: List of institutions profiles whose works will be attached.
+
+            pub_from_date: Filter works published from this date.
+            pub_to_date: Filter works published up to this date.
+
+        Returns:
+            Publication date filters of each range, in date order.
+
+        Raises:
+            httpx.HTTPStatusError: The response from OpenAlex API had an error HTTP status of 4xx or 5xx.
+        """
+        institution_query_parameter = "|".join(_get_institution_keys(institution, extra_profiles))
+        pub_from_filter = f",from_publication_date:{pub_from_date:%Y-%m-%d}" if pub_from_date else ""
+        pub_to_filter = f",to_publication_date:{pub_to_date:%Y-%m-%d}" if pub_to_date else ""
+
+        years_counts = await _get_works_counts_by_year(
+            self.client, f"institutions.id:{institution_query_parameter}{pub_from_filter}{pub_to_filter}", self.limiter, self.cache
+        )
+        return plan_publication_shards(years_counts, shards, pub_from_date, pub_to_date)
+
+    async def make_institution_report(
+        self,
+        institution: Institution,
+        extra_profiles: list[Institution | InstitutionResult | DehydratedInstitution] | None = None,
+        pub_from_date: FromDate | None = None,
+        pub_to_date: ToDate | None = None,
+        cited_from_date: FromDate | None = None,
+        cited_to_date: ToDate | None = None,
+        shards: int = 1,
+    ) -> InstitutionReport:
+        """Make a scientific production report by Institution.
+
+        See the module function `make_institution_report`.
+
+        Args:
+            institution: Institution to which the report is generated.
+            extra_profiles: List of institutions profiles whose works will be attached.
+
+            pub_from_date: Filter works published from this date.
+            pub_to_date: Filter works published up to this date.
+
+            cited_from_date: Filter works that cite the institution, published after this date.
+            cited_to_date: Filter works that cite the institution, published up to this date.
+
+            shards: Minimum number of publication date ranges made at the same time and merged. With one, the
+                works are requested in a single query.
+
+        Returns:
+            Institution's scientific production report Model.
+
+        Raises:
+            httpx.HTTPStatusError: One response from OpenAlex API had an error HTTP status of 4xx or 5xx.
+        """
+        if shards <= 1:
+            report_stream = self.stream_institution_report(
+                institution, extra_profiles, pub_from_date, pub_to_date, cited_from_date, cited_to_date
+            )
+            return await finish_report(report_stream)
+
+        ranges = await self.plan_institution_shards(institution, shards, extra_profiles, pub_from_date, pub_to_date)
+        log.info(f"Making the report in {len(ranges)} shards.")
+        reports = await asyncio.gather(
+            *(
+                finish_report(
+                    self.stream_institution_report(
+                        institution.model_copy(deep=True), extra_profiles, shard_from_date, shard_to_date, cited_from_date, cited_to_date
+                    )
+                )
+                for shard_from_date, shard_to_date in ranges
+            )
+        )
+        report = merge_reports(reports)
+        institution.counts_by_year = report.institution.counts_by_year
+        return report
+
+    async def stream_group_report(
+        self,
+        authors: list[Author],
+        pub_from_date: FromDate | None = None,
+        pub_to_date: ToDate | None = None,
+        cited_from_date: FromDate | None = None,
+        cited_to_date: ToDate | None = None,
+    ) -> AsyncIterator[ReportEvent | ReportFinished[GroupReport]]:
+        """Make a scientific production report by a group of authors, yielding the partial results as they arrive.
+
+        See the module function `stream_group_report`.
+
+        Args:
+            authors: Authors of the group.
+
+            pub_from_date: Filter works published from this date.
+            pub_to_date: Filter works published up to this date.
+
+            cited_from_date: Filter works that cite the group, published after this date.
+            cited_to_date: Filter works that cite the group, published up to this date.
+
+        Yields:
+            Works as they are fetched, works reports as their citations complete, the sources, the progress of the
+                report after each one of them, and finally the report.
+
+        Raises:
+            ValueError: There are no authors.
+            httpx.HTTPStatusError: One response from OpenAlex API had an error HTTP status of 4xx or 5xx.
+        """
+        if not authors:
+            raise ValueError("A group report needs at least one author.")
+
+        generated_at = datetime.datetime.now(tz=datetime.timezone.utc)
+
+        authors_keys = list(dict.fromkeys(identifier.get_author_id(author) for author in authors))
+
+        pub_from_filter = f",from_publication_date:{pub_from_date:%Y-%m-%d}" if pub_from_date else ""
+        pub_to_filter = f",to_publication_date:{pub_to_date:%Y-%m-%d}" if pub_to_date else ""
+        urls = [
+            _get_works_url(f"author.id:{'|'.join(authors_keys[idx : idx + AUTHORS_BATCH_SIZE])}{pub_from_filter}{pub_to_filter}")
+            for idx in range(0, len(authors_keys), AUTHORS_BATCH_SIZE)
+        ]
+
+        # Extra filters
+        cited_from_filter = f",from_publication_date:{cited_from_date:%Y-%m-%d}" if cited_from_date else ""
+        cited_to_filter = f",to_publication_date:{cited_to_date:%Y-%m-%d}" if cited_to_date else ""
+        cited_filters = f"{cited_from_filter}{cited_to_filter}"
+
+        checkpoint_dir = self.checkpoint_dir
+        checkpoint_key = f"{''.join(urls)}{cited_filters}"
+        checkpoint = ReportCheckpoint(get_checkpoint_path(checkpoint_dir, key=checkpoint_key)) if checkpoint_dir else None
+
+        builder = _ReportBuilder()
+        tracker = ProgressTracker()
+
+        # Getting the works of all the authors, each one once, and all works that have cited a work, in batches.
+        async for event in _iter_works_reports(self.client, builder, urls, cited_filters, self.limiter, self.cache, checkpoint, tracker):
+            yield event
+        works = sorted(builder.works, key=lambda work_report: work_report.work.publication_date or "")
+
+        # Summaries and counts by year of each author.
+        members = _get_group_members(authors, works)
+
+        # Get sources full info.
+        yield tracker.update(ReportPhase.SOURCES, done=0)
+        known_sources = checkpoint.sources if checkpoint else []
+        sources = await self._get_report_sources(works, known_sources, checkpoint=checkpoint, stats=tracker.stats)
+        yield SourcesFetched(sources=sources)
+        yield tracker.update(ReportPhase.SOURCES, done=len(sources), total=len(sources))
+
+        if checkpoint:
+            checkpoint.remove()
+
+        report = GroupReport(
+            members=members,
+            works=works,
+            citation_summary=_get_citation_summary(works),
+            open_access_summary=_get_open_access_summary(works),
+            works_type_summary=_get_works_type_summary(works),
+            sources_summary=_get_sources_summary(sources),
+            generated_at=generated_at,
+        )
+        yield ReportFinished(report=report)
+
+    async def make_group_report(
+        self,
+        authors: list[Author],
+        pub_from_date: FromDate | None = None,
+        pub_to_date: ToDate | None = None,
+        cited_from_date: FromDate | None = None,
+        cited_to_date: ToDate | None = None,
+    ) -> GroupReport:
+        """Make a scientific production report by a group of authors.
+
+        See the module function `make_group_report`.
+
+        Args:
+            authors: Authors of the group.
+
+            pub_from_date: Filter works published from this date.
+            pub_to_date: Filter works published up to this date.
+
+            cited_from_date: Filter works that cite the group, published after this date.
+            cited_to_date: Filter works that cite the group, published up to this date.
+
+        Returns:
+            Group's scientific production report Model.
+
+        Raises:
+            ValueError: There are no authors.
+            httpx.HTTPStatusError: One response from OpenAlex API had an error HTTP status of 4xx or 5xx.
+        """
+        report_stream = self.stream_group_report(authors, pub_from_date, pub_to_date, cited_from_date, cited_to_date)
+        return await finish_report(report_stream)
+
+    async def stream_refresh_author_report(
+        self,
+        report: AuthorReport,
+        since: datetime.datetime | None = None,
+        extra_profiles: list[Author | AuthorResult | DehydratedAuthor] | None = None,
+        pub_from_date: FromDate | None = None,
+        pub_to_date: ToDate | None = None,
+        cited_from_date: FromDate | None = None,
+        cited_to_date: ToDate | None = None,
+    ) -> AsyncIterator[ReportEvent | ReportFinished[AuthorReport]]:
+        """Refresh an Author report with the works and citations updated since it was generated, yielding the progress.
+
+        See the module function `stream_refresh_author_report`.
+
+        Args:
+            report: Existing Author report.
+            since: Only works and citations updated from this date are requested. Defaults to the report generation date.
+            extra_profiles: List of author profiles whose works will be attached. Defaults to the ones of the report.
+
+            pub_from_date: Filter works published from this date.
+            pub_to_date: Filter works published up to this date.
+
+            cited_from_date: Filter works that cite the author, published after this date.
+            cited_to_date: Filter works that cite the author, published up to this date.
+
+        Yields:
+            The progress of the refresh, the sources, and finally the refreshed report.
+
+        Raises:
+            ValueError: The report does not have a generation date and `since` is not defined.
+            httpx.HTTPStatusError: One response from OpenAlex API had an error HTTP status of 4xx or 5xx.
+        """
+        since = since or report.generated_at
+        if since is None:
+            raise ValueError("The report does not have a generation date, `since` must be defined.")
+
+        generated_at = datetime.datetime.now(tz=datetime.timezone.utc)
+        author = report.author.model_copy(deep=True)
+
+        extra_profiles_keys = _get_author_profiles_keys(author, extra_profiles)[1:] if extra_profiles is not None else None
+        query = _get_refresh_query(report.query, extra_profiles_keys, pub_from_date, pub_to_date, cited_from_date, cited_to_date)
+
+        profiles_query_parameter = "|".join([identifier.get_author_id(author), *query.extra_profiles])
+        pub_from_filter = f",from_publication_date:{query.pub_from_date:%Y-%m-%d}" if query.pub_from_date else ""
+        pub_to_filter = f",to_publication_date:{query.pub_to_date:%Y-%m-%d}" if query.pub_to_date else ""
+        cited_from_filter = f",from_publication_date:{query.cited_from_date:%Y-%m-%d}" if query.cited_from_date else ""
+        cited_to_filter = f",to_publication_date:{query.cited_to_date:%Y-%m-%d}" if query.cited_to_date else ""
+
+        tracker = ProgressTracker()
+        works_reports = {identifier.get_work_id(work_report.work): work_report for work_report in report.works}
+        async for event in _iter_refresh_works(
+            self.client,
+            works_reports=works_reports,
+            works_filter=f"author.id:{profiles_query_parameter}{pub_from_filter}{pub_to_filter}",
+            cited_filters=f"{cited_from_filter}{cited_to_filter}",
+            since=since,
+            limiter=self.limiter,
+            cache=self.cache,
+            tracker=tracker,
+        ):
+            yield event
+        works = _sort_works_reports(works_reports.values())
+        author.counts_by_year = _get_counts_by_year(works, AuthorYearCount)
+
+        yield tracker.update(ReportPhase.SOURCES, done=0)
+        sources = await self._get_report_sources(works, report.sources_summary.sources, stats=tracker.stats)
+        yield SourcesFetched(sources=sources)
+        yield tracker.update(ReportPhase.SOURCES, done=len(sources), total=len(sources))
+
+        refreshed_report = AuthorReport(
+            author=author,
+            works=works,
+            citation_summary=_get_citation_summary(works),
+            open_access_summary=_get_open_access_summary(works),
+            works_type_summary=_get_works_type_summary(works),
+            sources_summary=_get_sources_summary(sources),
+            generated_at=generated_at,
+            query=query,
+        )
+        yield ReportFinished(report=refreshed_report)
+
+    async def refresh_author_report(
+        self,
+        report: AuthorReport,
+        since: datetime.datetime | None = None,
+        extra_profiles: list[Author | AuthorResult | DehydratedAuthor] | None = None,
+        pub_from_date: FromDate | None = None,
+        pub_to_date: ToDate | None = None,
+        cited_from_date: FromDate | None = None,
+        cited_to_date: ToDate | None = None,
+    ) -> AuthorReport:
+        """Refresh an Author report with the works and citations updated since it was generated.
+
+        See the module function `refresh_author_report`.
+
+        Args:
+            report: Existing Author report.
+            since: Only works and citations updated from this date are requested. Defaults to the report generation date.
+            extra_profiles: List of author profiles whose works will be attached. Defaults to the ones of the report.
+
+            pub_from_date: Filter works published from this date.
+            pub_to_date: Filter works published up to this date.
+
+            cited_from_date: Filter works that cite the author, published after this date.
+            cited_to_date: Filter works that cite the author, published up to this date.
+
+        Returns:
+            Refreshed Author's scientific production report Model.
+
+        Raises:
+            ValueError: The report does not have a generation date and `since` is not defined.
+            httpx.HTTPStatusError: One response from OpenAlex API had an error HTTP status of 4xx or 5xx.
+        """
+        report_stream = self.stream_refresh_author_report(
+            report, since, extra_profiles, pub_from_date, pub_to_date, cited_from_date, cited_to_date
+        )
+        return await finish_report(report_stream)
+
+    async def stream_refresh_institution_report(
+        self,
+        report: InstitutionReport,
+        since: datetime.datetime | None = None,
+        extra_profiles: list[Institution | InstitutionResult | DehydratedInstitution] | None = None,
+        pub_from_date: FromDate | None = None,
+        pub_to_date: ToDate | None = None,
+        cited_from_date: FromDate | None = None,
+        cited_to_date: ToDate | None = None,
+    ) -> AsyncIterator[ReportEvent | ReportFinished[InstitutionReport]]:
+        """Refresh an Institution report with the works and citations updated since it was generated, yielding the progress.
+
+        See the module function `stream_refresh_institution_report`.
+
+        Args:
+            report: Existing Institution report.
+            since: Only works and citations updated from this date are requested. Defaults to the report generation date.
+            extra_profiles: List of institutions profiles whose works will be attached. Defaults to the ones of the report.
+
+            pub_from_date: Filter works published from this date.
+            pub_to_date: Filter works published up to this date.
+
+            cited_from_date: Filter works that cite the institution, published after this date.
+            cited_to_date: Filter works that cite the institution, published up to this date.
+
+        Yields:
+            The progress of the refresh, the sources, and finally the refreshed report.
+
+        Raises:
+            ValueError: The report does not have a generation date and `since` is not defined.
+            httpx.HTTPStatusError: One response from OpenAlex API had an error HTTP status of 4xx or 5xx.
+        """
+        since = since or report.generated_at
+        if since is None:
+            raise ValueError("The report does not have a generation date, `since` must be defined.")
+
+        generated_at = datetime.datetime.now(tz=datetime.timezone.utc)
+        institution = report.institution.model_copy(deep=True)
+
+        extra_profiles_keys = _get_institution_keys(institution, extra_profiles)[1:] if extra_profiles is not None else None
+        query = _get_refresh_query(report.query, extra_profiles_keys, pub_from_date, pub_to_date, cited_from_date, cited_to_date)
+
+        institution_query_parameter = "|".join([identifier.get_institution_id(institution), *query.extra_profiles])
+        pub_from_filter = f",from_publication_date:{query.pub_from_date:%Y-%m-%d}" if query.pub_from_date else ""
+        pub_to_filter = f",to_publication_date:{query.pub_to_date:%Y-%m-%d}" if query.pub_to_date else ""
+        cited_from_filter = f",from_publication_date:{query.cited_from_date:%Y-%m-%d}" if query.cited_from_date else ""
+        cited_to_filter = f",to_publication_date:{query.cited_to_date:%Y-%m-%d}" if query.cited_to_date else ""
+
+        tracker = ProgressTracker()
+        works_reports = {identifier.get_work_id(work_report.work): work_report for work_report in report.works}
+        async for event in _iter_refresh_works(
+            self.client,
+            works_reports=works_reports,
+            works_filter=f"institutions.id:{institution_query_parameter}{pub_from_filter}{pub_to_filter}",
+            cited_filters=f"{cited_from_filter}{cited_to_filter}",
+            since=since,
+            limiter=self.limiter,
+            cache=self.cache,
+            tracker=tracker,
+        ):
+            yield event
+        works = _sort_works_reports(works_reports.values())
+        institution.counts_by_year = _get_counts_by_year(works, InstitutionYearCount)
+
+        yield tracker.update(ReportPhase.SOURCES, done=0)
+        sources = await self._get_report_sources(works, report.sources_summary.sources, ignore_errors=True, stats=tracker.stats)
+        yield SourcesFetched(sources=sources)
+        yield tracker.update(ReportPhase.SOURCES, done=len(sources), total=len(sources))
+
+        refreshed_report = InstitutionReport(
+            institution=institution,
+            works=works,
+            citation_summary=_get_citation_summary(works),
+            open_access_summary=_get_open_access_summary(works),
+            works_type_summary=_get_works_type_summary(works),
+            sources_summary=_get_sources_summary(sources),
+            generated_at=generated_at,
+            query=query,
+        )
+        yield ReportFinished(report=refreshed_report)
+
+    async def refresh_institution_report(
+        self,
+        report: InstitutionReport,
+        since: datetime.datetime | None = None,
+        extra_profiles: list[Institution | InstitutionResult | DehydratedInstitution] | None = None,
+        pub_from_date: FromDate | None = None,
+        pub_to_date: ToDate | None = None,
+        cited_from_date: FromDate | None = None,
+        cited_to_date: ToDate | None = None,
+    ) -> InstitutionReport:
+        """Refresh an Institution report with the works and citations updated since it was generated.
+
+        See the module function `refresh_institution_report`.
+
+        Args:
+            report: Existing Institution report.
+            since: Only works and citations updated from this date are requested. Defaults to the report generation date.
+            extra_profiles: List of institutions profiles whose works will be attached. Defaults to the ones of the report.
+
+            pub_from_date: Filter works published from this date.
+            pub_to_date: Filter works published up to this date.
+
+            cited_from_date: Filter works that cite the institution, published after this date.
+            cited_to_date: Filter works that cite the institution, published up to this date.
+
+        Returns:
+            Refreshed Institution's scientific production report Model.
+
+        Raises:
+            ValueError: The report does not have a generation date and `since` is not defined.
+            httpx.HTTPStatusError: One response from OpenAlex API had an error HTTP status of 4xx or 5xx.
+        """
+        report_stream = self.stream_refresh_institution_report(
+            report, since, extra_profiles, pub_from_date, pub_to_date, cited_from_date, cited_to_date
+        )
+        return await finish_report(report_stream)
+
+
+async def stream_author_report(
+    author: Author,
+    extra_profiles: list[Author | AuthorResult | DehydratedAuthor] | None = None,
+    pub_from_date: FromDate | None = None,
+    pub_to_date: ToDate | None = None,
+    cited_from_date: FromDate | None = None,
+    cited_to_date: ToDate | None = None,
+    cache: ResponseCache | None = None,
+    limiter: RateLimiter | None = None,
+    checkpoint_dir: pathlib.Path | None = None,
+) -> AsyncIterator[ReportEvent | ReportFinished[AuthorReport]]:
+    """Make a scientific production report by Author, yielding the partial results as they arrive.
+
+    Takes the same arguments as `make_author_report`.
+
+    Args:
+        author: Author to whom the report is generated.
+        extra_profiles: List of author profiles whose works will be attached.
+
+        pub_from_date: Filter works published from this date.
+        pub_to_date: Filter works published up to this date.
+
+        cited_from_date: Filter works that cite the author, published after this date.
+        cited_to_date: Filter works that cite the author, published up to this date.
+
+        cache: Response cache used to avoid repeated requests. Disabled by default.
+        limiter: Rate limiter of the requests. Defaults to the process-wide OpenAlex limiter.
+        checkpoint_dir: Directory where the progress is saved while the report is made. A failed or cancelled
+            report resumes from its checkpoint when it is made again with the same parameters. Disabled by default.
+
+    Yields:
+        Works as they are fetched, works reports as their citations complete, the sources, the progress of the
+            report after each one of them, and finally the same report returned by `make_author_report`.
+
+    Raises:
+        httpx.HTTPStatusError: One response from OpenAlex API had an error HTTP status of 4xx or 5xx.
+
+    Example:
+        ```python
+        from pub_analyzer.internal.report import ReportFinished, WorkReportCompleted, stream_author_report
+
+        async for event in stream_author_report(author):
+            if isinstance(event, WorkReportCompleted):
+                print(f"{event.completed_count}/{event.works_count}: {event.work_report.work.title}")
+            elif isinstance(event, ReportFinished):
+                report = event.report
+        ```
+    """
+    async with ReportSession(cache, limiter, checkpoint_dir) as session:
+        async for event in session.stream_author_report(author, extra_profiles, pub_from_date, pub_to_date, cited_from_date, cited_to_date):
+            yield event
+
+
+async def make_author_report(
+    author: Author,
+    extra_profiles: list[Author | AuthorResult | DehydratedAuthor] | None = None,
+    pub_from_date: FromDate | None = None,
+    pub_to_date: ToDate | None = None,
+    cited_from_date: FromDate | None = None,
+    cited_to_date: ToDate | None = None,
+    cache: ResponseCache | None = None,
+    limiter: RateLimiter | None = None,
+    checkpoint_dir: pathlib.Path | None = None,
+) -> AuthorReport:
+    """Make a scientific production report by Author.
+
+    Args:
+        author: Author to whom the report is generated.
+        extra_profiles: List of author profiles whose works will be attached.
+
+        pub_from_date: Filter works published from this date.
+        pub_to_date: Filter works published up to this date.
+
+        cited_from_date: Filter works that cite the author, published after this date.
+        cited_to_date: Filter works that cite the author, published up to this date.
+
+        cache: Response cache used to avoid repeated requests. Disabled by default.
+        limiter: Rate limiter of the requests. Defaults to the process-wide OpenAlex limiter.
+        checkpoint_dir: Directory where the progress is saved while the report is made. A failed or cancelled
+            report resumes from its checkpoint when it is made again with the same parameters. Disabled by default.
+
+    Returns:
+        Author's scientific production report Model.
+
+    Raises:
+        httpx.HTTPStatusError: One response from OpenAlex API had an error HTTP status of 4xx or 5xx.
+    """
+    async with ReportSession(cache, limiter, checkpoint_dir) as session:
+        return await session.make_author_report(author, extra_profiles, pub_from_date, pub_to_date, cited_from_date, cited_to_date)
+
+
+async def stream_institution_report(
+    institution: Institution,
+    extra_profiles: list[Institution | InstitutionResult | DehydratedInstitution] | None = None,
+    pub_from_date: FromDate | None = None,
+    pub_to_date: ToDate | None = None,
+    cited_from_date: FromDate | None = None,
+    cited_to_date: ToDate | None = None,
+    cache: ResponseCache | None = None,
+    limiter: RateLimiter | None = None,
+    checkpoint_dir: pathlib.Path | None = None,
+) -> AsyncIterator[ReportEvent | ReportFinished[InstitutionReport]]:
+    """Make a scientific production report by Institution, yielding the partial results as they arrive.
+
+    Takes the same arguments as `make_institution_report`.
+
+    Args:
+        institution: Institution to which the report is generated.
+        extra_profiles: List of institutions profiles whose works will be attached.
+
+        pub_from_date: Filter works published from this date.
+        pub_to_date: Filter works published up to this date.
+
+        cited_from_date: Filter works that cite the institution, published after this date.
+        cited_to_date: Filter works that cite the institution, published up to this date.
+
+        cache: Response cache used to avoid repeated requests. Disabled by default.
+        limiter: Rate limiter of the requests. Defaults to the process-wide OpenAlex limiter.
+        checkpoint_dir: Directory where the progress is saved while the report is made. A failed or cancelled
+            report resumes from its checkpoint when it is made again with the same parameters. Disabled by default.
+
+    Yields:
+        Works as they are fetched, works reports as their citations complete, the sources, the progress of the
+            report after each one of them, and finally the same report returned by `make_institution_report`.
+
+    Raises:
+        httpx.HTTPStatusError: One response from OpenAlex API had an error HTTP status of 4xx or 5xx.
+    """
+    async with ReportSession(cache, limiter, checkpoint_dir) as session:
+        async for event in session.stream_institution_report(
+            institution, extra_profiles, pub_from_date, pub_to_date, cited_from_date, cited_to_date
+        ):
+            yield event
+
+
+async def make_institution_report(
+    institution: Institution,
+    extra_profiles: list[Institution | InstitutionResult | DehydratedInstitution] | None = None,
+    pub_from_date: FromDate | None = None,
+    pub_to_date: ToDate | None = None,
+    cited_from_date: FromDate | None = None,
+    cited_to_date: ToDate | None = None,
+    cache: ResponseCache | None = None,
+    limiter: RateLimiter | None = None,
+    checkpoint_dir: pathlib.Path | None = None,
+    shards: int = 1,
+) -> InstitutionReport:
+    """Make a scientific production report by Institution.
+
+    Args:
+        institution: Institution to which the report is generated.
+        extra_profiles: List of institutions profiles whose works will be attached.
+
+        pub_from_date: Filter works published from this date.
+        pub_to_date: Filter works published up to this date.
+
+        cited_from_date: Filter works that cite the institution, published after this date.
+        cited_to_date: Filter works that cite the institution, published up to this date.
+
+        cache: Response cache used to avoid repeated requests. Disabled by default.
+        limiter: Rate limiter of the requests. Defaults to the process-wide OpenAlex limiter.
+        checkpoint_dir: Directory where the progress is saved while the report is made. A failed or cancelled
+            report resumes from its checkpoint when it is made again with the same parameters. Disabled by default.
+        shards: Minimum number of publication date ranges made at the same time and merged, for very large
+            institutions. The ranges are balanced by their works count and kept under the paging limit of the API.
+
+    Returns:
+        Institution's scientific production report Model.
+
+    Raises:
+        httpx.HTTPStatusError: One response from OpenAlex API had an error HTTP status of 4xx or 5xx.
+    """
+    async with ReportSession(cache, limiter, checkpoint_dir) as session:
+        return await session.make_institution_report(
+            institution, extra_profiles, pub_from_date, pub_to_date, cited_from_date, cited_to_date, shards=shards
+        )
+
+
+async def stream_group_report(
+    authors: list[Author],
+    pub_from_date: FromDate | None = None,
+    pub_to_date: ToDate | None = None,
+    cited_from_date: FromDate | None = None,
+    cited_to_date: ToDate | None = None,
+    cache: ResponseCache | None = None,
+    limiter: RateLimiter | None = None,
+    checkpoint_dir: pathlib.Path | None = None,
+) -> AsyncIterator[ReportEvent | ReportFinished[GroupReport]]:
+    """Make a scientific production report by a group of authors, yielding the partial results as they arrive.
+
+    Takes the same arguments as `make_group_report`.
+
+    Args:
+        authors: Authors of the group.
+
+        pub_from_date: Filter works published from this date.
+        pub_to_date: Filter works published up to this date.
+
+        cited_from_date: Filter works that cite the group, published after this date.
+        cited_to_date: Filter works that cite the group, published up to this date.
+
+        cache: Response cache used to avoid repeated requests. Disabled by default.
+        limiter: Rate limiter of the requests. Defaults to the process-wide OpenAlex limiter.
+        checkpoint_dir: Directory where the progress is saved while the report is made. A failed or cancelled
+            report resumes from its checkpoint when it is made again with the same parameters. Disabled by default.
+
+    Yields:
+        Works as they are fetched, works reports as their citations complete, the sources, the progress of the
+            report after each one of them, and finally the same report returned by `make_group_report`.
+
+    Raises:
+        ValueError: There are no authors.
+        httpx.HTTPStatusError: One response from OpenAlex API had an error HTTP status of 4xx or 5xx.
+    """
+    async with ReportSession(cache, limiter, checkpoint_dir) as session:
+        async for event in session.stream_group_report(authors, pub_from_date, pub_to_date, cited_from_date, cited_to_date):
+            yield event
+
+
+async def make_group_report(
+    authors: list[Author],
+    pub_from_date: FromDate | None = None,
+    pub_to_date: ToDate | None = None,
+    cited_from_date: FromDate | None = None,
+    cited_to_date: ToDate | None = None,
+    cache: ResponseCache | None = None,
+    limiter: RateLimiter | None = None,
+    checkpoint_dir: pathlib.Path | None = None,
+) -> GroupReport:
+    """Make a scientific production report by a group of authors.
+
+    The works of all the authors are requested together, with their IDs combined with OR, so a work of several
+    authors of the group, and its citations, are requested only once. The citations are classified as in the
+    report of each author: type B when the citing work shares an author with the cited work. The report has the
+    summaries of the whole group, where each work counts once, and the summaries of each author, where a work
+    counts for each one of its authors in the group.
+
+    Args:
+        authors: Authors of the group.
+
+        pub_from_date: Filter works published from this date.
+        pub_to_date: Filter works published up to this date.
+
+        cited_from_date: Filter works that cite the group, published after this date.
+        cited_to_date: Filter works that cite the group, published up to this date.
+
+        cache: Response cache used to avoid repeated requests. Disabled by default.
+        limiter: Rate limiter of the requests. Defaults to the process-wide OpenAlex limiter.
+        checkpoint_dir: Directory where the progress is saved while the report is made. A failed or cancelled
+            report resumes from its checkpoint when it is made again with the same parameters. Disabled by default.
+
+    Returns:
+        Group's scientific production report Model.
+
+    Raises:
+        ValueError: There are no authors.
+        httpx.HTTPStatusError: One response from OpenAlex API had an error HTTP status of 4xx or 5xx.
+
+    Example:
+        ```python
+        from pub_analyzer.internal.report import ReportSession, make_group_report
+
+        async with ReportSession() as session:
+            authors = [await session.get_author(author_id) for author_id in ["A5015201707", "A5090292188"]]
+
+        report = await make_group_report(authors)
+        for member in report.members:
+            print(member.author.display_name, member.works_count, member.citation_summary.type_a_count)
+        ```
+    """
+    async with ReportSession(cache, limiter, checkpoint_dir) as session:
+        return await session.make_group_report(authors, pub_from_date, pub_to_date, cited_from_date, cited_to_date)
+
+
+async def stream_refresh_author_report(
+    report: AuthorReport,
+    since: datetime.datetime | None = None,
+    extra_profiles: list[Author | AuthorResult | DehydratedAuthor] | None = None,
+    pub_from_date: FromDate | None = None,
+    pub_to_date: ToDate | None = None,
+    cited_from_date: FromDate | None = None,
+    cited_to_date: ToDate | None = None,
+    cache: ResponseCache | None = None,
+    limiter: RateLimiter | None = None,
+) -> AsyncIterator[ReportEvent | ReportFinished[AuthorReport]]:
+    """Refresh an Author report with the works and citations updated since it was generated, yielding the progress.
+
+    Takes the same arguments as `refresh_author_report`.
+
+    Args:
+        report: Existing Author report.
+        since: Only works and citations updated from this date are requested. Defaults to the report generation date.
+        extra_profiles: List of author profiles whose works will be attached. Defaults to the ones of the report.
+
+        pub_from_date: Filter works published from this date.
+        pub_to_date: Filter works published up to this date.
+
+        cited_from_date: Filter works that cite the author, published after this date.
+        cited_to_date: Filter works that cite the author, published up to this date.
+
+        cache: Response cache used to avoid repeated requests. Disabled by default.
+        limiter: Rate limiter of the requests. Defaults to the process-wide OpenAlex limiter.
+
+    Yields:
+        The progress of the refresh, the sources, and finally the same report returned by `refresh_author_report`.
+
+    Raises:
+        ValueError: The report does not have a generation date and `since` is not defined.
+        httpx.HTTPStatusError: One response from OpenAlex API had an error HTTP status of 4xx or 5xx.
+    """
+    async with ReportSession(cache, limiter) as session:
+        report_stream = session.stream_refresh_author_report(
+            report, since, extra_profiles, pub_from_date, pub_to_date, cited_from_date, cited_to_date
+        )
+        async for event in report_stream:
+            yield event
+
+
+async def refresh_author_report(
+    report: AuthorReport,
+    since: datetime.datetime | None = None,
+    extra_profiles: list[Author | AuthorResult | DehydratedAuthor] | None = None,
+    pub_from_date: FromDate | None = None,
+    pub_to_date: ToDate | None = None,
+    cited_from_date: FromDate | None = None,
+    cited_to_date: ToDate | None = None,
+    cache: ResponseCache | None = None,
+    limiter: RateLimiter | None = None,
+) -> AuthorReport:
+    """Refresh an Author report with the works and citations updated since it was generated.
+
+    The profiles and filters default to the ones the report was made with. Reports saved by older versions do not
+    record them, so they must be given.
+
+    Args:
+        report: Existing Author report.
+        since: Only works and citations updated from this date are requested. Defaults to the report generation date.
+        extra_profiles: List of author profiles whose works will be attached. Defaults to the ones of the report.
+
+        pub_from_date: Filter works published from this date.
+        pub_to_date: Filter works published up to this date.
+
+        cited_from_date: Filter works that cite the author, published after this date.
+        cited_to_date: Filter works that cite the author, published up to this date.
+
+        cache: Response cache used to avoid repeated requests. Disabled by default.
+        limiter: Rate limiter of the requests. Defaults to the process-wide OpenAlex limiter.
+
+    Returns:
+        Refreshed Author's scientific production report Model.
+
+    Raises:
+        ValueError: The report does not have a generation date and `since` is not defined.
+        httpx.HTTPStatusError: One response from OpenAlex API had an error HTTP status of 4xx or 5xx.
+    """
+    async with ReportSession(cache, limiter) as session:
+        return await session.refresh_author_report(
+            report, since, extra_profiles, pub_from_date, pub_to_date, cited_from_date, cited_to_date
+        )
+
+
+async def stream_refresh_institution_report(
+    report: InstitutionReport,
+    since: datetime.datetime | None = None,
+    extra_profiles: list[Institution | InstitutionResult | DehydratedInstitution] | None = None,
+    pub_from_date: FromDate | None = None,
+    pub_to_date: ToDate | None = None,
+    cited_from_date: FromDate | None = None,
+    cited_to_date: ToDate | None = None,
+    cache: ResponseCache | None = None,
+    limiter: RateLimiter | None = None,
+) -> AsyncIterator[ReportEvent | ReportFinished[InstitutionReport]]:
+    """Refresh an Institution report with the works and citations updated since it was generated, yielding the progress.
+
+    Takes the same arguments as `refresh_institution_report`.
+
+    Args:
+        report: Existing Institution report.
+        since: Only works and citations updated from this date are requested. Defaults to the report generation date.
+        extra_profiles: List of institutions profiles whose works will be attached. Defaults to the ones of the report.
+
+        pub_from_date: Filter works published from this date.
+        pub_to_date: Filter works published up to this date.
+
+        cited_from_date: Filter works that cite the institution, published after this date.
+        cited_to_date: Filter works that cite the institution, published up to this date.
+
+        cache: Response cache used to avoid repeated requests. Disabled by default.
+        limiter: Rate limiter of the requests. Defaults to the process-wide OpenAlex limiter.
+
+    Yields:
+        The progress of the refresh, the sources, and finally the same report returned by `refresh_institution_report`.
+
+    Raises:
+        ValueError: The report does not have a generation date and `since` is not defined.
+        httpx.HTTPStatusError: One response from OpenAlex API had an error HTTP status of 4xx or 5xx.
+    """
+    async with ReportSession(cache, limiter) as session:
+        report_stream = session.stream_refresh_institution_report(
+            report, since, extra_profiles, pub_from_date, pub_to_date, cited_from_date, cited_to_date
+        )
+        async for event in report_stream:
+            yield event
+
+
+async def refresh_institution_report(
+    report: InstitutionReport,
+    since: datetime.datetime | None = None,
+    extra_profiles: list[Institution | InstitutionResult | DehydratedInstitution] | None = None,
+    pub_from_date: FromDate | None = None,
+    pub_to_date: ToDate | None = None,
+    cited_from_date: FromDate | None = None,
+    cited_to_date: ToDate | None = None,
+    cache: ResponseCache | None = None,
+    limiter: RateLimiter | None = None,
+) -> InstitutionReport:
+    """Refresh an Institution report with the works and citations updated since it was generated.
+
+    The profiles and filters default to the ones the report was made with. Reports saved by older versions do not
+    record them, so they must be given.
+
+    Args:
+        report: Existing Institution report.
+        since: Only works and citations updated from this date are requested. Defaults to the report generation date.
+        extra_profiles: List of institutions profiles whose works will be attached. Defaults to the ones of the report.
+
+        pub_from_date: Filter works published from this date.
+        pub_to_date: Filter works published up to this date.
+
+        cited_from_date: Filter works that cite the institution, published after this date.
+        cited_to_date: Filter works that cite the institution, published up to this date.
+
+        cache: Response cache used to avoid repeated requests. Disabled by default.
+        limiter: Rate limiter of the requests. Defaults to the process-wide OpenAlex limiter.
+
+    Returns:
+        Refreshed Institution's scientific production report Model.
+
+    Raises:
+        ValueError: The report does not have a generation date and `since` is not defined.
+        httpx.HTTPStatusError: One response from OpenAlex API had an error HTTP status of 4xx or 5xx.
+    """
+    async with ReportSession(cache, limiter) as session:
+        return await session.refresh_institution_report(
+            report, since, extra_profiles, pub_from_date, pub_to_date, cited_from_date, cited_to_date
+        )
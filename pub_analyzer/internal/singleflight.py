@@ -0,0 +1,81 @@
+"""Coalescing of identical concurrent requests."""
+
+import asyncio
+from collections.abc import Awaitable, Callable
+from typing import Generic, TypeVar
+
+T = TypeVar("T")
+
+
+class _Flight(Generic[T]):
+    """A call in progress and the number of callers waiting for it."""
+
+    def __init__(self, task: "asyncio.Task[T]") -> None:
+        self.task = task
+        self.waiters = 0
+
+
+class SingleFlight(Generic[T]):
+    """Run a single call at a time for each key; concurrent callers of the same key share its result.
+
+    Calls are only shared within the same event loop. The call is cancelled only when every caller waiting for
+    it has been cancelled.
+
+    Example:
+        ```python
+        from pub_analyzer.internal.cache import normalize_url
+        from pub_analyzer.internal.singleflight import SingleFlight
+
+        flights: SingleFlight[bytes] = SingleFlight()
+        content = await flights.do(normalize_url("https://api.openalex.org/sources/S1"), fetch_source)
+        ```
+    """
+
+    def __init__(self) -> None:
+        self._flights: dict[tuple[asyncio.AbstractEventLoop, str], _Flight[T]] = {}
+
+    def __len__(self) -> int:
+        """Number of calls in progress."""
+        return len(self._flights)
+
+    async def do(self, key: str, function: Callable[[], Awaitable[T]]) -> T:
+        """Call the function, or wait for the call already in progress for the same key.
+
+        Args:
+            key: Identifies the call, like a normalized URL.
+            function: Makes the call. Only invoked if there is no call in progress for the key.
+
+        Returns:
+            Result of the call.
+
+        Raises:
+            Exception: The exception raised by the call, to every caller.
+        """
+        loop = asyncio.get_running_loop()
+        flight_key = (loop, key)
+
+        flight = self._flights.get(flight_key)
+        if flight is None:
+
+            async def _call() -> T:
+                return await function()
+
+            flight = _Flight(loop.create_task(_call()))
+            self._flights[flight_key] = flight
+            flight.task.add_done_callback(lambda _: self._finish(flight_key, flight))
+
+        flight.waiters += 1
+        try:
+            return await asyncio.shield(flight.task)
+        except asyncio.CancelledError:
+            if flight.waiters == 1:
+                flight.task.cancel()
+                self._finish(flight_key, flight)
+            raise
+        finally:
+            flight.waiters -= 1
+
+    def _finish(self, key: tuple[asyncio.AbstractEventLoop, str], flight: _Flight[T]) -> None:
+        """Forget a finished call, so that later callers start a new one."""
+        if self._flights.get(key) is flight:
+            del self._flights[key]
@@ -1,5 +1,7 @@
 """Entry Point."""
 
+import argparse
+import sys
 import urllib.parse
 import webbrowser
 from typing import ClassVar
@@ -12,6 +14,7 @@ from textual.dom import DOMNode
 from textual.reactive import Reactive
 from textual.widgets import Footer
 
+from pub_analyzer.internal.batch import add_batch_arguments, run_batch_command
 from pub_analyzer.widgets.body import Body
 from pub_analyzer.widgets.sidebar import SideBar
 
@@ -76,6 +79,15 @@ class PubAnalyzerApp(App[DOMNode]):
 
 
 def run() -> None:
-    """Run Pub Analyzer App."""
+    """Run Pub Analyzer App, or the `batch` command to make reports without the TUI."""
+    parser = argparse.ArgumentParser(prog="pub-analyzer", description="Make scientific production reports from OpenAlex.")
+    subparsers = parser.add_subparsers(dest="command")
+    batch_parser = subparsers.add_parser("batch", help="Make the reports listed in a CSV file without the TUI.")
+    add_batch_arguments(batch_parser)
+
+    args = parser.parse_args()
+    if args.command == "batch":
+        sys.exit(run_batch_command(args))
+
     app = PubAnalyzerApp()
     app.run()
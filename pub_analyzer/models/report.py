@@ -1,5 +1,6 @@
 """Reports Structure Objects."""
 
+import datetime
 from enum import Enum
 
 from pydantic import BaseModel
@@ -7,7 +8,7 @@ from pydantic import BaseModel
 from .author import Author
 from .institution import Institution
 from .source import Source
-from .work import OpenAccessStatus, Work
+from .work import DehydratedWork, OpenAccessStatus, Work
 
 
 class CitationType(Enum):
@@ -20,7 +21,7 @@ class CitationType(Enum):
 class CitationReport(BaseModel):
     """Cited by Works with stats."""
 
-    work: Work
+    work: DehydratedWork
     citation_type: CitationType
 
 
@@ -87,6 +88,19 @@ class SourcesSummary(BaseModel):
     sources: list[Source]
 
 
+class ReportQuery(BaseModel):
+    """Profiles and filters a report was made with."""
+
+    extra_profiles: list[str] = []
+    """OpenAlex keys of the extra profiles whose works were attached."""
+
+    pub_from_date: datetime.datetime | None = None
+    pub_to_date: datetime.datetime | None = None
+
+    cited_from_date: datetime.datetime | None = None
+    cited_to_date: datetime.datetime | None = None
+
+
 class AuthorReport(BaseModel):
     """Report of scientific production of an author."""
 
@@ -98,6 +112,10 @@ class AuthorReport(BaseModel):
     works_type_summary: list[WorkTypeCounter]
     sources_summary: SourcesSummary
 
+    generated_at: datetime.datetime | None = None
+    query: ReportQuery | None = None
+    """Profiles and filters the report was made with. Not recorded by older versions."""
+
 
 class InstitutionReport(BaseModel):
     """Scientific production report of the Institution."""
@@ -109,3 +127,32 @@ class InstitutionReport(BaseModel):
     open_access_summary: OpenAccessSummary
     works_type_summary: list[WorkTypeCounter]
     sources_summary: SourcesSummary
+
+    generated_at: datetime.datetime | None = None
+    query: ReportQuery | None = None
+    """Profiles and filters the report was made with. Not recorded by older versions."""
+
+
+class GroupMemberReport(BaseModel):
+    """Summary of the works of an author in a group report."""
+
+    author: Author
+    works_count: int
+
+    citation_summary: CitationSummary
+    open_access_summary: OpenAccessSummary
+    works_type_summary: list[WorkTypeCounter]
+
+
+class GroupReport(BaseModel):
+    """Scientific production report of a group of authors, with each work only once."""
+
+    members: list[GroupMemberReport]
+    works: list[WorkReport]
+
+    citation_summary: CitationSummary
+    open_access_summary: OpenAccessSummary
+    works_type_summary: list[WorkTypeCounter]
+    sources_summary: SourcesSummary
+
+    generated_at: datetime.datetime | None = None
@@ -102,24 +102,18 @@ class Keyword(BaseModel):
     score: float
 
 
-class Work(BaseModel):
-    """Work Model Object from OpenAlex API definition."""
+class DehydratedWork(BaseModel):
+    """Stripped-down Work Model with the fields needed to describe a citing work."""
 
     id: HttpUrl
     ids: WorkIDs
 
     title: str
-    abstract: str | None = None
     publication_year: int | None = None
     publication_date: str | None = None
-    language: str | None = None
     type: str
 
     primary_location: Location | None = None
-    best_oa_location: Location | None = None
-    locations: list[Location]
-
-    open_access: WorkAccessInfo
     authorships: list[Authorship]
 
     cited_by_count: int
@@ -127,6 +121,33 @@ class Work(BaseModel):
        To use a verified number that respects the applied filters use [WorkReport][pub_analyzer.models.report.WorkReport].
     """
 
+    referenced_works: list[HttpUrl] = []
+
+    @field_validator("primary_location", "best_oa_location", mode="before", check_fields=False)
+    def valid_location(cls, location: dict[str, Any]) -> dict[str, Any] | None:
+        """Skip location that do not contain enough data."""
+        if location and location["landing_page_url"] is None:
+            return None
+        else:
+            return location
+
+    @field_validator("authorships", mode="before")
+    def valid_authorships(cls, authorships: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        """Skip authorship's that do not contain enough data."""
+        return [authorship for authorship in authorships if authorship["author"].get("id") is not None]
+
+
+class Work(DehydratedWork):
+    """Work Model Object from OpenAlex API definition."""
+
+    abstract: str | None = None
+    language: str | None = None
+
+    best_oa_location: Location | None = None
+    locations: list[Location]
+
+    open_access: WorkAccessInfo
+
     awards: list[Award]
     keywords: list[Keyword]
     concepts: list[DehydratedConcept]
@@ -143,16 +164,3 @@ class Work(BaseModel):
     def valid_locations(cls, locations: list[dict[str, Any]]) -> list[dict[str, Any]]:
         """Skip locations that do not contain enough data."""
         return [location for location in locations if location["landing_page_url"] is not None]
-
-    @field_validator("primary_location", "best_oa_location", mode="before")
-    def valid_location(cls, location: dict[str, Any]) -> dict[str, Any] | None:
-        """Skip location that do not contain enough data."""
-        if location and location["landing_page_url"] is None:
-            return None
-        else:
-            return location
-
-    @field_validator("authorships", mode="before")
-    def valid_authorships(cls, authorships: list[dict[str, Any]]) -> list[dict[str, Any]]:
-        """Skip authorship's that do not contain enough data."""
-        return [authorship for authorship in authorships if authorship["author"].get("id") is not None]
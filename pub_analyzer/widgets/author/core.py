@@ -9,10 +9,12 @@ from textual.containers import Container, Horizontal, Vertical
 from textual.widgets import Button, Collapsible, Label, Static
 
 from pub_analyzer.internal.identifier import get_author_id
+from pub_analyzer.internal.report import get_interactive_transport
 from pub_analyzer.models.author import Author, AuthorResult
 from pub_analyzer.widgets.common.filters import DateRangeFilter, Filter
 from pub_analyzer.widgets.common.summary import SummaryWidget
 from pub_analyzer.widgets.report.core import CreateAuthorReportWidget
+from pub_analyzer.widgets.report.estimate import ReportEstimateLabel
 
 from .cards import CitationMetricsCard, IdentifiersCard, LastInstitutionCard
 from .tables import AuthorWorksByYearTable
@@ -62,6 +64,10 @@ class _AuthorSummaryWidget(Static):
                 # Cite Date Range
                 yield DateRangeFilter(checkbox_label="Cited date range:", id="cited-date-range-filter")
 
+            # Estimate
+            with Horizontal(classes="info-container"):
+                yield ReportEstimateLabel(self.author, id="report-estimate")
+
             # Button
             with Vertical(classes="button-container"):
                 yield Button("Make Report", variant="primary", id="make-report-button")
@@ -85,7 +91,7 @@ class AuthorSummaryWidget(SummaryWidget):
         author_id = get_author_id(self.author_result)
         url = f"https://api.openalex.org/authors/{author_id}"
 
-        async with httpx.AsyncClient() as client:
+        async with httpx.AsyncClient(transport=get_interactive_transport()) as client:
             results = (await client.get(url)).json()
             self.author = Author(**results)
 
@@ -96,6 +102,20 @@ class AuthorSummaryWidget(SummaryWidget):
 
         self.loading = False
 
+    def _get_filters(self) -> dict[str, Any]:
+        """Get the report date ranges of the enabled filters."""
+        filters: dict[str, Any] = {}
+        pub_date_range = self.query_one("#author-date-range-filter", DateRangeFilter)
+        cited_date_range = self.query_one("#cited-date-range-filter", DateRangeFilter)
+
+        if not pub_date_range.filter_disabled:
+            filters.update({"pub_from_date": pub_date_range.from_date, "pub_to_date": pub_date_range.to_date})
+
+        if not cited_date_range.filter_disabled:
+            filters.update({"cited_from_date": cited_date_range.from_date, "cited_to_date": cited_date_range.to_date})
+
+        return filters
+
     @on(Filter.Changed)
     def filter_change(self) -> None:
         """Handle filter changes."""
@@ -104,19 +124,13 @@ class AuthorSummaryWidget(SummaryWidget):
 
         self.query_one("_AuthorSummaryWidget #make-report-button", Button).disabled = not all_filters_valid
 
+        if all_filters_valid:
+            self.query_one("_AuthorSummaryWidget #report-estimate", ReportEstimateLabel).update_estimate(**self._get_filters())
+
     @on(Button.Pressed, "#make-report-button")
     async def make_report(self) -> None:
         """Make the author report."""
-        filters: dict[str, Any] = {}
-        pub_date_range = self.query_one("#author-date-range-filter", DateRangeFilter)
-        cited_date_range = self.query_one("#cited-date-range-filter", DateRangeFilter)
-
-        if not pub_date_range.filter_disabled:
-            filters.update({"pub_from_date": pub_date_range.from_date, "pub_to_date": pub_date_range.to_date})
-
-        if not cited_date_range.filter_disabled:
-            filters.update({"cited_from_date": cited_date_range.from_date, "cited_to_date": cited_date_range.to_date})
-
+        filters = self._get_filters()
         report_widget = CreateAuthorReportWidget(author=self.author, **filters)
         await self.app.query_one("MainContent").mount(report_widget)
         await self.app.query_one("AuthorSummaryWidget").remove()
@@ -9,10 +9,12 @@ from textual.containers import Container, Horizontal, Vertical
 from textual.widgets import Button, Collapsible, Label, Static
 
 from pub_analyzer.internal.identifier import get_institution_id
+from pub_analyzer.internal.report import get_interactive_transport
 from pub_analyzer.models.institution import Institution, InstitutionResult
 from pub_analyzer.widgets.common.filters import DateRangeFilter, Filter
 from pub_analyzer.widgets.common.summary import SummaryWidget
 from pub_analyzer.widgets.report.core import CreateInstitutionReportWidget
+from pub_analyzer.widgets.report.estimate import ReportEstimateLabel
 
 from .cards import CitationMetricsCard, IdentifiersCard, RolesCard
 from .tables import InstitutionWorksByYearTable
@@ -62,6 +64,10 @@ class _InstitutionSummaryWidget(Static):
                 # Cite Date Range
                 yield DateRangeFilter(checkbox_label="Cited date range:", id="cited-date-range-filter")
 
+            # Estimate
+            with Horizontal(classes="info-container"):
+                yield ReportEstimateLabel(self.institution, id="report-estimate")
+
             # Button
             with Vertical(classes="block-container button-container"):
                 yield Button("Make Report", variant="primary", id="make-report-button")
@@ -85,7 +91,7 @@ class InstitutionSummaryWidget(SummaryWidget):
         institution_id = get_institution_id(self.institution_result)
         url = f"https://api.openalex.org/institutions/{institution_id}"
 
-        async with httpx.AsyncClient() as client:
+        async with httpx.AsyncClient(transport=get_interactive_transport()) as client:
             results = (await client.get(url)).json()
             self.institution = Institution(**results)
 
@@ -96,6 +102,20 @@ class InstitutionSummaryWidget(SummaryWidget):
 
         self.loading = False
 
+    def _get_filters(self) -> dict[str, Any]:
+        """Get the report date ranges of the enabled filters."""
+        filters: dict[str, Any] = {}
+        pub_date_range = self.query_one("#institution-date-range-filter", DateRangeFilter)
+        cited_date_range = self.query_one("#cited-date-range-filter", DateRangeFilter)
+
+        if not pub_date_range.filter_disabled:
+            filters.update({"pub_from_date": pub_date_range.from_date, "pub_to_date": pub_date_range.to_date})
+
+        if not cited_date_range.filter_disabled:
+            filters.update({"cited_from_date": cited_date_range.from_date, "cited_to_date": cited_date_range.to_date})
+
+        return filters
+
     @on(Filter.Changed)
     def filter_change(self) -> None:
         """Handle filter changes."""
@@ -104,19 +124,13 @@ class InstitutionSummaryWidget(SummaryWidget):
 
         self.query_one("_InstitutionSummaryWidget #make-report-button", Button).disabled = not all_filters_valid
 
+        if all_filters_valid:
+            self.query_one("_InstitutionSummaryWidget #report-estimate", ReportEstimateLabel).update_estimate(**self._get_filters())
+
     @on(Button.Pressed, "#make-report-button")
     async def make_report(self) -> None:
         """Make the author report."""
-        filters: dict[str, Any] = {}
-        pub_date_range = self.query_one("#institution-date-range-filter", DateRangeFilter)
-        cited_date_range = self.query_one("#cited-date-range-filter", DateRangeFilter)
-
-        if not pub_date_range.filter_disabled:
-            filters.update({"pub_from_date": pub_date_range.from_date, "pub_to_date": pub_date_range.to_date})
-
-        if not cited_date_range.filter_disabled:
-            filters.update({"cited_from_date": cited_date_range.from_date, "cited_to_date": cited_date_range.to_date})
-
+        filters = self._get_filters()
         report_widget = CreateInstitutionReportWidget(institution=self.institution, **filters)
         await self.app.query_one("MainContent").mount(report_widget)
         await self.app.query_one("InstitutionSummaryWidget").remove()
@@ -7,7 +7,7 @@ from textual.containers import Vertical, VerticalScroll
 from textual.widgets import Label
 
 from pub_analyzer.models.author import Author
-from pub_analyzer.models.report import AuthorReport, InstitutionReport, WorkReport
+from pub_analyzer.models.report import AuthorReport, GroupReport, InstitutionReport, WorkReport
 from pub_analyzer.models.work import Work
 from pub_analyzer.widgets.common import Card
 
@@ -16,7 +16,7 @@ from pub_analyzer.widgets.common import Card
 class ReportCitationMetricsCard(Card):
     """Citation metrics for this report."""
 
-    def __init__(self, report: AuthorReport | InstitutionReport) -> None:
+    def __init__(self, report: AuthorReport | InstitutionReport | GroupReport) -> None:
         self.report = report
         super().__init__()
 
@@ -37,7 +37,7 @@ class ReportCitationMetricsCard(Card):
 class WorksTypeSummaryCard(Card):
     """Works Type Counters Summary Card."""
 
-    def __init__(self, report: AuthorReport | InstitutionReport) -> None:
+    def __init__(self, report: AuthorReport | InstitutionReport | GroupReport) -> None:
         self.report = report
         super().__init__()
 
@@ -53,7 +53,7 @@ class WorksTypeSummaryCard(Card):
 class OpenAccessSummaryCard(Card):
     """Open Access counts for this report."""
 
-    def __init__(self, report: AuthorReport | InstitutionReport) -> None:
+    def __init__(self, report: AuthorReport | InstitutionReport | GroupReport) -> None:
         self.report = report
         super().__init__()
 
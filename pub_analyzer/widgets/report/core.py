@@ -1,7 +1,10 @@
 """Main Report widgets."""
 
+import asyncio
 import datetime
 import pathlib
+import threading
+from collections.abc import AsyncIterator
 from enum import Enum
 from time import time
 from typing import ClassVar
@@ -14,16 +17,31 @@ from textual.binding import Binding, BindingType
 from textual.containers import Container, Horizontal
 from textual.reactive import reactive
 from textual.widget import Widget
-from textual.widgets import Button, LoadingIndicator, Static, TabbedContent, TabPane
-
-from pub_analyzer.internal.report import FromDate, ToDate, make_author_report, make_institution_report
+from textual.widgets import Button, Label, ProgressBar, Static, TabbedContent, TabPane
+
+from pub_analyzer.internal.cache import get_default_cache
+from pub_analyzer.internal.checkpoint import get_default_checkpoint_dir
+from pub_analyzer.internal.progress import ReportProgress
+from pub_analyzer.internal.report import (
+    FromDate,
+    ReportEvent,
+    ReportFinished,
+    ReportT,
+    ToDate,
+    merge_reports,
+    stream_author_report,
+    stream_institution_report,
+    stream_refresh_author_report,
+    stream_refresh_institution_report,
+)
 from pub_analyzer.models.author import Author
 from pub_analyzer.models.institution import Institution
-from pub_analyzer.models.report import AuthorReport, InstitutionReport
+from pub_analyzer.models.report import AuthorReport, GroupReport, InstitutionReport
 from pub_analyzer.widgets.common import FileSystemSelector, Select
 
 from .author import AuthorReportPane
 from .export import ExportReportPane
+from .group import GroupReportPane
 from .institution import InstitutionReportPane
 from .source import SourcesReportPane
 from .work import WorkReportPane
@@ -86,12 +104,42 @@ class InstitutionReportWidget(ReportWidget):
                 yield ExportReportPane(report=self.report, suggest_prefix=suggest_prefix)
 
 
+class GroupReportWidget(ReportWidget):
+    """Group report view."""
+
+    def __init__(self, report: GroupReport) -> None:
+        self.report = report
+        super().__init__()
+
+    def compose(self) -> ComposeResult:
+        """Create main info container and with all the widgets."""
+        with TabbedContent(id="main-container"):
+            with TabPane("Group"):
+                yield GroupReportPane(report=self.report)
+            with TabPane("Works"):
+                yield WorkReportPane(report=self.report)
+            with TabPane("Sources"):
+                yield SourcesReportPane(report=self.report)
+            with TabPane("Export"):
+                yield ExportReportPane(report=self.report, suggest_prefix="group")
+
+
 class CreateReportWidget(Static):
-    """Base Widget report wrapper to load data from API."""
+    """Base Widget report wrapper to load data from API.
+
+    Reports are made in their own thread and event loop, so that decoding and validating the API responses do
+    not block the UI.
+    """
+
+    PROGRESS_INTERVAL: ClassVar[float] = 0.1
+    """Minimum seconds between two progress updates of the UI."""
+    CHECKPOINTED: ClassVar[bool] = True
+    """The progress of the report is saved to a checkpoint, so a failed report resumes when it is made again."""
 
     def compose(self) -> ComposeResult:
-        """Create main info container and showing a loading animation."""
-        yield LoadingIndicator()
+        """Create main info container and showing the report progress."""
+        yield ProgressBar(show_eta=False)
+        yield Label(id="report-progress")
         yield Container()
 
     def on_mount(self) -> None:
@@ -99,6 +147,60 @@ class CreateReportWidget(Static):
         self.query_one(Container).display = False
         self.run_worker(self.mount_report(), exclusive=True)
 
+    def show_progress(self, event: ReportProgress) -> None:
+        """Show the progress of the report while it is made.
+
+        Progress events are scheduled from the report thread, so they can arrive once the widget was removed.
+        """
+        if not self.is_mounted:
+            return
+
+        self.query_one(ProgressBar).update(total=event.total, progress=event.done)
+
+        done = f"{event.done}/{event.total}" if event.total is not None else f"{event.done}"
+        eta = f" ETA {event.eta}." if event.eta is not None else ""
+        self.query_one("#report-progress", Label).update(
+            f"[bold]{event.phase.value.title()}:[/bold] {done}. "
+            f"{event.requests_count} requests ({event.cache_hits} cached), {event.bytes_count / 1_000_000:.1f} MB, "
+            f"{event.throughput:.1f} req/s. Elapsed {event.elapsed}.{eta}"
+        )
+
+    async def run_report_stream(self, report_stream: AsyncIterator[ReportEvent | ReportFinished[ReportT]]) -> ReportT:
+        """Consume a report stream in a thread with its own event loop, showing its progress.
+
+        Args:
+            report_stream: Report stream, like the one of `stream_author_report`.
+
+        Returns:
+            Finished report.
+        """
+        ui_loop = asyncio.get_running_loop()
+        stopped = threading.Event()
+
+        async def _consume() -> ReportT | None:
+            updated_at = 0.0
+            async for event in report_stream:
+                if stopped.is_set():
+                    return None
+                if isinstance(event, ReportFinished):
+                    return event.report
+                if isinstance(event, ReportProgress) and (time() - updated_at >= self.PROGRESS_INTERVAL or event.done == event.total):
+                    updated_at = time()
+                    ui_loop.call_soon_threadsafe(self.show_progress, event)
+
+            raise RuntimeError("The report stream ended without a report.")
+
+        try:
+            report = await asyncio.to_thread(asyncio.run, _consume())
+        except asyncio.CancelledError:
+            # The thread can not be interrupted, it stops at the next event of the stream.
+            stopped.set()
+            raise
+
+        if report is None:
+            raise RuntimeError("The report was stopped.")
+        return report
+
     async def make_report(self) -> Widget:
         """Make report and create the widget."""
         raise NotImplementedError
@@ -110,11 +212,12 @@ class CreateReportWidget(Static):
             report_widget = await self.make_report()
             elapsed = time() - start
         except httpx.HTTPStatusError as exc:
-            self.query_one(LoadingIndicator).display = False
+            self.query_one(ProgressBar).display = False
             status_error = f"HTTP Exception for url: {exc.request.url}. Status code: {exc.response.status_code}"
+            retry_hint = "The progress was saved, make the report again to resume it." if self.CHECKPOINTED else "Try again later."
             self.app.notify(
                 title="Error making report!",
-                message=f"The report could not be generated due to a problem with the OpenAlex API. {status_error}",
+                message=f"The report could not be generated due to a problem with the OpenAlex API. {status_error}. {retry_hint}",
                 severity="error",
                 timeout=20.0,
             )
@@ -131,7 +234,8 @@ class CreateReportWidget(Static):
         await container.mount(report_widget)
 
         # Show results
-        self.query_one(LoadingIndicator).display = False
+        self.query_one(ProgressBar).display = False
+        self.query_one("#report-progress", Label).display = False
         container.display = True
 
 
@@ -166,13 +270,16 @@ class CreateAuthorReportWidget(CreateReportWidget):
         cited_from_date = FromDate(self.cited_from_date) if self.cited_from_date else None
         cited_to_date = ToDate(self.cited_to_date) if self.cited_to_date else None
 
-        report = await make_author_report(
+        report_stream = stream_author_report(
             author=self.author,
             pub_from_date=pub_from_date,
             pub_to_date=pub_to_date,
             cited_from_date=cited_from_date,
             cited_to_date=cited_to_date,
+            cache=get_default_cache(),
+            checkpoint_dir=get_default_checkpoint_dir(),
         )
+        report = await self.run_report_stream(report_stream)
         return AuthorReportWidget(report=report)
 
 
@@ -207,16 +314,42 @@ class CreateInstitutionReportWidget(CreateReportWidget):
         cited_from_date = FromDate(self.cited_from_date) if self.cited_from_date else None
         cited_to_date = ToDate(self.cited_to_date) if self.cited_to_date else None
 
-        report = await make_institution_report(
+        report_stream = stream_institution_report(
             institution=self.institution,
             pub_from_date=pub_from_date,
             pub_to_date=pub_to_date,
             cited_from_date=cited_from_date,
             cited_to_date=cited_to_date,
+            cache=get_default_cache(),
+            checkpoint_dir=get_default_checkpoint_dir(),
         )
+        report = await self.run_report_stream(report_stream)
         return InstitutionReportWidget(report=report)
 
 
+class RefreshReportWidget(CreateReportWidget):
+    """Widget report wrapper to update a saved report with the new data from API."""
+
+    CHECKPOINTED: ClassVar[bool] = False
+
+    def __init__(self, report: AuthorReport | InstitutionReport, since: datetime.datetime) -> None:
+        self.report = report
+        self.since = report.generated_at or since
+        super().__init__()
+
+    async def make_report(self) -> AuthorReportWidget | InstitutionReportWidget:
+        """Refresh report and create the widget."""
+        match self.report:
+            case AuthorReport():
+                author_report_stream = stream_refresh_author_report(report=self.report, since=self.since, cache=get_default_cache())
+                return AuthorReportWidget(report=await self.run_report_stream(author_report_stream))
+            case InstitutionReport():
+                institution_report_stream = stream_refresh_institution_report(
+                    report=self.report, since=self.since, cache=get_default_cache()
+                )
+                return InstitutionReportWidget(report=await self.run_report_stream(institution_report_stream))
+
+
 class LoadReportWidget(Static):
     """Widget report wrapper to load data from disk."""
 
@@ -231,21 +364,68 @@ class LoadReportWidget(Static):
 
     def __init__(self, entity_handler: EntityType = EntityType.AUTHOR) -> None:
         self.entity_handler = entity_handler
+        self.merge_paths: list[pathlib.Path] = []
         super().__init__()
 
     @on(FileSystemSelector.FileSelected)
     def enable_button(self, event: FileSystemSelector.FileSelected) -> None:
         """Enable button on file select."""
-        if event.file_selected:
-            self.query_one(Button).disabled = False
-        else:
-            self.query_one(Button).disabled = True
+        for button in self.query(Button).exclude("#merge-report-button"):
+            button.disabled = not event.file_selected
 
     @on(Button.Pressed, "#load-report-button")
     async def load_report(self) -> None:
         """Load Report."""
-        from pub_analyzer.widgets.body import MainContent
+        await self.open_report(refresh=False)
+
+    @on(Button.Pressed, "#refresh-report-button")
+    async def refresh_report(self) -> None:
+        """Load Report and update it with the works and citations added since it was generated."""
+        await self.open_report(refresh=True)
+
+    @on(Button.Pressed, "#add-merge-button")
+    def add_merge_report(self) -> None:
+        """Add the selected report file to the reports to be merged."""
+        file_path = self.query_one(FileSystemSelector).path_selected
+        if not file_path or file_path in self.merge_paths:
+            return
+
+        self.merge_paths.append(file_path)
+        merge_button = self.query_one("#merge-report-button", Button)
+        merge_button.label = f"Merge Reports ({len(self.merge_paths)})"
+        merge_button.disabled = len(self.merge_paths) < 2
+
+    @on(Button.Pressed, "#merge-report-button")
+    async def merge_report(self) -> None:
+        """Merge the added report files into a single report, without requests to the API.
+
+        The reports of different authors are merged into a group report.
+        """
+        merge_paths, self.merge_paths = self.merge_paths, []
+        merge_button = self.query_one("#merge-report-button", Button)
+        merge_button.label = "Merge Reports"
+        merge_button.disabled = True
+
+        try:
+            datas = [file_path.read_text(encoding="utf-8") for file_path in merge_paths]
+            match self.entity_handler:
+                case self.EntityType.AUTHOR:
+                    author_reports = [TypeAdapter(AuthorReport).validate_json(data) for data in datas]
+                    await self.show_report(await asyncio.to_thread(merge_reports, author_reports))
+                case self.EntityType.INSTITUTION:
+                    institution_reports = [TypeAdapter(InstitutionReport).validate_json(data) for data in datas]
+                    await self.show_report(await asyncio.to_thread(merge_reports, institution_reports))
+        except ValidationError:
+            self.notify_invalid_report()
+        except ValueError as error:
+            self.app.notify(title="Error merging reports!", message=str(error), severity="error", timeout=10.0)
 
+    async def open_report(self, refresh: bool) -> None:
+        """Open the selected report file.
+
+        Args:
+            refresh: Update the report with the new data from API before showing it.
+        """
         file_path = self.query_one(FileSystemSelector).path_selected
         if not file_path:
             return
@@ -253,31 +433,60 @@ class LoadReportWidget(Static):
         with open(file_path, encoding="utf-8") as file:
             data = file.read()
 
-        main_content = self.app.query_one(MainContent)
+        # Reports saved before the generation date was recorded are refreshed from the file modification date.
+        modified_at = datetime.datetime.fromtimestamp(pathlib.Path(file_path).stat().st_mtime, tz=datetime.timezone.utc)
+
         try:
             match self.entity_handler:
                 case self.EntityType.AUTHOR:
                     author_report: AuthorReport = TypeAdapter(AuthorReport).validate_json(data)
-                    author_report_widget = AuthorReportWidget(report=author_report)
-                    await main_content.query("*").exclude("#page-title").remove()
-
-                    await main_content.mount(author_report_widget)
-                    main_content.update_title(title=author_report.author.display_name)
-
+                    await self.show_report(author_report, refresh_since=modified_at if refresh else None)
                 case self.EntityType.INSTITUTION:
                     institution_report: InstitutionReport = TypeAdapter(InstitutionReport).validate_json(data)
-                    institution_report_widget = InstitutionReportWidget(report=institution_report)
-                    await main_content.query("*").exclude("#page-title").remove()
-
-                    await main_content.mount(institution_report_widget)
-                    main_content.update_title(title=institution_report.institution.display_name)
+                    await self.show_report(institution_report, refresh_since=modified_at if refresh else None)
         except ValidationError:
-            self.app.notify(
-                title="Error loading report!",
-                message="The report does not have the correct structure. This may be because it is an old version or because it is not of the specified type.",  # noqa: E501
-                severity="error",
-                timeout=10.0,
-            )
+            self.notify_invalid_report()
+
+    async def show_report(
+        self, report: AuthorReport | InstitutionReport | GroupReport, refresh_since: datetime.datetime | None = None
+    ) -> None:
+        """Show a report in the main view.
+
+        Args:
+            report: Report to be shown.
+            refresh_since: Update the report with the new data from API since this date, unless it records its generation
+                date, before showing it. Group reports are not refreshed.
+        """
+        from pub_analyzer.widgets.body import MainContent
+
+        main_content = self.app.query_one(MainContent)
+        report_widget: Widget
+        match report:
+            case AuthorReport() | InstitutionReport() if refresh_since:
+                report_widget = RefreshReportWidget(report=report, since=refresh_since)
+                title = report.author.display_name if isinstance(report, AuthorReport) else report.institution.display_name
+            case AuthorReport():
+                report_widget = AuthorReportWidget(report=report)
+                title = report.author.display_name
+            case InstitutionReport():
+                report_widget = InstitutionReportWidget(report=report)
+                title = report.institution.display_name
+            case GroupReport():
+                report_widget = GroupReportWidget(report=report)
+                title = f"Group of {len(report.members)} authors"
+
+        await main_content.query("*").exclude("#page-title").remove()
+        await main_content.mount(report_widget)
+        main_content.update_title(title=title)
+
+    def notify_invalid_report(self) -> None:
+        """Notify that a report file could not be loaded."""
+        self.app.notify(
+            title="Error loading report!",
+            message="The report does not have the correct structure. This may be because it is an old version or because it is not of the specified type.",  # noqa: E501
+            severity="error",
+            timeout=10.0,
+        )
 
     @on(Select.Changed)
     async def on_select_entity(self, event: Select.Changed) -> None:
@@ -306,3 +515,6 @@ class LoadReportWidget(Static):
 
         with Horizontal(classes="button-container"):
             yield Button("Load Report", variant="primary", disabled=True, id="load-report-button")
+            yield Button("Refresh Report", variant="default", disabled=True, id="refresh-report-button")
+            yield Button("Add to Merge", variant="default", disabled=True, id="add-merge-button")
+            yield Button("Merge Reports", variant="default", disabled=True, id="merge-report-button")
@@ -0,0 +1,40 @@
+"""Report estimate widgets."""
+
+from typing import Any
+
+from textual.widgets import Label
+
+from pub_analyzer.internal.estimate import estimate_report
+from pub_analyzer.models.author import Author
+from pub_analyzer.models.institution import Institution
+
+
+class ReportEstimateLabel(Label):
+    """Estimate of the cost of making the report of an author or institution.
+
+    The estimate is optional, so the label is hidden when it can not be made, for example when the
+    `PUB_ANALYZER_RATE_LIMIT` environment variable is not a positive number.
+    """
+
+    def __init__(self, entity: Author | Institution, id: str | None = None) -> None:
+        self.entity = entity
+        super().__init__(id=id)
+
+    def on_mount(self) -> None:
+        """Show the estimate of the report without filters."""
+        self.update_estimate()
+
+    def update_estimate(self, **filters: Any) -> None:
+        """Estimate the report again with new date ranges.
+
+        Args:
+            **filters: Date ranges accepted by `estimate_report`.
+        """
+        try:
+            estimate = estimate_report(self.entity, **filters)
+        except ValueError:
+            self.display = False
+            return
+
+        self.update(estimate.describe())
+        self.display = True
@@ -10,7 +10,7 @@ from textual.containers import Horizontal, Vertical, VerticalScroll
 from textual.widgets import Button, Label
 
 from pub_analyzer.internal.render import render_report
-from pub_analyzer.models.report import AuthorReport, InstitutionReport
+from pub_analyzer.models.report import AuthorReport, GroupReport, InstitutionReport
 from pub_analyzer.widgets.common import FileSystemSelector, Input, Select
 
 
@@ -34,7 +34,7 @@ class ExportReportPane(VerticalScroll):
     class ExportTypeSelector(Select[ExportFileType]):
         """Export file type selector."""
 
-    def __init__(self, report: AuthorReport | InstitutionReport, suggest_prefix: str = "") -> None:
+    def __init__(self, report: AuthorReport | InstitutionReport | GroupReport, suggest_prefix: str = "") -> None:
         self.report = report
         self.suggest_prefix = suggest_prefix
         super().__init__()
@@ -97,7 +97,7 @@ class ExportReportPane(VerticalScroll):
                 yield Label("[b]Name File:[/]", classes="export-form-label")
                 with Horizontal(classes="file-selector-container"):
                     type_options = list(self.ExportFileType.__members__.items())
-                    selector_disabled = isinstance(self.report, InstitutionReport)
+                    selector_disabled = not isinstance(self.report, AuthorReport)
 
                     yield Input(value=suggest_file_name, placeholder="report.json", classes="export-form-input")
                     yield self.ExportTypeSelector(
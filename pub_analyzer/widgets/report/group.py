@@ -0,0 +1,59 @@
+"""Group Report Widgets."""
+
+from urllib.parse import quote
+
+from rich.table import Table
+from textual.app import ComposeResult
+from textual.containers import Container, VerticalScroll
+from textual.widgets import Static
+
+from pub_analyzer.models.report import GroupReport
+
+
+class GroupMembersTable(Static):
+    """Table with the works and citations of each member of a group."""
+
+    def __init__(self, report: GroupReport) -> None:
+        self.report = report
+        super().__init__()
+
+    def compose(self) -> ComposeResult:
+        """Compose Table."""
+        table = Table("Author", "Works Count", "Type A", "Type B", title="Members", expand=True, show_lines=True)
+        for member in self.report.members:
+            external_id = member.author.orcid or member.author.id
+            author_name = f"""[@click=app.open_link("{quote(str(external_id))}")]{member.author.display_name}[/]"""
+            table.add_row(
+                author_name,
+                str(member.works_count),
+                str(member.citation_summary.type_a_count),
+                str(member.citation_summary.type_b_count),
+            )
+
+        yield Static(table)
+
+
+class GroupReportPane(VerticalScroll):
+    """Group report Pane Widget."""
+
+    DEFAULT_CSS = """
+    GroupReportPane {
+        layout: vertical;
+        overflow-x: hidden;
+        overflow-y: auto;
+    }
+
+    GroupReportPane .table-container {
+        margin: 1 0 0 0 ;
+        height: auto;
+    }
+    """
+
+    def __init__(self, report: GroupReport) -> None:
+        self.report = report
+        super().__init__()
+
+    def compose(self) -> ComposeResult:
+        """Compose content pane."""
+        with Container(classes="table-container"):
+            yield GroupMembersTable(report=self.report)
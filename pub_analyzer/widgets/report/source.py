@@ -8,7 +8,7 @@ from textual.app import ComposeResult
 from textual.containers import VerticalScroll
 from textual.widgets import Static
 
-from pub_analyzer.models.report import AuthorReport, InstitutionReport
+from pub_analyzer.models.report import AuthorReport, GroupReport, InstitutionReport
 from pub_analyzer.models.source import Source
 
 
@@ -81,7 +81,7 @@ class SourcesReportPane(VerticalScroll):
     }
     """
 
-    def __init__(self, report: AuthorReport | InstitutionReport) -> None:
+    def __init__(self, report: AuthorReport | InstitutionReport | GroupReport) -> None:
         self.report = report
         super().__init__()
 
@@ -14,7 +14,7 @@ from textual.containers import Horizontal, Vertical, VerticalScroll
 from textual.widgets import Button, Label, Static, TabbedContent, TabPane
 
 from pub_analyzer.models.author import Author
-from pub_analyzer.models.report import AuthorReport, CitationReport, CitationType, InstitutionReport, WorkReport
+from pub_analyzer.models.report import AuthorReport, CitationReport, CitationType, GroupReport, InstitutionReport, WorkReport
 from pub_analyzer.models.work import Location
 from pub_analyzer.widgets.common import FileSystemSelector, Input, Modal, ReactiveLabel, Select
 from pub_analyzer.widgets.report.cards import (
@@ -296,7 +296,7 @@ class WorksTable(Static):
     }
     """
 
-    def __init__(self, report: AuthorReport | InstitutionReport, show_empty_works: bool = True) -> None:
+    def __init__(self, report: AuthorReport | InstitutionReport | GroupReport, show_empty_works: bool = True) -> None:
         self.report = report
         self.show_empty_works = show_empty_works
         super().__init__()
@@ -304,7 +304,7 @@ class WorksTable(Static):
     class _WorksTableRenderer(Static):
         """Virtual Static Widget to handle table actions calls."""
 
-        def __init__(self, renderable: RenderableType, report: AuthorReport | InstitutionReport) -> None:
+        def __init__(self, renderable: RenderableType, report: AuthorReport | InstitutionReport | GroupReport) -> None:
             self.report = report
             super().__init__(renderable)
 
@@ -313,7 +313,7 @@ class WorksTable(Static):
             match self.report:
                 case AuthorReport():
                     self.app.push_screen(WorkModal(work_report=self.report.works[idx], author=self.report.author))
-                case InstitutionReport():
+                case InstitutionReport() | GroupReport():
                     self.app.push_screen(WorkModal(work_report=self.report.works[idx], author=None))
 
     def compose(self) -> ComposeResult:
@@ -365,7 +365,7 @@ class WorkReportPane(VerticalScroll):
     }
     """
 
-    def __init__(self, report: AuthorReport | InstitutionReport) -> None:
+    def __init__(self, report: AuthorReport | InstitutionReport | GroupReport) -> None:
         self.report = report
         super().__init__()
 
@@ -9,6 +9,7 @@ from textual.app import ComposeResult
 from textual.containers import Horizontal, VerticalScroll
 from textual.widgets import Static
 
+from pub_analyzer.internal.report import get_interactive_transport
 from pub_analyzer.models.author import AuthorResult
 from pub_analyzer.models.institution import InstitutionResult
 from pub_analyzer.widgets.common import Input, Select
@@ -47,7 +48,7 @@ class FinderWidget(Static):
 
     async def lookup(self, input: str) -> None:
         """Search in OpenAlex API."""
-        async with httpx.AsyncClient() as client:
+        async with httpx.AsyncClient(transport=get_interactive_transport()) as client:
             url = self.url.value + f"&q={input}"
             response = (await client.get(url)).json().get("results")
 
@@ -0,0 +1,154 @@
+"""Test batch reports from pub_analyzer/internal/batch.py."""
+
+import argparse
+import datetime
+import io
+import json
+import pathlib
+
+import httpx
+import pytest
+import respx
+
+from pub_analyzer.internal.batch import (
+    EXIT_INVALID_INPUT,
+    BatchJob,
+    EntityType,
+    OutputFormat,
+    add_batch_arguments,
+    make_summary_table,
+    read_batch_file,
+    run_batch,
+    run_batch_command,
+)
+from pub_analyzer.internal.limiter import RateLimiter
+from pub_analyzer.models.report import AuthorReport, InstitutionReport
+from tests.data.author import AUTHOR, AUTHOR_OPEN_ALEX_ID, DISPLAY_NAME
+from tests.data.institution import INSTITUTION, INSTITUTION_OPEN_ALEX_ID
+from tests.data.work import WORK
+
+
+def test_read_batch_file(tmp_path: pathlib.Path) -> None:
+    """Test read_batch_file function ignores empty cells and reads the dates of each row."""
+    path = tmp_path / "batch.csv"
+    path.write_text(
+        "entity,id,pub_from_date,pub_to_date,cited_from_date,cited_to_date,name,shards\n"
+        "author,A5015201707,2020-01-01,2023-12-31,,,,\n"
+        "institution,https://openalex.org/I8961855,,,,,uam,4\n",
+        encoding="utf-8",
+    )
+
+    jobs = read_batch_file(path)
+
+    assert [job.entity for job in jobs] == [EntityType.AUTHOR, EntityType.INSTITUTION]
+    assert jobs[0].pub_from_date == datetime.datetime(2020, 1, 1)
+    assert jobs[0].cited_to_date is None
+    assert [job.key for job in jobs] == ["A5015201707", "I8961855"]
+    assert [job.output_name for job in jobs] == ["author-A5015201707", "uam"]
+    assert [job.shards for job in jobs] == [1, 4]
+
+
+def test_read_batch_file_invalid_row(tmp_path: pathlib.Path) -> None:
+    """Test read_batch_file function reports the line of an invalid row."""
+    path = tmp_path / "batch.csv"
+    path.write_text("entity,id\nauthor,A5015201707\nfunder,F4320306076\n", encoding="utf-8")
+
+    with pytest.raises(ValueError, match="line 3"):
+        read_batch_file(path)
+
+
+def test_run_batch_command_misspelled_column(tmp_path: pathlib.Path) -> None:
+    """Test run_batch_command function rejects a misspelled column instead of making an unfiltered report."""
+    path = tmp_path / "batch.csv"
+    path.write_text("entity,id,pub_from\nauthor,A5015201707,2020-01-01\n", encoding="utf-8")
+
+    with pytest.raises(ValueError, match="Unknown columns in .*: pub_from"):
+        read_batch_file(path)
+
+    parser = argparse.ArgumentParser()
+    add_batch_arguments(parser)
+    assert run_batch_command(parser.parse_args([str(path), "-o", str(tmp_path / "reports")])) == EXIT_INVALID_INPUT
+    assert not (tmp_path / "reports").exists()
+
+
+@pytest.mark.parametrize("argument", ["-j", "-p"])
+def test_add_batch_arguments_positive(argument: str) -> None:
+    """Test add_batch_arguments function rejects a concurrency or processes lower than one."""
+    parser = argparse.ArgumentParser()
+    add_batch_arguments(parser)
+
+    assert parser.parse_args(["batch.csv", argument, "2"]).file == pathlib.Path("batch.csv")
+    with pytest.raises(SystemExit) as exc_info:
+        parser.parse_args(["batch.csv", argument, "0"])
+    assert exc_info.value.code == EXIT_INVALID_INPUT
+
+
+@pytest.mark.asyncio
+async def test_run_batch(tmp_path: pathlib.Path) -> None:
+    """Test run_batch function writes the report files and records failures without stopping the other reports."""
+    jobs = [
+        BatchJob(entity=EntityType.AUTHOR, id=AUTHOR_OPEN_ALEX_ID),
+        BatchJob(entity=EntityType.AUTHOR, id="A0000000000"),
+    ]
+
+    with respx.mock(assert_all_mocked=True) as respx_mock:
+        respx_mock.get(f"https://api.openalex.org/authors/{AUTHOR_OPEN_ALEX_ID}").mock(
+            return_value=httpx.Response(status_code=httpx.codes.OK, json=AUTHOR)
+        )
+        respx_mock.get("https://api.openalex.org/authors/A0000000000").mock(return_value=httpx.Response(status_code=httpx.codes.NOT_FOUND))
+        respx_mock.get(host="api.openalex.org", path="/works").mock(
+            return_value=httpx.Response(status_code=httpx.codes.OK, json={"meta": {"count": 0, "page": 1, "per_page": 100}, "results": []})
+        )
+
+        progress_file = io.StringIO()
+        results = await run_batch(
+            jobs,
+            output_dir=tmp_path,
+            formats=[OutputFormat.JSON],
+            limiter=RateLimiter(rate=8, per_second=1.0),
+            progress_file=progress_file,
+        )
+
+    assert [result.error is None for result in results] == [True, False]
+    assert results[0].display_name == DISPLAY_NAME
+    assert results[0].works_count == 0
+    assert results[0].outputs == [tmp_path / f"author-{AUTHOR_OPEN_ALEX_ID}.json"]
+    assert AuthorReport.model_validate_json(results[0].outputs[0].read_text(encoding="utf-8")).author.display_name == DISPLAY_NAME
+    assert {json.loads(line)["id"] for line in progress_file.getvalue().splitlines()} == {AUTHOR_OPEN_ALEX_ID}
+    assert make_summary_table(results).row_count == 2
+
+
+@pytest.mark.asyncio
+async def test_run_batch_shards(tmp_path: pathlib.Path) -> None:
+    """Test run_batch function makes balanced shards of an institution report and merges them in publication order."""
+
+    def works_page(request: httpx.Request) -> httpx.Response:
+        if "group_by" in request.url.params:
+            groups = [{"key": str(year), "count": 1} for year in (2020, 2022, 2023)]
+            return httpx.Response(status_code=httpx.codes.OK, json={"meta": {"count": 3}, "group_by": groups})
+
+        filters = dict(item.split(":", 1) for item in request.url.params["filter"].split(","))
+        year = filters.get("from_publication_date", "2020")[:4]
+        work = {
+            **WORK,
+            "id": f"https://openalex.org/W{year}",
+            "publication_date": f"{year}-03-01",
+            "publication_year": int(year),
+            "cited_by_count": 0,
+        }
+        return httpx.Response(status_code=httpx.codes.OK, json={"meta": {"count": 1, "page": 1, "per_page": 100}, "results": [work]})
+
+    with respx.mock(assert_all_mocked=True) as respx_mock:
+        respx_mock.get(f"https://api.openalex.org/institutions/{INSTITUTION_OPEN_ALEX_ID}").mock(
+            return_value=httpx.Response(status_code=httpx.codes.OK, json=INSTITUTION)
+        )
+        works_route = respx_mock.get(host="api.openalex.org", path="/works").mock(side_effect=works_page)
+
+        job = BatchJob(entity=EntityType.INSTITUTION, id=INSTITUTION_OPEN_ALEX_ID, shards=3)
+        results = await run_batch([job], output_dir=tmp_path, limiter=RateLimiter(rate=8, per_second=1.0))
+
+    assert results[0].error is None
+    assert works_route.call_count == 4
+    institution_report = InstitutionReport.model_validate_json(results[0].outputs[0].read_text(encoding="utf-8"))
+    assert [work_report.work.publication_date for work_report in institution_report.works] == ["2020-03-01", "2022-03-01", "2023-03-01"]
+    assert sorted(year_count.year for year_count in institution_report.institution.counts_by_year) == [2020, 2022, 2023]
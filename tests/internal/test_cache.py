@@ -0,0 +1,115 @@
+"""Test response cache from pub_analyzer/internal/cache.py."""
+
+import asyncio
+import datetime
+import os
+import pathlib
+
+import httpx
+import pytest
+import respx
+
+from pub_analyzer.internal import cache as cache_module
+from pub_analyzer.internal.cache import CacheTransport, ResponseCache, get_ttl, normalize_url
+
+
+@pytest.mark.parametrize(
+    ["url", "expected_url"],
+    [
+        ["https://api.openalex.org/sources/S1", "https://api.openalex.org/sources/S1"],
+        [
+            "https://API.openalex.org/works?per-page=100&filter=cites:W1&sort=publication_date",
+            "https://api.openalex.org/works?filter=cites%3AW1&per-page=100&sort=publication_date",
+        ],
+    ],
+)
+def test_normalize_url(url: str, expected_url: str) -> None:
+    """Test normalize_url function."""
+    assert normalize_url(url) == expected_url
+
+
+@pytest.mark.parametrize(
+    ["url", "expected_ttl"],
+    [
+        ["https://api.openalex.org/sources?filter=openalex:S1", datetime.timedelta(days=7)],
+        ["https://api.openalex.org/autocomplete/authors?q=molina", datetime.timedelta(hours=1)],
+        ["https://api.openalex.org/funders/F1", cache_module.DEFAULT_TTL],
+    ],
+)
+def test_get_ttl(url: str, expected_ttl: datetime.timedelta) -> None:
+    """Test get_ttl function."""
+    assert get_ttl(url) == expected_ttl
+
+
+def test_response_cache(tmp_path: pathlib.Path) -> None:
+    """Test stored responses are returned until they expire."""
+    cache = ResponseCache(path=tmp_path / "cache.sqlite3")
+    url = "https://api.openalex.org/works?filter=cites:W1&per-page=100"
+
+    assert cache.get(url) is None
+    cache.set(url, b'{"results": []}')
+    assert cache.get("https://api.openalex.org/works?per-page=100&filter=cites:W1") == b'{"results": []}'
+
+    refreshing_cache = ResponseCache(path=tmp_path / "cache.sqlite3", refresh=True)
+    assert refreshing_cache.get(url) is None
+
+    cache.clear()
+    assert cache.get(url) is None
+
+
+def test_response_cache_expiration(tmp_path: pathlib.Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test expired responses are discarded."""
+    monkeypatch.setitem(cache_module.CACHE_TTL, "works", datetime.timedelta(seconds=-1))
+    cache = ResponseCache(path=tmp_path / "cache.sqlite3")
+    url = "https://api.openalex.org/works?filter=cites:W1"
+
+    cache.set(url, b"{}")
+    assert cache.get(url) is None
+
+
+def test_response_cache_eviction(tmp_path: pathlib.Path) -> None:
+    """Test least recently used responses are evicted when the cache is full."""
+    content = os.urandom(1024)
+    cache = ResponseCache(path=tmp_path / "cache.sqlite3", max_size=int(len(content) * 2.5))
+
+    cache.set("https://api.openalex.org/sources/S1", content)
+    cache.set("https://api.openalex.org/sources/S2", content)
+    assert cache.get("https://api.openalex.org/sources/S1") == content
+
+    cache.set("https://api.openalex.org/sources/S3", content)
+    assert cache.get("https://api.openalex.org/sources/S1") == content
+    assert cache.get("https://api.openalex.org/sources/S2") is None
+    assert cache.get("https://api.openalex.org/sources/S3") == content
+
+
+@pytest.mark.asyncio
+async def test_cache_transport(tmp_path: pathlib.Path) -> None:
+    """Test cache transport only sends the first request."""
+    url = "https://api.openalex.org/authors/A1"
+    cache = ResponseCache(path=tmp_path / "cache.sqlite3")
+
+    with respx.mock(assert_all_mocked=True) as respx_mock:
+        route = respx_mock.get(url).mock(return_value=httpx.Response(status_code=httpx.codes.OK, json={"id": "A1"}))
+
+        async with httpx.AsyncClient(transport=CacheTransport(cache)) as client:
+            first_response = (await client.get(url)).json()
+            second_response = (await client.get(url)).json()
+            await client.get(url, headers={"Cache-Control": "no-cache"})
+
+    assert first_response == second_response == {"id": "A1"}
+    assert route.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_cache_transport_coalesced() -> None:
+    """Test cache transport sends concurrent requests of the same URL once, even without a cache."""
+    url = "https://api.openalex.org/authors/A1"
+
+    with respx.mock(assert_all_mocked=True) as respx_mock:
+        route = respx_mock.get(url).mock(return_value=httpx.Response(status_code=httpx.codes.OK, json={"id": "A1"}))
+
+        async with httpx.AsyncClient(transport=CacheTransport(None)) as client:
+            responses = await asyncio.gather(client.get(url), client.get(url))
+
+    assert [response.json() for response in responses] == [{"id": "A1"}, {"id": "A1"}]
+    assert route.call_count == 1
@@ -0,0 +1,79 @@
+"""Test report checkpoints from pub_analyzer/internal/checkpoint.py."""
+
+import os
+import pathlib
+
+import pytest
+
+from pub_analyzer.internal import checkpoint as checkpoint_module
+from pub_analyzer.internal.checkpoint import ReportCheckpoint, get_checkpoint_path, get_default_checkpoint_dir
+from pub_analyzer.models.source import Source
+from pub_analyzer.models.work import DehydratedWork, Work
+from tests.data.source import SOURCE
+from tests.data.work import WORK
+
+
+def test_get_checkpoint_path(tmp_path: pathlib.Path) -> None:
+    """Test get_checkpoint_path function depends only on the key."""
+    first_path = get_checkpoint_path(tmp_path, key="https://api.openalex.org/works?filter=author.id:A1")
+    second_path = get_checkpoint_path(tmp_path, key="https://api.openalex.org/works?filter=author.id:A2")
+
+    assert first_path.parent == tmp_path
+    assert first_path == get_checkpoint_path(tmp_path, key="https://api.openalex.org/works?filter=author.id:A1")
+    assert first_path != second_path
+
+
+def test_report_checkpoint(tmp_path: pathlib.Path) -> None:
+    """Test saved progress is loaded by a new checkpoint, ignoring a truncated last line."""
+    path = tmp_path / "checkpoint.jsonl"
+    work = Work(**WORK)
+    citing_work = DehydratedWork(**WORK)
+    source = Source(**SOURCE)
+
+    checkpoint = ReportCheckpoint(path)
+    checkpoint.save_works([work])
+    checkpoint.save_cited_by({"W1": [citing_work]})
+    checkpoint.save_cited_by({"W2": []})
+    checkpoint.save_sources([source])
+    with open(path, mode="a", encoding="utf-8") as file:
+        file.write('{"cited_by": {"W3": [')
+
+    resumed_checkpoint = ReportCheckpoint(path)
+    assert resumed_checkpoint.works == [work]
+    assert resumed_checkpoint.cited_by == {"W1": [citing_work], "W2": []}
+    assert resumed_checkpoint.sources == [source]
+
+    resumed_checkpoint.remove()
+    assert not path.exists()
+
+
+def test_report_checkpoint_expiration(tmp_path: pathlib.Path) -> None:
+    """Test checkpoints older than CHECKPOINT_MAX_AGE are discarded."""
+    path = tmp_path / "checkpoint.jsonl"
+    ReportCheckpoint(path).save_cited_by({"W1": []})
+
+    expired_mtime = path.stat().st_mtime - checkpoint_module.CHECKPOINT_MAX_AGE.total_seconds() - 1
+    os.utime(path, (expired_mtime, expired_mtime))
+
+    assert ReportCheckpoint(path).cited_by == {}
+    assert not path.exists()
+
+
+def test_get_default_checkpoint_dir_removes_expired(tmp_path: pathlib.Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test opening the default checkpoint directory deletes every expired checkpoint, but keeps fresh ones."""
+    monkeypatch.setenv("PUB_ANALYZER_CACHE_DIR", str(tmp_path))
+    checkpoint_dir = tmp_path / "checkpoints"
+    checkpoint_dir.mkdir()
+
+    expired_paths = [checkpoint_dir / "expired_1.jsonl", checkpoint_dir / "expired_2.jsonl"]
+    fresh_path = checkpoint_dir / "fresh.jsonl"
+    other_path = checkpoint_dir / "notes.txt"
+    for path in [*expired_paths, fresh_path, other_path]:
+        ReportCheckpoint(path).save_cited_by({"W1": []})
+
+    expired_mtime = fresh_path.stat().st_mtime - checkpoint_module.CHECKPOINT_MAX_AGE.total_seconds() - 1
+    for path in [*expired_paths, other_path]:
+        os.utime(path, (expired_mtime, expired_mtime))
+
+    assert get_default_checkpoint_dir() == checkpoint_dir
+    assert sorted(checkpoint_dir.iterdir()) == [fresh_path, other_path]
@@ -0,0 +1,42 @@
+"""Test report estimates from pub_analyzer/internal/estimate.py."""
+
+import datetime
+
+from pub_analyzer.internal.estimate import estimate_report
+from pub_analyzer.models.author import Author
+from tests.data.author import AUTHOR
+
+
+def test_estimate_report() -> None:
+    """Test estimate_report function without date ranges."""
+    estimate = estimate_report(Author(**AUTHOR), rate=8)
+
+    assert estimate.works_count == 185
+    assert estimate.citations_count == 19275
+    # Works pages, citation batches, citation pages and source batches.
+    assert estimate.requests_count == 2 + 4 + 193 + 4
+    assert estimate.duration == datetime.timedelta(seconds=25)
+    assert estimate.describe().startswith("[bold]Estimate:[/bold] 185 works, 19275 citations, 203 requests")
+
+
+def test_estimate_report_date_ranges() -> None:
+    """Test estimate_report function restricts works and citations to the date ranges."""
+    author = Author(**AUTHOR)
+
+    # Only the years with counts, so the older works are left out.
+    recent_estimate = estimate_report(
+        author, pub_from_date=datetime.datetime(2022, 1, 1), pub_to_date=datetime.datetime(2023, 12, 31), rate=8
+    )
+    assert recent_estimate.works_count == 0
+    assert recent_estimate.citations_count == 0
+    assert recent_estimate.requests_count == 1
+
+    # The works older than the counts are attributed to the range that starts before them.
+    old_estimate = estimate_report(author, pub_from_date=datetime.datetime(2000, 1, 1), pub_to_date=datetime.datetime(2021, 12, 31), rate=8)
+    assert old_estimate.works_count == 185
+
+    cited_estimate = estimate_report(
+        author, cited_from_date=datetime.datetime(2022, 1, 1), cited_to_date=datetime.datetime(2023, 12, 31), rate=8
+    )
+    assert cited_estimate.works_count == 185
+    assert cited_estimate.citations_count == 914 + 1894
@@ -0,0 +1,163 @@
+"""Test rate limiter from pub_analyzer/internal/limiter.py."""
+
+import asyncio
+import pathlib
+import time
+
+import httpx
+import pytest
+import respx
+
+from pub_analyzer.internal.limiter import AdaptiveRateLimiter, FileRateLimiter, RateLimitedTransport, RateLimiter, RequestPriority
+from pub_analyzer.internal.report import create_rate_limiter, get_rate_limiter
+
+
+@pytest.mark.asyncio
+async def test_rate_limiter_cool_down() -> None:
+    """Test no tokens are handed out during a cool-down."""
+    limiter = RateLimiter(rate=100, per_second=1.0)
+    await limiter.acquire()
+
+    limiter.cool_down(0.2)
+    start = time.monotonic()
+    await limiter.acquire()
+
+    assert time.monotonic() - start >= 0.2
+
+
+@pytest.mark.asyncio
+async def test_rate_limiter_keeps_longer_cool_down() -> None:
+    """Test a shorter cool-down does not cut an ongoing longer one."""
+    limiter = RateLimiter(rate=100, per_second=1.0)
+
+    limiter.cool_down(0.2)
+    limiter.cool_down(0.01)
+    start = time.monotonic()
+    await limiter.acquire()
+
+    assert time.monotonic() - start >= 0.2
+
+
+@pytest.mark.asyncio
+async def test_rate_limiter_below_one_request() -> None:
+    """Test a rate below one request per period still hands out tokens."""
+    limiter = RateLimiter(rate=0.5, per_second=0.05)
+
+    for _ in range(2):
+        await asyncio.wait_for(limiter.acquire(), timeout=1.0)
+
+
+@pytest.mark.asyncio
+async def test_rate_limiter_in_flight() -> None:
+    """Test requests are counted as in flight inside the request block."""
+    limiter = RateLimiter(rate=100, per_second=1.0)
+
+    async with limiter.request():
+        assert limiter.in_flight == 1
+    assert limiter.in_flight == 0
+
+
+def test_adaptive_rate_limiter_increase() -> None:
+    """Test the rate grows additively with healthy responses, up to the maximum rate."""
+    limiter = AdaptiveRateLimiter(rate=4, max_rate=6, increase=1.0)
+
+    for _ in range(4):
+        limiter.on_response(latency=0.1, throttled=False)
+    assert limiter.rate == pytest.approx(5.0, abs=0.1)
+
+    for _ in range(100):
+        limiter.on_response(latency=0.1, throttled=False)
+    assert limiter.rate == 6
+
+
+def test_adaptive_rate_limiter_decrease() -> None:
+    """Test the rate is cut once per congestion signal, down to the minimum rate."""
+    limiter = AdaptiveRateLimiter(rate=8, min_rate=3, max_rate=10, decrease_factor=0.5)
+
+    limiter.on_response(latency=0.1, throttled=True)
+    limiter.on_response(latency=0.1, throttled=True)
+    assert limiter.rate == 4
+
+    limiter._decreased_at = 0.0
+    limiter.on_response(latency=10.0, throttled=False)
+    assert limiter.rate == 3
+
+
+@pytest.mark.parametrize(
+    ["environ", "expected_type", "expected_rate"],
+    [
+        [{}, RateLimiter, 8],
+        [{"PUB_ANALYZER_RATE_LIMIT": "50"}, RateLimiter, 50],
+        [{"PUB_ANALYZER_RATE_LIMIT": "50", "PUB_ANALYZER_ADAPTIVE_RATE": "1"}, AdaptiveRateLimiter, 8],
+        [{"PUB_ANALYZER_RATE_LIMIT": "2", "PUB_ANALYZER_ADAPTIVE_RATE": "1"}, AdaptiveRateLimiter, 2],
+    ],
+)
+def test_create_rate_limiter(
+    monkeypatch: pytest.MonkeyPatch, environ: dict[str, str], expected_type: type[RateLimiter], expected_rate: float
+) -> None:
+    """Test create_rate_limiter function reads the deployment configuration."""
+    monkeypatch.delenv("PUB_ANALYZER_RATE_LIMIT", raising=False)
+    monkeypatch.delenv("PUB_ANALYZER_RATE_LIMIT_FILE", raising=False)
+    monkeypatch.delenv("PUB_ANALYZER_ADAPTIVE_RATE", raising=False)
+    for name, value in environ.items():
+        monkeypatch.setenv(name, value)
+
+    limiter = create_rate_limiter()
+    assert type(limiter) is expected_type
+    assert limiter.rate == expected_rate
+
+
+def test_get_rate_limiter() -> None:
+    """Test get_rate_limiter function returns a single limiter per process."""
+    assert get_rate_limiter() is get_rate_limiter()
+
+
+def test_file_rate_limiter(tmp_path: pathlib.Path) -> None:
+    """Test limiters backed by the same file share one budget."""
+    path = tmp_path / "openalex.limiter"
+    first_limiter = FileRateLimiter(path=path, rate=2)
+    second_limiter = FileRateLimiter(path=path, rate=2)
+
+    assert first_limiter._take_token() == 0.0
+    assert second_limiter._take_token() == 0.0
+    assert first_limiter._take_token() > 0.0
+
+    second_limiter.cool_down(60)
+    assert first_limiter._take_token() > 59
+
+
+@pytest.mark.asyncio
+async def test_rate_limited_transport() -> None:
+    """Test rate limited transport takes a token for each request."""
+    url = "https://api.openalex.org/authors/A1"
+    limiter = RateLimiter(rate=2, per_second=1.0)
+
+    with respx.mock(assert_all_mocked=True) as respx_mock:
+        respx_mock.get(url).mock(return_value=httpx.Response(status_code=httpx.codes.OK, json={"id": "A1"}))
+
+        async with httpx.AsyncClient(transport=RateLimitedTransport(limiter)) as client:
+            await client.get(url)
+            await client.get(url)
+
+    assert limiter._take_token() > 0.0
+
+
+@pytest.mark.asyncio
+async def test_rate_limiter_interactive_priority() -> None:
+    """Test interactive requests get the next token ahead of waiting bulk requests."""
+    limiter = RateLimiter(rate=10, per_second=1.0)
+    for _ in range(10):
+        await limiter.acquire()
+
+    order: list[str] = []
+
+    async def _acquire(name: str, priority: RequestPriority) -> None:
+        await limiter.acquire(priority)
+        order.append(name)
+
+    bulk_tasks = [asyncio.create_task(_acquire(f"bulk-{idx}", RequestPriority.BULK)) for idx in range(3)]
+    await asyncio.sleep(0)
+    await _acquire("interactive", RequestPriority.INTERACTIVE)
+    await asyncio.gather(*bulk_tasks)
+
+    assert order[0] == "interactive"
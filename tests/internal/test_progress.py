@@ -0,0 +1,66 @@
+"""Test report progress from pub_analyzer/internal/progress.py."""
+
+import datetime
+import io
+import json
+import time
+from collections.abc import AsyncIterator
+
+import pytest
+
+from pub_analyzer.internal.progress import ProgressTracker, ReportPhase, RequestStats, log_progress
+
+
+def test_request_stats(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test RequestStats class counts requests, cache hits and bytes, with the throughput of the last window."""
+    now = 100.0
+    monkeypatch.setattr(time, "monotonic", lambda: now)
+
+    stats = RequestStats(window=10.0)
+    now = 110.0
+    for _ in range(20):
+        stats.add_request(size=1_000)
+    stats.add_cache_hit()
+
+    assert (stats.requests_count, stats.cache_hits, stats.bytes_count) == (20, 1, 20_000)
+    assert stats.throughput() == 2.0
+
+    now = 125.0
+    assert stats.throughput() == 0.0
+
+
+def test_progress_tracker(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test ProgressTracker class estimates the time left at the pace of the current phase."""
+    now = 0.0
+    monkeypatch.setattr(time, "monotonic", lambda: now)
+
+    tracker = ProgressTracker()
+    now = 30.0
+    assert tracker.update(ReportPhase.WORKS, done=100).eta is None
+
+    tracker.update(ReportPhase.CITATIONS, done=0, total=100)
+    now = 40.0
+    progress = tracker.update(ReportPhase.CITATIONS, done=25, total=100)
+
+    assert progress.eta == datetime.timedelta(seconds=30)
+    assert progress.elapsed == datetime.timedelta(seconds=40)
+
+
+@pytest.mark.asyncio
+async def test_log_progress() -> None:
+    """Test log_progress function writes progress events as JSON lines and passes every event through."""
+    tracker = ProgressTracker()
+
+    async def events() -> AsyncIterator[object]:
+        yield "works"
+        yield tracker.update(ReportPhase.SOURCES, done=1, total=2)
+
+    file = io.StringIO()
+    passed_events = [event async for event in log_progress(events(), file, labels={"id": "A5015201707"})]
+
+    assert len(passed_events) == 2
+    lines = file.getvalue().splitlines()
+    assert len(lines) == 1
+    line = json.loads(lines[0])
+    assert (line["id"], line["phase"], line["done"]) == ("A5015201707", "sources", 1)
+    assert isinstance(line["elapsed"], float)
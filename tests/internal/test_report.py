@@ -1,7 +1,9 @@
 """Test report functions from pub_analyzer/internal/report.py."""
 
-import copy
+import asyncio
+import datetime
 import math
+import pathlib
 from typing import Any
 
 import httpx
@@ -10,11 +12,25 @@ import respx
 from pydantic import HttpUrl
 
 from pub_analyzer.internal import report
+from pub_analyzer.internal.cache import ResponseCache
+from pub_analyzer.internal.checkpoint import ReportCheckpoint
 from pub_analyzer.internal.limiter import RateLimiter
+from pub_analyzer.internal.progress import ReportPhase, ReportProgress
 from pub_analyzer.models.author import Author, AuthorOpenAlexKey, AuthorResult, DehydratedAuthor
 from pub_analyzer.models.institution import DehydratedInstitution, Institution, InstitutionOpenAlexKey, InstitutionResult, InstitutionType
-from pub_analyzer.models.report import CitationType
-from pub_analyzer.models.work import Authorship
+from pub_analyzer.models.report import (
+    AuthorReport,
+    CitationSummary,
+    CitationType,
+    GroupReport,
+    OpenAccessSummary,
+    ReportQuery,
+    SourcesSummary,
+    WorkReport,
+)
+from pub_analyzer.models.work import Authorship, DehydratedWork, Work
+from tests.data.author import AUTHOR, AUTHOR_OPEN_ALEX_ID
+from tests.data.source import SOURCE, SOURCE_OPEN_ALEX_ID
 from tests.data.work import WORK
 
 
@@ -170,31 +186,763 @@ def test_get_valid_works(works: list[dict[str, Any]], expected_works: list[dict[
 
 @pytest.mark.asyncio
 @pytest.mark.parametrize(
-    ["author_id", "works"],
+    ["author_id", "works_count", "per_page"],
     [
-        ["A4356881717", {"meta": {"count": 2, "page": 1, "per_page": 5}, "results": [WORK, WORK]}],
-        ["A4356881717", {"meta": {"count": 10, "page": 1, "per_page": 5}, "results": [WORK for _ in range(4)]}],
-        ["A4356881717", {"meta": {"count": 15, "page": 1, "per_page": 5}, "results": [WORK for _ in range(4)]}],
+        ["A4356881717", 2, 5],
+        ["A4356881717", 10, 5],
+        ["A4356881717", 14, 5],
     ],
 )
-async def test_get_works(author_id: str, works: dict[str, Any]) -> None:
+async def test_get_works(author_id: str, works_count: int, per_page: int) -> None:
     """Test _get_works function."""
     base_url = f"https://api.openalex.org/works?filter=author.id:{author_id}&sort=publication_date"
+    select_url = base_url + f"&select={report._get_select_fields(Work)}"
+    works = [{**WORK, "id": f"https://openalex.org/W{idx}"} for idx in range(works_count)]
 
     with respx.mock(assert_all_called=True, assert_all_mocked=True) as respx_mock:
-        respx_mock.get(base_url).mock(return_value=httpx.Response(status_code=httpx.codes.OK, json=works))
-
         # Test case when iteration over pages is needed
-        page_count = math.ceil(works["meta"]["count"] / works["meta"]["per_page"])
-        for page in range(1, page_count):
-            page_number = page + 1
-            work_new_page = copy.copy(works)
-            work_new_page["meta"]["page"] = page_number
-
-            respx_mock.get(base_url + f"&page={page_number}").mock(
-                return_value=httpx.Response(status_code=httpx.codes.OK, json=work_new_page)
-            )
+        page_count = math.ceil(works_count / per_page)
+        for page_number in range(1, page_count + 1):
+            page = {
+                "meta": {"count": works_count, "page": page_number, "per_page": per_page},
+                "results": works[(page_number - 1) * per_page : page_number * per_page],
+            }
+            url = select_url + "&cursor=*" if page_number == 1 else select_url + f"&page={page_number}"
+            respx_mock.get(url).mock(return_value=httpx.Response(status_code=httpx.codes.OK, json=page))
 
         client = httpx.AsyncClient()
         limiter = RateLimiter(rate=8, per_second=1.0)
-        await report._get_works(url=base_url, client=client, limiter=limiter)
+        result = await report._get_works(url=base_url, client=client, limiter=limiter, model=Work)
+
+    assert len(result) == works_count
+
+
+@pytest.mark.asyncio
+async def test_gather_bounded() -> None:
+    """Test _gather_bounded function keeps order and concurrency limit."""
+    running = 0
+    max_running = 0
+
+    async def job(value: int) -> int:
+        nonlocal running, max_running
+        running += 1
+        max_running = max(max_running, running)
+        await asyncio.sleep(0.01 * (value % 3))
+        running -= 1
+        return value
+
+    results = await report._gather_bounded((job(value) for value in range(20)), limit=4)
+
+    assert results == list(range(20))
+    assert max_running == 4
+
+
+@pytest.mark.asyncio
+async def test_get_works_keeps_page_order() -> None:
+    """Test _get_works function reassembles concurrent pages in page order."""
+    base_url = "https://api.openalex.org/works?filter=cites:W2058179313&sort=publication_date"
+    select_url = base_url + f"&select={report._get_select_fields(Work)}"
+    page_count = 5
+
+    with respx.mock(assert_all_called=True, assert_all_mocked=True) as respx_mock:
+        for page_number in range(1, page_count + 1):
+            page = {
+                "meta": {"count": page_count, "page": page_number, "per_page": 1},
+                "results": [{**WORK, "id": f"https://openalex.org/W{page_number}", "title": f"Page {page_number}"}],
+            }
+            url = select_url + "&cursor=*" if page_number == 1 else select_url + f"&page={page_number}"
+            respx_mock.get(url).mock(return_value=httpx.Response(status_code=httpx.codes.OK, json=page))
+
+        async with httpx.AsyncClient() as client:
+            limiter = RateLimiter(rate=8, per_second=1.0)
+            works = await report._get_works(url=base_url, client=client, limiter=limiter, model=Work)
+
+    assert [work.title for work in works] == [f"Page {page_number}" for page_number in range(1, page_count + 1)]
+
+
+@pytest.mark.asyncio
+async def test_get_works_cursor_paging(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test _get_works function keeps following the cursor of the first page above the threshold."""
+    monkeypatch.setattr(report, "CURSOR_PAGINATION_THRESHOLD", 2)
+    base_url = "https://api.openalex.org/works?filter=institutions.id:I0&sort=publication_date"
+    select_url = base_url + f"&select={report._get_select_fields(Work)}"
+    cursors = ["*", "c1", "c2"]
+
+    with respx.mock(assert_all_called=True, assert_all_mocked=True) as respx_mock:
+        for idx, cursor in enumerate(cursors):
+            next_cursor = cursors[idx + 1] if idx + 1 < len(cursors) else None
+            page = {
+                "meta": {"count": 3, "page": None, "per_page": 1, "next_cursor": next_cursor},
+                "results": [{**WORK, "id": f"https://openalex.org/W{idx}", "title": cursor}],
+            }
+            respx_mock.get(select_url + f"&cursor={cursor}").mock(return_value=httpx.Response(status_code=httpx.codes.OK, json=page))
+
+        async with httpx.AsyncClient() as client:
+            limiter = RateLimiter(rate=8, per_second=1.0)
+            works = await report._get_works(url=base_url, client=client, limiter=limiter, model=Work)
+
+        # The first page is not requested again to start the cursor.
+        assert respx_mock.calls.call_count == len(cursors)
+
+    assert [work.title for work in works] == cursors
+
+
+@pytest.mark.asyncio
+async def test_get_works_missing_page_work() -> None:
+    """Test _get_works function detects a work left out by overlapping pages and walks them with cursor paging."""
+    base_url = "https://api.openalex.org/works?filter=cites:W2058179313&sort=publication_date"
+    select_url = base_url + f"&select={report._get_select_fields(Work)}"
+    first_work, second_work, third_work = ({**WORK, "id": f"https://openalex.org/W{idx}", "title": f"W{idx}"} for idx in range(1, 4))
+
+    with respx.mock(assert_all_called=True, assert_all_mocked=True) as respx_mock:
+        # The second page repeats the last work of the first one and the third work is in neither.
+        pages = {
+            select_url + "&cursor=*": {"meta": {"count": 3, "per_page": 2, "next_cursor": "c1"}, "results": [first_work, second_work]},
+            select_url + "&page=2": {"meta": {"count": 3, "page": 2, "per_page": 2}, "results": [second_work]},
+            select_url + "&cursor=c1": {"meta": {"count": 3, "per_page": 2, "next_cursor": None}, "results": [third_work]},
+        }
+        for url, page in pages.items():
+            respx_mock.get(url).mock(return_value=httpx.Response(status_code=httpx.codes.OK, json=page))
+
+        async with httpx.AsyncClient() as client:
+            limiter = RateLimiter(rate=8, per_second=1.0)
+            works = await report._get_works(url=base_url, client=client, limiter=limiter, model=Work)
+
+        # The cursor walk starts from the cursor of the first page.
+        assert respx_mock.calls.call_count == len(pages)
+
+    assert [work.title for work in works] == ["W1", "W2", "W3"]
+
+
+@pytest.mark.asyncio
+async def test_iter_bounded() -> None:
+    """Test _iter_bounded function yields results as they complete and cancels pending ones when closed."""
+    cancelled: list[int] = []
+
+    async def job(value: int) -> int:
+        try:
+            await asyncio.sleep(value / 100)
+        except asyncio.CancelledError:
+            cancelled.append(value)
+            raise
+        return value
+
+    results = report._iter_bounded((job(value) for value in [3, 1, 2, 9]), limit=4)
+    assert [await anext(results), await anext(results), await anext(results)] == [1, 2, 3]
+
+    await results.aclose()
+    assert cancelled == [9]
+
+
+@pytest.mark.asyncio
+async def test_get_cited_by_works() -> None:
+    """Test _get_cited_by_works function maps citing works back to the cited works, each one once."""
+    url = "https://api.openalex.org/works?filter=cites:W3|W1,from_publication_date:2020-01-01&sort=publication_date&per-page=100"
+    url += f"&select={report._get_select_fields(DehydratedWork)}&cursor=*"
+    citing_works = {
+        "meta": {"count": 2, "page": 1, "per_page": 100},
+        "results": [
+            {**WORK, "title": "Cites W1 and W3", "referenced_works": ["https://openalex.org/W1", "https://openalex.org/W3"]},
+            {
+                **WORK,
+                "id": "https://openalex.org/W8",
+                "title": "Cites W3",
+                "referenced_works": ["https://openalex.org/W3", "https://openalex.org/W9"],
+            },
+            {**WORK, "title": "Cites W1 and W3", "referenced_works": ["https://openalex.org/W1", "https://openalex.org/W3"]},
+        ],
+    }
+    plan = report.CitationFetchPlan(
+        batches=[report.CitationFetchBatch(works_ids=["W3", "W1"], cited_by_count=3)],
+        skipped_works_ids=["W2"],
+    )
+
+    with respx.mock(assert_all_called=True, assert_all_mocked=True) as respx_mock:
+        respx_mock.get(url).mock(return_value=httpx.Response(status_code=httpx.codes.OK, json=citing_works))
+
+        async with httpx.AsyncClient() as client:
+            limiter = RateLimiter(rate=8, per_second=1.0)
+            cited_by = await report._get_cited_by_works(client, plan, ",from_publication_date:2020-01-01", limiter)
+
+    assert {work_id: [work.title for work in works] for work_id, works in cited_by.items()} == {
+        "W1": ["Cites W1 and W3"],
+        "W2": [],
+        "W3": ["Cites W1 and W3", "Cites W3"],
+    }
+
+
+def test_plan_citation_fetch(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test plan_citation_fetch function skips uncited works and packs the rest largest first."""
+    monkeypatch.setattr(report, "CITES_BATCH_SIZE", 2)
+    monkeypatch.setattr(report, "CITES_BATCH_CITATIONS", 1_000)
+    cited_by_counts = {"W1": 0, "W2": 5, "W3": 5_000, "W4": 300, "W5": 600, "W6": 10}
+    works = [
+        Work(**{**WORK, "id": f"https://openalex.org/{work_id}", "cited_by_count": count}) for work_id, count in cited_by_counts.items()
+    ]
+
+    plan = report.plan_citation_fetch(works)
+
+    assert plan.skipped_works_ids == ["W1"]
+    assert [batch.works_ids for batch in plan.batches] == [["W3"], ["W5", "W4"], ["W6", "W2"]]
+    assert plan.requests_count == 50 + 9 + 1
+    assert plan.estimate_duration(rate=10) == datetime.timedelta(seconds=6)
+
+    assert report.plan_citation_fetch(works, skip_uncited=False).skipped_works_ids == []
+
+
+@pytest.mark.parametrize(
+    ["homepage_url", "expected_homepage_url"],
+    [
+        ["http://www.nature.com/nature/", "http://www.nature.com/nature/"],
+        ["www.nature.com/nature/", None],
+        [None, None],
+    ],
+)
+def test_sanitize_source(homepage_url: str | None, expected_homepage_url: str | None) -> None:
+    """Test _sanitize_source function."""
+    source = report._sanitize_source({**SOURCE, "homepage_url": homepage_url})
+    assert source["homepage_url"] == expected_homepage_url
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    ["status_code", "ignore_errors"],
+    [
+        [httpx.codes.OK, False],
+        [httpx.codes.INTERNAL_SERVER_ERROR, True],
+    ],
+)
+async def test_get_sources(monkeypatch: pytest.MonkeyPatch, status_code: int, ignore_errors: bool) -> None:
+    """Test _get_sources function requests sources in batches and keeps the requested order."""
+    monkeypatch.setattr(report, "SOURCES_BATCH_SIZE", 2)
+    monkeypatch.setattr(report, "MAX_RETRIES", 0)
+    first_batch_url = "https://api.openalex.org/sources?filter=openalex:S1|S2&per-page=100"
+    second_batch_url = "https://api.openalex.org/sources?filter=openalex:S3&per-page=100"
+
+    def source(source_id: str) -> dict[str, Any]:
+        return {**SOURCE, "id": f"https://openalex.org/{source_id}", "display_name": source_id}
+
+    with respx.mock(assert_all_called=True, assert_all_mocked=True) as respx_mock:
+        first_batch = {"meta": {"count": 2, "page": 1, "per_page": 100}, "results": [source("S2"), source("S1")]}
+        second_batch = {"meta": {"count": 1, "page": 1, "per_page": 100}, "results": [source("S3")]}
+        respx_mock.get(first_batch_url).mock(return_value=httpx.Response(status_code=httpx.codes.OK, json=first_batch))
+        respx_mock.get(second_batch_url).mock(return_value=httpx.Response(status_code=status_code, json=second_batch))
+
+        async with httpx.AsyncClient() as client:
+            limiter = RateLimiter(rate=8, per_second=1.0)
+            sources = await report._get_sources(client, ["S1", "S2", "S3"], limiter, ignore_errors=ignore_errors)
+
+    expected_names = ["S1", "S2", "S3"] if status_code == httpx.codes.OK else ["S1", "S2"]
+    assert [source.display_name for source in sources] == expected_names
+
+
+@pytest.mark.asyncio
+async def test_get_sources_failed_batch(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test _get_sources function requests the sources of a failed batch one by one when errors are ignored."""
+    monkeypatch.setattr(report, "MAX_RETRIES", 0)
+    batch_url = "https://api.openalex.org/sources?filter=openalex:S1|S2&per-page=100"
+
+    with respx.mock(assert_all_called=True, assert_all_mocked=True) as respx_mock:
+        respx_mock.get(batch_url).mock(return_value=httpx.Response(status_code=httpx.codes.INTERNAL_SERVER_ERROR))
+        respx_mock.get("https://api.openalex.org/sources/S1").mock(
+            return_value=httpx.Response(status_code=httpx.codes.OK, json={**SOURCE, "id": "https://openalex.org/S1", "display_name": "S1"})
+        )
+        respx_mock.get("https://api.openalex.org/sources/S2").mock(
+            return_value=httpx.Response(status_code=httpx.codes.INTERNAL_SERVER_ERROR)
+        )
+
+        async with httpx.AsyncClient() as client:
+            limiter = RateLimiter(rate=8, per_second=1.0)
+            sources = await report._get_sources(client, ["S1", "S2"], limiter, ignore_errors=True)
+
+    assert [source.display_name for source in sources] == ["S1"]
+
+
+@pytest.mark.asyncio
+async def test_get_sources_raise_errors(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test _get_sources function raises HTTP errors unless they are ignored."""
+    monkeypatch.setattr(report, "MAX_RETRIES", 0)
+    url = "https://api.openalex.org/sources?filter=openalex:S1&per-page=100"
+
+    with respx.mock(assert_all_called=True, assert_all_mocked=True) as respx_mock:
+        respx_mock.get(url).mock(return_value=httpx.Response(status_code=httpx.codes.INTERNAL_SERVER_ERROR))
+
+        async with httpx.AsyncClient() as client:
+            limiter = RateLimiter(rate=8, per_second=1.0)
+            with pytest.raises(httpx.HTTPStatusError):
+                await report._get_sources(client, ["S1"], limiter)
+
+
+@pytest.mark.parametrize(
+    ["model", "expected_fields"],
+    [
+        [
+            DehydratedWork,
+            "id,ids,title,publication_year,publication_date,type,primary_location,authorships,cited_by_count,referenced_works",
+        ],
+        [Work, ",".join(field if field != "abstract" else "abstract_inverted_index" for field in Work.model_fields)],
+    ],
+)
+def test_get_select_fields(model: type[DehydratedWork], expected_fields: str) -> None:
+    """Test _get_select_fields function."""
+    assert report._get_select_fields(model) == expected_fields
+
+
+@pytest.mark.asyncio
+async def test_get_page_cached(tmp_path: pathlib.Path) -> None:
+    """Test _get_page function serves stored responses without requests."""
+    url = "https://api.openalex.org/works?filter=cites:W1"
+    cache = ResponseCache(path=tmp_path / "cache.sqlite3")
+    page = {"meta": {"count": 0, "page": 1, "per_page": 100}, "results": []}
+
+    with respx.mock(assert_all_mocked=True) as respx_mock:
+        route = respx_mock.get(url).mock(return_value=httpx.Response(status_code=httpx.codes.OK, json=page))
+
+        async with httpx.AsyncClient() as client:
+            limiter = RateLimiter(rate=8, per_second=1.0)
+            assert await report._get_page(client, url, limiter, cache) == page
+            assert await report._get_page(client, url, limiter, cache) == page
+
+    assert route.call_count == 1
+
+
+@pytest.mark.asyncio
+async def test_refresh_works() -> None:
+    """Test _iter_refresh_works function merges updated works and citations, yielding the progress."""
+    since_filter = ",from_updated_date:2024-05-01"
+    works_url = f"{report._get_works_url(f'author.id:A1{since_filter}')}&select={report._get_select_fields(Work)}&cursor=*"
+    new_cited_by_url = f"{report._get_works_url('cites:W2')}&select={report._get_select_fields(DehydratedWork)}&cursor=*"
+    updated_cited_by_url = f"{report._get_works_url(f'cites:W1{since_filter}')}&select={report._get_select_fields(DehydratedWork)}&cursor=*"
+
+    def _work(work_id: str, title: str, publication_date: str, referenced_works: list[str] | None = None) -> dict[str, Any]:
+        return {
+            **WORK,
+            "id": f"https://openalex.org/{work_id}",
+            "title": title,
+            "publication_date": publication_date,
+            "referenced_works": [f"https://openalex.org/{referenced_work}" for referenced_work in referenced_works or []],
+        }
+
+    def _page(results: list[dict[str, Any]]) -> dict[str, Any]:
+        return {"meta": {"count": len(results), "page": 1, "per_page": 100}, "results": results}
+
+    works_reports = {
+        "W1": report._make_work_report(Work(**_work("W1", "Old", "2000-01-01")), [DehydratedWork(**_work("C1", "C1 old", "2010-01-01"))])
+    }
+
+    with respx.mock(assert_all_called=True, assert_all_mocked=True) as respx_mock:
+        respx_mock.get(works_url).mock(
+            return_value=httpx.Response(
+                status_code=httpx.codes.OK, json=_page([_work("W1", "New", "2000-01-01"), _work("W2", "Added", "2001-01-01")])
+            )
+        )
+        respx_mock.get(new_cited_by_url).mock(
+            return_value=httpx.Response(status_code=httpx.codes.OK, json=_page([_work("C2", "C2", "2011-01-01", ["W2"])]))
+        )
+        respx_mock.get(updated_cited_by_url).mock(
+            return_value=httpx.Response(
+                status_code=httpx.codes.OK,
+                json=_page([_work("C3", "C3", "2005-01-01", ["W1"]), _work("C1", "C1 new", "2010-01-01", ["W1"])]),
+            )
+        )
+
+        async with httpx.AsyncClient() as client:
+            limiter = RateLimiter(rate=8, per_second=1.0)
+            events = [
+                event
+                async for event in report._iter_refresh_works(
+                    client,
+                    works_reports=works_reports,
+                    works_filter="author.id:A1",
+                    cited_filters="",
+                    since=datetime.datetime(2024, 5, 1, tzinfo=datetime.timezone.utc),
+                    limiter=limiter,
+                )
+            ]
+
+    assert [(event.phase, event.done, event.total) for event in events] == [
+        (ReportPhase.WORKS, 0, None),
+        (ReportPhase.WORKS, 2, 2),
+        (ReportPhase.CITATIONS, 0, 2),
+        (ReportPhase.CITATIONS, 1, 2),
+        (ReportPhase.CITATIONS, 2, 2),
+    ]
+    assert events[-1].requests_count == 3
+
+    refreshed_works = report._sort_works_reports(works_reports.values())
+    assert [work_report.work.title for work_report in refreshed_works] == ["New", "Added"]
+    assert [[citation.work.title for citation in work_report.cited_by] for work_report in refreshed_works] == [["C3", "C1 new"], ["C2"]]
+    assert [work_report.citation_summary.type_b_count for work_report in refreshed_works] == [2, 1]
+
+
+@pytest.mark.asyncio
+async def test_refresh_author_report_uses_report_query() -> None:
+    """Test refresh_author_report function defaults to the profiles and filters recorded in the report."""
+    author_report = AuthorReport(
+        author=Author(**AUTHOR),
+        works=[],
+        citation_summary=CitationSummary(),
+        open_access_summary=OpenAccessSummary(),
+        works_type_summary=[],
+        sources_summary=SourcesSummary(sources=[]),
+        generated_at=datetime.datetime(2024, 1, 1, tzinfo=datetime.timezone.utc),
+        query=ReportQuery(extra_profiles=["A2"], pub_from_date=datetime.datetime(2020, 1, 1)),
+    )
+    works_filter = f"author.id:{AUTHOR_OPEN_ALEX_ID}|A2,from_publication_date:2020-01-01,from_updated_date:2024-01-01"
+
+    with respx.mock(assert_all_called=True, assert_all_mocked=True) as respx_mock:
+        respx_mock.get(host="api.openalex.org", path="/works", params={"filter": works_filter}).mock(
+            return_value=httpx.Response(status_code=httpx.codes.OK, json={"meta": {"count": 0, "page": 1, "per_page": 100}, "results": []})
+        )
+
+        refreshed_report = await report.refresh_author_report(author_report, limiter=RateLimiter(rate=8, per_second=1.0))
+
+    assert refreshed_report.query == author_report.query
+
+
+@pytest.mark.asyncio
+async def test_refresh_author_report_without_date() -> None:
+    """Test refresh_author_report function requires a date to refresh from."""
+    author_report = AuthorReport.model_construct(generated_at=None)
+
+    with pytest.raises(ValueError):
+        await report.refresh_author_report(author_report)
+
+
+@pytest.mark.parametrize(
+    ["years_counts", "shards", "pub_from_date", "pub_to_date", "expected_ranges"],
+    [
+        [{2021: 1, 2022: 1, 2023: 8}, 1, None, None, [(None, None)]],
+        [{2021: 1, 2022: 1, 2023: 8}, 2, None, None, [(None, "2022-12-31"), ("2023-01-01", None)]],
+        [{2021: 1, 2022: 1, 2023: 8}, 5, None, None, [(None, "2021-12-31"), ("2022-01-01", "2022-12-31"), ("2023-01-01", None)]],
+        [{2021: 6_000, 2022: 6_000, 2023: 3_000}, 1, None, None, [(None, "2021-12-31"), ("2022-01-01", None)]],
+        [{2023: 50_000}, 4, None, None, [(None, None)]],
+        [
+            {2010: 5, 2011: 5, 2012: 5, 2013: 5},
+            2,
+            datetime.datetime(2010, 6, 1),
+            datetime.datetime(2013, 6, 30),
+            [("2010-06-01", "2011-12-31"), ("2012-01-01", "2013-06-30")],
+        ],
+    ],
+)
+def test_plan_publication_shards(
+    years_counts: dict[int, int],
+    shards: int,
+    pub_from_date: datetime.datetime | None,
+    pub_to_date: datetime.datetime | None,
+    expected_ranges: list[tuple[str | None, str | None]],
+) -> None:
+    """Test plan_publication_shards function balances whole years, under the paging limit and open-ended without dates."""
+    ranges = report.plan_publication_shards(
+        years_counts,
+        shards,
+        report.FromDate(pub_from_date) if pub_from_date else None,
+        report.ToDate(pub_to_date) if pub_to_date else None,
+    )
+
+    assert [
+        (f"{from_date:%Y-%m-%d}" if from_date else None, f"{to_date:%Y-%m-%d}" if to_date else None) for from_date, to_date in ranges
+    ] == expected_ranges
+
+
+@pytest.mark.asyncio
+async def test_report_session_reuses_entities_and_sources() -> None:
+    """Test ReportSession class requests each entity and source only once across reports."""
+    works_page = {
+        "meta": {"count": 1, "page": 1, "per_page": 100},
+        "results": [{**WORK, "cited_by_count": 0, "locations": [WORK["primary_location"]]}],
+    }
+    sources_page = {"meta": {"count": 1, "page": 1, "per_page": 100}, "results": [SOURCE]}
+
+    with respx.mock(assert_all_mocked=True) as respx_mock:
+        author_route = respx_mock.get(f"https://api.openalex.org/authors/{AUTHOR_OPEN_ALEX_ID}").mock(
+            return_value=httpx.Response(status_code=httpx.codes.OK, json=AUTHOR)
+        )
+        works_route = respx_mock.get(host="api.openalex.org", path="/works").mock(
+            return_value=httpx.Response(status_code=httpx.codes.OK, json=works_page)
+        )
+        sources_route = respx_mock.get(host="api.openalex.org", path="/sources").mock(
+            return_value=httpx.Response(status_code=httpx.codes.OK, json=sources_page)
+        )
+
+        async with report.ReportSession(limiter=RateLimiter(rate=8, per_second=1.0)) as session:
+            for _ in range(2):
+                author = await session.get_author(AUTHOR_OPEN_ALEX_ID)
+                author_report = await session.make_author_report(author)
+                assert [str(source.id) for source in author_report.sources_summary.sources] == [SOURCE["id"]]
+
+    assert (author_route.call_count, works_route.call_count, sources_route.call_count) == (1, 2, 1)
+    assert SOURCE_OPEN_ALEX_ID in str(author_report.sources_summary.sources[0].id)
+
+
+@pytest.mark.asyncio
+async def test_make_group_report() -> None:
+    """Test make_group_report function requests shared works and their citations once and summarizes each author."""
+    second_author_id = "A2"
+
+    def _authorship(author_id: str) -> dict[str, Any]:
+        return {"author_position": "middle", "author": {"id": f"https://openalex.org/{author_id}", "display_name": author_id}}
+
+    def _work(work_id: str, year: int, authors_ids: list[str], cited_by_count: int) -> dict[str, Any]:
+        return {
+            **WORK,
+            "id": f"https://openalex.org/{work_id}",
+            "publication_year": year,
+            "publication_date": f"{year}-01-01",
+            "authorships": [_authorship(author_id) for author_id in authors_ids],
+            "cited_by_count": cited_by_count,
+        }
+
+    works = [
+        _work("W1", 2020, [AUTHOR_OPEN_ALEX_ID, second_author_id], 1),
+        _work("W2", 2021, [AUTHOR_OPEN_ALEX_ID], 0),
+        _work("W3", 2022, [second_author_id], 1),
+    ]
+    citing_work = {**_work("W9", 2023, ["A9"], 0), "referenced_works": ["https://openalex.org/W1", "https://openalex.org/W3"]}
+
+    def works_page(request: httpx.Request) -> httpx.Response:
+        filters = request.url.params["filter"]
+        results = [citing_work] if filters == "cites:W1|W3" else works
+        assert filters in ("cites:W1|W3", f"author.id:{AUTHOR_OPEN_ALEX_ID}|{second_author_id}")
+        return httpx.Response(
+            status_code=httpx.codes.OK, json={"meta": {"count": len(results), "page": 1, "per_page": 100}, "results": results}
+        )
+
+    authors = [Author(**AUTHOR), Author(**{**AUTHOR, "id": f"https://openalex.org/{second_author_id}"})]
+    with respx.mock(assert_all_mocked=True) as respx_mock:
+        works_route = respx_mock.get(host="api.openalex.org", path="/works").mock(side_effect=works_page)
+
+        group_report = await report.make_group_report(authors, limiter=RateLimiter(rate=8, per_second=1.0))
+
+    assert works_route.call_count == 2
+    assert [str(work_report.work.id) for work_report in group_report.works] == [work["id"] for work in works]
+    assert group_report.citation_summary.type_a_count == 2
+    assert [member.works_count for member in group_report.members] == [2, 2]
+    assert [member.citation_summary.type_a_count for member in group_report.members] == [1, 2]
+    assert [[year_count.year for year_count in member.author.counts_by_year] for member in group_report.members] == [
+        [2020, 2021, 2023],
+        [2020, 2022, 2023],
+    ]
+
+
+def test_merge_reports() -> None:
+    """Test merge_reports function keeps each work once with the citations of all the reports."""
+
+    def _work(work_id: str, year: int) -> Work:
+        return Work(**{**WORK, "id": f"https://openalex.org/{work_id}", "publication_year": year, "publication_date": f"{year}-01-01"})
+
+    def _author_report(works_reports: list[WorkReport], generated_at: datetime.datetime) -> AuthorReport:
+        return AuthorReport(
+            author=Author(**AUTHOR),
+            works=works_reports,
+            citation_summary=report._get_citation_summary(works_reports),
+            open_access_summary=report._get_open_access_summary(works_reports),
+            works_type_summary=report._get_works_type_summary(works_reports),
+            sources_summary=SourcesSummary(sources=[]),
+            generated_at=generated_at,
+        )
+
+    first_citation, second_citation = _work("W8", 2022), _work("W9", 2023)
+    first_report = _author_report(
+        [report._make_work_report(_work("W1", 2020), [first_citation]), report._make_work_report(_work("W2", 2021), [])],
+        datetime.datetime(2024, 1, 1, tzinfo=datetime.timezone.utc),
+    )
+    second_report = _author_report(
+        [report._make_work_report(_work("W3", 2019), []), report._make_work_report(_work("W1", 2020), [second_citation, first_citation])],
+        datetime.datetime(2023, 1, 1, tzinfo=datetime.timezone.utc),
+    )
+
+    merged_report = report.merge_reports([first_report, second_report])
+
+    assert isinstance(merged_report, AuthorReport)
+    assert [str(work_report.work.id) for work_report in merged_report.works] == [
+        "https://openalex.org/W3",
+        "https://openalex.org/W1",
+        "https://openalex.org/W2",
+    ]
+    assert [str(citation.work.id) for citation in merged_report.works[1].cited_by] == ["https://openalex.org/W8", "https://openalex.org/W9"]
+    assert merged_report.citation_summary.type_b_count == 2
+    assert sum(work_type.count for work_type in merged_report.works_type_summary) == 3
+    assert [(year_count.year, year_count.works_count) for year_count in merged_report.author.counts_by_year] == [
+        (2019, 1),
+        (2020, 1),
+        (2021, 1),
+        (2022, 0),
+        (2023, 0),
+    ]
+    assert merged_report.generated_at == second_report.generated_at
+
+    with pytest.raises(ValueError):
+        report.merge_reports([])
+
+    # Reports of different authors are merged into a group, each work counted for the authors of its reports.
+    other_report = _author_report(
+        [report._make_work_report(_work("W1", 2020), []), report._make_work_report(_work("W4", 2022), [])],
+        datetime.datetime(2022, 1, 1, tzinfo=datetime.timezone.utc),
+    )
+    other_report.author = Author(**{**AUTHOR, "id": "https://openalex.org/A1"})
+
+    group_report = report.merge_reports([first_report, other_report])
+
+    assert isinstance(group_report, GroupReport)
+    assert [str(work_report.work.id) for work_report in group_report.works] == [
+        "https://openalex.org/W1",
+        "https://openalex.org/W2",
+        "https://openalex.org/W4",
+    ]
+    assert [(str(member.author.id), member.works_count) for member in group_report.members] == [
+        (f"https://openalex.org/{AUTHOR_OPEN_ALEX_ID}", 2),
+        ("https://openalex.org/A1", 2),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_iter_works_reports_resume(tmp_path: pathlib.Path) -> None:
+    """Test _iter_works_reports function only requests the citations missing from the checkpoint."""
+    works_url = report._get_works_url("author.id:A1")
+    cited_by_url = f"{report._get_works_url('cites:W2')}&select={report._get_select_fields(DehydratedWork)}&cursor=*"
+    citing_work = {**WORK, "title": "Cites W2", "referenced_works": ["https://openalex.org/W2"]}
+
+    checkpoint = ReportCheckpoint(tmp_path / "checkpoint.jsonl")
+    checkpoint.save_works([Work(**{**WORK, "id": "https://openalex.org/W1"}), Work(**{**WORK, "id": "https://openalex.org/W2"})])
+    checkpoint.save_cited_by({"W1": []})
+
+    with respx.mock(assert_all_called=True, assert_all_mocked=True) as respx_mock:
+        respx_mock.get(cited_by_url).mock(
+            return_value=httpx.Response(
+                status_code=httpx.codes.OK, json={"meta": {"count": 1, "page": 1, "per_page": 100}, "results": [citing_work]}
+            )
+        )
+
+        async with httpx.AsyncClient() as client:
+            limiter = RateLimiter(rate=8, per_second=1.0)
+            builder = report._ReportBuilder()
+            events = [event async for event in report._iter_works_reports(client, builder, [works_url], "", limiter, checkpoint=checkpoint)]
+
+    reports_events = [event for event in events if not isinstance(event, ReportProgress)]
+    assert [type(event) for event in reports_events] == [report.WorksFetched, report.WorkReportCompleted, report.WorkReportCompleted]
+
+    progress_events = [event for event in events if isinstance(event, ReportProgress)]
+    assert [(event.phase, event.done, event.total) for event in progress_events] == [
+        (ReportPhase.WORKS, 2, 2),
+        (ReportPhase.CITATIONS, 0, 2),
+        (ReportPhase.CITATIONS, 1, 2),
+        (ReportPhase.CITATIONS, 2, 2),
+    ]
+    assert progress_events[-1].requests_count == 1
+    assert [str(work_report.work.id) for work_report in builder.works] == ["https://openalex.org/W1", "https://openalex.org/W2"]
+    assert [[citation.work.title for citation in work_report.cited_by] for work_report in builder.works] == [[], ["Cites W2"]]
+    assert ReportCheckpoint(tmp_path / "checkpoint.jsonl").cited_by.keys() == {"W1", "W2"}
+
+
+@pytest.mark.parametrize(
+    ["retry_after", "expected_delay"],
+    [
+        [None, None],
+        ["2", 2.0],
+        ["-1", 0.0],
+        ["Wed, 21 Oct 2015 07:28:00 GMT", 0.0],
+        ["soon", None],
+    ],
+)
+def test_get_retry_after(retry_after: str | None, expected_delay: float | None) -> None:
+    """Test _get_retry_after function."""
+    headers = {"Retry-After": retry_after} if retry_after is not None else {}
+    response = httpx.Response(status_code=httpx.codes.TOO_MANY_REQUESTS, headers=headers)
+    assert report._get_retry_after(response) == expected_delay
+
+
+@pytest.mark.asyncio
+async def test_send_request_retries(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test _send_request function retries throttling, server and connection errors."""
+    monkeypatch.setattr(report, "RETRY_BACKOFF_BASE", 0.0)
+    url = "https://api.openalex.org/works?filter=cites:W1"
+    cool_downs: list[float] = []
+
+    with respx.mock(assert_all_called=True, assert_all_mocked=True) as respx_mock:
+        route = respx_mock.get(url).mock(
+            side_effect=[
+                httpx.Response(status_code=httpx.codes.TOO_MANY_REQUESTS, headers={"Retry-After": "0"}),
+                httpx.Response(status_code=httpx.codes.SERVICE_UNAVAILABLE),
+                httpx.ConnectError("Connection refused"),
+                httpx.Response(status_code=httpx.codes.OK, json={"results": []}),
+            ]
+        )
+
+        async with httpx.AsyncClient() as client:
+            limiter = RateLimiter(rate=8, per_second=1.0)
+            monkeypatch.setattr(limiter, "cool_down", cool_downs.append)
+            response = await report._send_request(client, url, limiter)
+
+    assert response.status_code == httpx.codes.OK
+    assert route.call_count == 4
+    assert cool_downs == [0.0]
+
+
+@pytest.mark.asyncio
+async def test_send_request_gives_up(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test _send_request function returns the last error response after MAX_RETRIES."""
+    monkeypatch.setattr(report, "RETRY_BACKOFF_BASE", 0.0)
+    monkeypatch.setattr(report, "MAX_RETRIES", 2)
+    url = "https://api.openalex.org/works?filter=cites:W1"
+
+    with respx.mock(assert_all_called=True, assert_all_mocked=True) as respx_mock:
+        route = respx_mock.get(url).mock(return_value=httpx.Response(status_code=httpx.codes.BAD_GATEWAY))
+
+        async with httpx.AsyncClient() as client:
+            limiter = RateLimiter(rate=8, per_second=1.0)
+            response = await report._send_request(client, url, limiter)
+
+    assert response.status_code == httpx.codes.BAD_GATEWAY
+    assert route.call_count == 3
+
+
+@pytest.mark.asyncio
+async def test_get_page_coalesced() -> None:
+    """Test concurrent _get_page calls of the same URL send a single request."""
+    url = "https://api.openalex.org/works?filter=cites:W1&per-page=100"
+    page = {"meta": {"count": 0, "page": 1, "per_page": 100}, "results": []}
+
+    with respx.mock(assert_all_mocked=True) as respx_mock:
+        route = respx_mock.get(url).mock(return_value=httpx.Response(status_code=httpx.codes.OK, json=page))
+
+        async with httpx.AsyncClient() as client:
+            limiter = RateLimiter(rate=8, per_second=1.0)
+            pages = await asyncio.gather(
+                report._get_page(client, url, limiter),
+                report._get_page(client, "https://api.openalex.org/works?per-page=100&filter=cites:W1", limiter),
+            )
+
+    assert list(pages) == [page, page]
+    assert route.call_count == 1
+
+
+@pytest.mark.asyncio
+async def test_report_session_close_waits_shared_requests() -> None:
+    """Test a cancelled session is closed only once the requests shared with other sessions are finished."""
+    url = "https://api.openalex.org/works?filter=cites:W1&per-page=100"
+    page = {"meta": {"count": 0, "page": 1, "per_page": 100}, "results": []}
+
+    async def slow_page(request: httpx.Request) -> httpx.Response:
+        await asyncio.sleep(0.1)
+        return httpx.Response(status_code=httpx.codes.OK, json=page)
+
+    with respx.mock(assert_all_mocked=True) as respx_mock:
+        route = respx_mock.get(url).mock(side_effect=slow_page)
+
+        limiter = RateLimiter(rate=8, per_second=1.0)
+        async with report.ReportSession(limiter=limiter) as session:
+            cancelled_session = report.ReportSession(limiter=limiter)
+            cancelled_task = asyncio.create_task(report._get_page(cancelled_session.client, url, limiter))
+            await asyncio.sleep(0.01)
+            task = asyncio.create_task(report._get_page(session.client, url, limiter))
+            await asyncio.sleep(0.01)
+
+            cancelled_task.cancel()
+            await cancelled_session.aclose()
+
+            assert task.done()
+            assert await task == page
+
+    assert route.call_count == 1
@@ -0,0 +1,64 @@
+"""Test request coalescing from pub_analyzer/internal/singleflight.py."""
+
+import asyncio
+
+import pytest
+
+from pub_analyzer.internal.singleflight import SingleFlight
+
+
+@pytest.mark.asyncio
+async def test_single_flight_shares_concurrent_calls() -> None:
+    """Test concurrent calls with the same key run the function once."""
+    flights: SingleFlight[str] = SingleFlight()
+    calls: list[str] = []
+
+    async def _fetch(key: str) -> str:
+        calls.append(key)
+        await asyncio.sleep(0.01)
+        return key.upper()
+
+    results = await asyncio.gather(
+        flights.do("a", lambda: _fetch("a")),
+        flights.do("a", lambda: _fetch("a")),
+        flights.do("b", lambda: _fetch("b")),
+    )
+
+    assert list(results) == ["A", "A", "B"]
+    assert calls == ["a", "b"]
+    assert len(flights) == 0
+
+    await flights.do("a", lambda: _fetch("a"))
+    assert calls == ["a", "b", "a"]
+
+
+@pytest.mark.asyncio
+async def test_single_flight_shares_errors() -> None:
+    """Test every caller gets the exception of the shared call."""
+    flights: SingleFlight[str] = SingleFlight()
+
+    async def _fail() -> str:
+        await asyncio.sleep(0.01)
+        raise ValueError("Failed")
+
+    results = await asyncio.gather(flights.do("a", _fail), flights.do("a", _fail), return_exceptions=True)
+    assert all(isinstance(result, ValueError) for result in results)
+
+
+@pytest.mark.asyncio
+async def test_single_flight_cancellation() -> None:
+    """Test the shared call keeps running while a caller is still waiting for it."""
+    flights: SingleFlight[str] = SingleFlight()
+
+    async def _fetch() -> str:
+        await asyncio.sleep(0.01)
+        return "done"
+
+    first_caller = asyncio.create_task(flights.do("a", _fetch))
+    second_caller = asyncio.create_task(flights.do("a", _fetch))
+    await asyncio.sleep(0)
+
+    first_caller.cancel()
+    assert await second_caller == "done"
+    with pytest.raises(asyncio.CancelledError):
+        await first_caller
@@ -0,0 +1,52 @@
+"""Test Summary Widgets."""
+
+import sys
+from collections.abc import Callable
+
+import pytest
+from textual.widget import Widget
+
+from pub_analyzer.internal import limiter
+from pub_analyzer.main import PubAnalyzerApp
+from pub_analyzer.widgets.author.core import _AuthorSummaryWidget
+from pub_analyzer.widgets.body import MainContent
+from pub_analyzer.widgets.institution.core import _InstitutionSummaryWidget
+from pub_analyzer.widgets.report.estimate import ReportEstimateLabel
+from tests.data.author import AUTHOR_OBJECT
+from tests.data.institution import INSTITUTION_OBJECT
+
+if sys.platform == "win32":
+    pytest.skip(
+        "Skipping this module on Windows. GH runners for Windows are not reliable for verifying these types of tests.",
+        allow_module_level=True,
+    )
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "make_summary_widget",
+    [
+        lambda: _AuthorSummaryWidget(author=AUTHOR_OBJECT),
+        lambda: _InstitutionSummaryWidget(institution=INSTITUTION_OBJECT),
+    ],
+    ids=["author", "institution"],
+)
+@pytest.mark.parametrize(("rate_limit", "estimate_displayed"), [("10", True), ("fast", False), ("0", False)])
+async def test_summary_report_estimate(
+    make_summary_widget: Callable[[], Widget], rate_limit: str, estimate_displayed: bool, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test the report estimate is hidden instead of crashing the summary when the rate limit is not valid."""
+    monkeypatch.setenv("PUB_ANALYZER_RATE_LIMIT", rate_limit)
+    monkeypatch.delenv("PUB_ANALYZER_RATE_LIMIT_FILE", raising=False)
+    monkeypatch.delenv("PUB_ANALYZER_ADAPTIVE_RATE", raising=False)
+    monkeypatch.setattr(limiter, "_shared_limiters", {})
+
+    summary_widget = make_summary_widget()
+    async with PubAnalyzerApp().run_test() as pilot:
+        await pilot.app.query_one(MainContent).mount(summary_widget)
+        await pilot.pause()
+
+        estimate_label = summary_widget.query_one("#report-estimate", ReportEstimateLabel)
+        assert estimate_label.display is estimate_displayed
+        if estimate_displayed:
+            assert "Estimate:" in str(estimate_label.renderable)